@@ -6,43 +6,72 @@ import PyQt5.QtWidgets as qtw
 import math
 import sys
 import numpy as np
-import scipy as sp
-from scipy import optimize
+from Linkage_Kinematics import FourBar, TrajectoryTable
+from Mouse_Coalescer import MouseMoveCoalescer
 #endregion
 
 #region class definitions
 class RigidLink(qtw.QGraphicsItem):
+    # below this many pixels across on screen the link is drawn as a plain line
+    detailPixels = 4
+
     def __init__(self, stX, stY, enX, enY, radius=10, parent=None, pen=None, brush=None, name='RigidLink'):
+        """
+        A rigid link drawn as a rounded bar between two pivot points.  The painter path, pens, bounding rectangle
+        and transform are computed once in updateGeometry() whenever an endpoint changes, so paint() only draws.
+        Assigning startX, startY, endX or endY updates the geometry; setEndpoints() moves both ends with one update.
+        When zoomed out so far that the bar is less than detailPixels wide, only its center line is drawn.
+        """
         super().__init__(parent)
 
         # Step 1: store parameters
         self.pen = pen
         self.brush = brush
         self.name = name
-        self.startX = stX
-        self.startY = stY
-        self.endX = enX
-        self.endY = enY
+        self._startX = stX
+        self._startY = stY
+        self._endX = enX
+        self._endY = enY
         self.radius = radius
 
-        # Step 2: compute angle
-        self.angle = self.linkAngle()
-
-        # Step 3: define bounding rectangle
-        self.rect = qtc.QRectF(-self.radius, -self.radius, self.length + self.radius, self.radius)
-
-        # Step 4: setup transform
-        self.transform = qtg.QTransform()
-        self.transform.reset()
+        # Step 2: build the pens, then the path, bounding rectangle and transform
+        self.transformation = qtg.QTransform()
+        self.updatePens()
+        self.updateGeometry()
 
         # ✅ Add these lines to allow tooltips on hover
         self.setAcceptHoverEvents(True)
         self.setAcceptedMouseButtons(qtc.Qt.NoButton)
 
+    def _setEndpoint(attr):
+        def fset(self, value):
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                self.updateGeometry()
+        return property(lambda self: getattr(self, attr), fset)
+
+    startX = _setEndpoint('_startX')
+    startY = _setEndpoint('_startY')
+    endX = _setEndpoint('_endX')
+    endY = _setEndpoint('_endY')
+    del _setEndpoint
+
+    def setEndpoints(self, stX, stY, enX, enY):
+        """
+        Moves both ends of the link, rebuilding the geometry once rather than once per coordinate.  Only the
+        link's old and new bounding regions are repainted, so a moving link doesn't need a scene.update().
+        :param stX, stY: the new start point
+        :param enX, enY: the new end point
+        :return:
+        """
+        if (self._startX, self._startY, self._endX, self._endY) == (stX, stY, enX, enY):
+            return
+        self._startX, self._startY, self._endX, self._endY = stX, stY, enX, enY
+        self.updateGeometry()
 
     def boundingRect(self):
-        boundingRect = self.transform.mapRect(self.rect)
-        return boundingRect
+        # the cached rectangle in item coordinates; the item transform places it in the scene
+        return self.rect
 
     def deltaY(self):
         self.DY=self.endY-self.startY
@@ -65,73 +94,94 @@ class RigidLink(qtw.QGraphicsItem):
             self.angle *= -1 if (self.DY > 0) else 1
         return self.angle
 
-    def paint(self, painter, option, widget=None):
+    def updatePens(self):
+        """
+        Builds the dashed center line pen and the zoomed out line pen from the link pen.  Call again after
+        changing self.pen.
         """
-        This function creates a path painter the paints a semicircle around the start point (ccw), a straight line
+        color = self.pen.color() if self.pen is not None else qtg.QColor(qtc.Qt.black)
+        self.centerLinePen = qtg.QPen()
+        self.centerLinePen.setStyle(qtc.Qt.DashDotLine)
+        r,g,b,a=color.getRgb()
+        self.centerLinePen.setColor(qtg.QColor(r,g,b,128))
+        self.centerLinePen.setWidth(1)
+        self.lowDetailPen = qtg.QPen(color, 0)  # cosmetic: one pixel at any zoom
+
+    def updateGeometry(self):
+        """
+        This function creates a path that paints a semicircle around the start point (ccw), a straight line
         offset from the main axis of the link, a semicircle around the end point (ccw), and a straight line offset from
-        the main axis.  It then assigns a pen and brush.  Finally, it draws a circle at the start and end points to
-        indicate the pivot points.
-        :param painter:
-        :param option:
-        :param widget:
+        the main axis.  It also caches the center line, the pivot circles, the bounding rectangle and the transform
+        that places the link in the scene.
         :return:
         """
-        #instantiate a QPainterPath object
-        path = qtg.QPainterPath()
-        # compute linkLength from startX, startY, endX, endY
+        # invalidates the old bounding region; setting the transform below repaints the new one
+        self.prepareGeometryChange()
+        # compute the length and angle of the link from deltaY & deltaX
         len = self.linkLength()
-        # compute the angle of the link from deltaY & deltaX
         angLink = self.linkAngle()*180/math.pi
 
         #define bounding rectangles for the radiused ends of the link
         rectSt = qtc.QRectF(-self.radius, -self.radius, 2*self.radius, 2*self.radius)
-        rectEn = qtc.QRectF(self.length-self.radius, -self.radius, 2*self.radius, 2*self.radius)
+        rectEn = qtc.QRectF(len-self.radius, -self.radius, 2*self.radius, 2*self.radius)
+
+        self.centerLine = qtc.QLineF(0, 0, len, 0)
+
+        self.path = qtg.QPainterPath()
+        self.path.arcMoveTo(rectSt,90)
+        self.path.arcTo(rectSt, 90,180)
+        self.path.lineTo(len,self.radius)
+        self.path.arcMoveTo(rectEn, 270)
+        self.path.arcTo(rectEn, 270, 180)
+        self.path.lineTo(0, -self.radius)
+
+        #circles at the end points
+        self.pivotStart=qtc.QRectF(-self.radius/6, -self.radius/6, self.radius/3, self.radius/3)
+        self.pivotEnd=qtc.QRectF(len-self.radius/6, -self.radius/6, self.radius/3, self.radius/3)
+
+        #the bounding rectangle, grown by half the pen width so the outline isn't clipped
+        hw = (self.pen.widthF() if self.pen is not None else 1.0)/2
+        self.rect=qtc.QRectF(-self.radius,-self.radius, len+2*self.radius,2*self.radius).adjusted(-hw, -hw, hw, hw)
+
+        #Now perform transformations on the object.  Note: transformations are by matrix multiplication [newPt]=[T][R][oldPt]
+        #in 2D [R] is the 2x2 rotation matrix.  Hence [R][oldPt] is (2x2)*(2x1)=(2x1)=[rotatedPt]
+        #[T] is the 2x2 translation matrix.  Hence [T][rotatedPt] = [newPt]
+        self.transformation.reset()
+        self.transformation.translate(self.startX, self.startY)
+        self.transformation.rotate(-angLink)
+        self.setTransform(self.transformation)
+
+    def paint(self, painter, option, widget=None):
+        """
+        Draws the cached center line, outline path and pivot circles, or just a line when zoomed out.
+        :param painter:
+        :param option:
+        :param widget:
+        :return:
+        """
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if 2*self.radius*lod < self.detailPixels:
+            painter.setPen(self.lowDetailPen)
+            painter.drawLine(self.centerLine)
+            return
 
         #draw a center line
-        centerLinePen= qtg.QPen()
-        centerLinePen.setStyle(qtc.Qt.DashDotLine)
-        r,g,b,a=self.pen.color().getRgb()
-        centerLinePen.setColor(qtg.QColor(r,g,b,128))
-        centerLinePen.setWidth(1)
-        p1=qtc.QPointF(0,0)
-        p2=qtc.QPointF(len,0)
-        painter.setPen(centerLinePen)
-        painter.drawLine(p1,p2)
-
-        path.arcMoveTo(rectSt,90)
-        path.arcTo(rectSt, 90,180)
-        path.lineTo(self.length,self.radius)
-        path.arcMoveTo(rectEn, 270)
-        path.arcTo(rectEn, 270, 180)
-        path.lineTo(0, -self.radius)
+        painter.setPen(self.centerLinePen)
+        painter.drawLine(self.centerLine)
+
         if self.pen is not None:
             painter.setPen(self.pen)  # Red color pen
         if self.brush is not None:
             painter.setBrush(self.brush)
-        painter.drawPath(path)
+        painter.drawPath(self.path)
         #draw some circles at the end points
-        pivotStart=qtc.QRectF(-self.radius/6, -self.radius/6, self.radius/3, self.radius/3)
-        pivotEnd=qtc.QRectF(self.length-self.radius/6, -self.radius/6, self.radius/3, self.radius/3)
-        painter.drawEllipse(pivotStart)
-        painter.drawEllipse(pivotEnd)
-        #redefine the bounding rectangle
-        self.rect=qtc.QRectF(-self.radius,-self.radius, self.length+2*self.radius,2*self.radius)
-        #Now perform transformations on the object.  Note: transformations are by matrix multiplication [newPt]=[T][R][oldPt]
-        #in 2D [R] is the 2x2 rotation matrix.  Hence [R][oldPt] is (2x2)*(2x1)=(2x1)=[rotatedPt]
-        #[T] is the 2x2 translation matrix.  Hence [T][rotatedPt] = [newPt]
-        self.transform.reset()
-        self.transform.translate(self.startX, self.startY)
-        self.transform.rotate(-angLink)
-        self.setTransform(self.transform)
-        self.transform.reset()
-        stTT=self.name+"\nstart: ({:0.3f}, {:0.3f})\nend:({:0.3f},{:0.3f})\nlength: {:0.3f}\nangle: {:0.3f}".format(self.startX, self.startY, self.endX, self.endY, self.length, self.angle*180/math.pi)
-       # self.setToolTip(stTT)
-        # brPen=qtg.QPen()
-        # brPen.setWidth(0)
-        # painter.setPen(brPen)
-        # painter.drawRect(self.boundingRect())
+        painter.drawEllipse(self.pivotStart)
+        painter.drawEllipse(self.pivotEnd)
 
 class RigidPivotPoint(qtw.QGraphicsItem):
+    # below this many pixels across on screen the support is drawn as a plain triangle
+    detailPixels = 12
+
     def __init__(self, ptX, ptY, pivotHeight, pivotWidth, parent=None, pen=None, brush=None, rotation=0, name='RigidPivotPoint'):
         super().__init__(parent)
         self.x = ptX
@@ -147,15 +197,58 @@ class RigidPivotPoint(qtw.QGraphicsItem):
         self.transformation = qtg.QTransform()
         stTT = self.name +"\nx={:0.3f}, y={:0.3f}".format(self.x, self.y)
         #self.setToolTip(stTT)
+        self.updateTransform()
 
     def boundingRect(self):
-        bounding_rect = self.transformation.mapRect(self.rect)
-        return bounding_rect
+        # the cached rectangle in item coordinates; the item transform places it in the scene
+        return self.rect
 
     def rotate(self, angle):
         self.rotationAngle=angle
+        self.updateTransform()
+
+    def setPoint(self, ptX, ptY):
+        """
+        Moves the pivot, updating its transform here rather than in paint.
+        :param ptX, ptY: the new pivot point
+        :return:
+        """
+        self.x = ptX
+        self.y = ptY
+        self.updateTransform()
+
+    def updateTransform(self):
+        """
+        Caches the bounding rectangle in item coordinates and the transform that places the pivot at (x, y),
+        rotated by rotationAngle.  Called from the setters, so paint never changes the item's geometry.
+        :return:
+        """
+        self.prepareGeometryChange()
+        self.rect=qtc.QRectF(-self.width,-self.radius, self.width*2, self.height*2+self.radius)
+        self.transformation.reset()
+        self.transformation.translate(self.x, self.y)
+        self.transformation.rotate(self.rotationAngle)
+        self.setTransform(self.transformation)
+
+    def isLowDetail(self, painter, option):
+        """
+        True when the support is too small on screen for its hatching and pivot to be seen.
+        """
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        return 2*self.width*lod < self.detailPixels
 
     def paint(self, painter, option, widget=None):
+        if self.isLowDetail(painter, option):
+            # zoomed out: a triangle on a base line
+            if self.pen is not None:
+                painter.setPen(self.pen)
+            if self.brush is not None:
+                painter.setBrush(self.brush)
+            painter.drawPolygon(qtg.QPolygonF([qtc.QPointF(0, 0), qtc.QPointF(self.width/2, self.height),
+                                               qtc.QPointF(-self.width/2, self.height)]))
+            painter.drawLine(qtc.QLineF(-self.width, self.height, self.width, self.height))
+            return
+
         path = qtg.QPainterPath()
         radius = min(self.height,self.width)/2
 
@@ -196,13 +289,6 @@ class RigidPivotPoint(qtw.QGraphicsItem):
         painter.setBrush(hatchbrush)
         support = qtc.QRectF(x5,y4,self.width*2, self.height)
         painter.drawRect(support)
-        self.rect=qtc.QRectF(-self.width,-self.radius, self.width*2, self.height*2+self.radius)
-        self.transformation.reset()
-        self.transformation.translate(self.x, self.y)
-        self.transformation.rotate(self.rotationAngle)
-        self.setTransform(self.transformation)
-
-        self.transformation.reset()
         # brPen=qtg.QPen()
         # brPen.setWidth(0)
         # painter.setPen(brPen)
@@ -229,14 +315,11 @@ class MainWindow(Ui_Form, qtw.QWidget):
 
         #draws a scene
         self.buildScene()
-        self.prevAlpha = self.link1.angle
-        self.prevBeta = self.link3.angle
-        self.angle1=math.pi
-        self.angle2=math.pi
 
         #signals/slots
         self.spnd_Zoom.valueChanged.connect(self.setZoom)
         self.pushButton.clicked.connect(self.pickAColor)
+        self.mouseMoves = MouseMoveCoalescer(self.handleMouseMove, parent=self)  # at most one move per frame
         self.scene.installEventFilter(self)
         self.mouseDown = False
         self.show()
@@ -249,6 +332,8 @@ class MainWindow(Ui_Form, qtw.QWidget):
 
         #set the scene for the graphics view object
         self.gv_Main.setScene(self.scene)
+        #repaint one rectangle around whatever changed, i.e. the moving links, instead of the whole view
+        self.gv_Main.setViewportUpdateMode(qtw.QGraphicsView.BoundingRectViewportUpdate)
         #make some pens and brushes for my drawing
         self.setupPensAndBrushes()
 
@@ -293,69 +378,8 @@ class MainWindow(Ui_Form, qtw.QWidget):
         if obj == self.scene:
             et=event.type()
             if event.type() == qtc.QEvent.GraphicsSceneMouseMove:
-                w=app.topLevelAt(event.screenPos())
-                screenPos=event.screenPos()
-                scenePos=event.scenePos()
-                strScreen="screen x = {}, screen y = {}".format(screenPos.x(), screenPos.y())
-                strScene=":  scene x = {}, scene y = {}".format(scenePos.x(), scenePos.y())
-                self.setWindowTitle(strScreen+strScene)
-                if self.mouseDown:
-                    l1=self.link1.linkLength()
-                    l2=self.link2.linkLength()
-                    l3=self.link3.linkLength()
-
-                    scenePos = event.scenePos()
-                    x=scenePos.x()
-                    y=scenePos.y()
-                    if (x==self.link1.startX):
-                        self.angle1 = math.pi/2 if y<= self.link1.startY else math.pi*3.0/2.0
-                    else:
-                        self.angle1 = math.atan(-(y-self.link1.startY)/(x-self.link1.startX))
-                        self.angle1 += math.pi  if x<self.link1.startX else 0
-                    if (self.link3.endX==self.link3.startX):
-                        self.angle2 = math.pi/2 if self.link3.endY<= self.link3.startY else math.pi*3.0/2.0
-                    else:
-                        self.angle2 = math.atan(-(self.link3.endY-self.link2.startY)/(self.link3.endX-self.link3.startX))
-                        self.angle2 += math.pi  if self.link3.endX<self.link3.startX else 0
-
-                    self.link1.endX=self.link1.startX+math.cos(self.angle1)*l1
-                    self.link1.endY=self.link1.startY-math.sin(self.angle1)*l1
-                    x1=self.link1.endX
-                    y1=self.link1.endY
-                    self.lTest = l2
-                    def fn1(angle2):
-                        x2=self.link3.startX+l3*math.cos(angle2)
-                        y2=self.link3.startY-l3*math.sin(angle2)
-                        self.lTest = math.sqrt(math.pow(x2-x1,2)+math.pow(y2-y1,2))
-                        return l2-self.lTest
-                    result = optimize.fsolve(fn1,[self.angle2])
-                    if abs(self.lTest-l2)>0.001:
-                        self.angle2 = self.prevBeta
-                        self.angle1 = self.prevAlpha
-                        self.link1.endX = self.link1.startX + math.cos(self.angle1) * l1
-                        self.link1.endY = self.link1.startY - math.sin(self.angle1) * l1
-                    else:
-                        self.angle2=result[0]
-                        self.prevAlpha=self.angle1
-                        self.prevBeta=self.angle2
-
-                    #self.link1.endX=scenePos.x()
-                    #self.link1.endY=scenePos.y()
-                    #self.link1.update()
-                    self.link3.endX = self.link3.startX+l3*math.cos(self.angle2)
-                    self.link3.endY = self.link3.startY-l3*math.sin(self.angle2)
-                    self.link2.startX=self.link1.endX
-                    self.link2.startY=self.link1.endY
-                    self.link2.endX=self.link3.endX
-                    self.link2.endY=self.link3.endY
-                    len2=self.link2.linkLength()
-                    self.scene.update()
-                    # centerX = self.tmpCircle.rect().center().x()
-                    # centerY = self.tmpCircle.rect().center().y()
-                    # radius = math.pow(centerX-scenePos.x(),2)+math.pow(centerY-scenePos.y(),2)
-                    # radius = math.sqrt(radius)
-                    # self.tmpCircle.setRect(centerX-radius, centerY-radius, 2*radius, 2*radius)
-                    # self.tmpLn.setLine(centerX, centerY, scenePos.x(),scenePos.y())
+                # handled in handleMouseMove, at most once per display frame
+                self.mouseMoves.push(event)
 
             if event.type() == qtc.QEvent.GraphicsSceneWheel:
                 if event.delta()>0:
@@ -363,6 +387,7 @@ class MainWindow(Ui_Form, qtw.QWidget):
                 else:
                     self.spnd_Zoom.stepDown()
             if event.type() ==qtc.QEvent.GraphicsSceneMousePress:
+                self.mouseMoves.flush()  # a move held back from before the press is handled without the button
                 if event.button() ==qtc.Qt.LeftButton:
                     # pos = event.screenPos()
                     # scenePos = event.scenePos()
@@ -373,6 +398,7 @@ class MainWindow(Ui_Form, qtw.QWidget):
                     # self.tmpLn.setPen(self.penGridLines)
                     self.mouseDown = True
             if event.type() == qtc.QEvent.GraphicsSceneMouseRelease:
+                self.mouseMoves.flush()  # finish the drag at the last position the mouse reached
                 self.mouseDown = False
         # pass the event along to the parent widget if there is one.
         return super(MainWindow, self).eventFilter(obj, event)
@@ -397,6 +423,16 @@ class MainWindow(Ui_Form, qtw.QWidget):
         self.link2=self.drawLinkage(-100,-60, 100, -150, 5)
         self.link3=self.drawLinkage(60,-30,100,-150,5)
 
+        #the linkage's ground pivots and link lengths for the kinematics, in y up coordinates
+        self.fourBar, self.pose = FourBar.fromPoints((self.link1.startX, -self.link1.startY),
+                                                     (self.link1.endX, -self.link1.endY),
+                                                     (self.link3.endX, -self.link3.endY),
+                                                     (self.link3.startX, -self.link3.startY))
+        self.angle1 = self.pose.crankAngle
+        self.angle2 = self.pose.rockerAngle
+        #positions over a full turn of the crank, precomputed once for these link lengths
+        self.trajectory = TrajectoryTable(self.fourBar)
+
         #self.link2=self.drawLinkage(5,-5,-55,-60,10, self.penLink)
 
         #draw some lines
@@ -410,6 +446,44 @@ class MainWindow(Ui_Form, qtw.QWidget):
         #self.drawATriangle(50,-50,10, pen=self.penMed, brush=self.brushHatch)
         #self.drawAnArrow(0,0,10,-20,pen=self.penMed, brush=self.brushFill)
 
+    def handleMouseMove(self, event):
+        """
+        Shows the mouse position in the title and, while the button is down, drags the crank toward it.
+        :param event: the latest mouse move, a MouseMoveSnapshot from self.mouseMoves
+        :return:
+        """
+        screenPos=event.screenPos()
+        scenePos=event.scenePos()
+        strScreen="screen x = {}, screen y = {}".format(screenPos.x(), screenPos.y())
+        strScene=":  scene x = {}, scene y = {}".format(scenePos.x(), scenePos.y())
+        self.setWindowTitle(strScreen+strScene)
+        if self.mouseDown:
+            # point the crank at the mouse (angles are counter-clockwise, scene y points down) and look
+            # the rest of the linkage up in the trajectory table, staying on the branch it is already on
+            angle = math.atan2(-(scenePos.y()-self.link1.startY), scenePos.x()-self.link1.startX)
+            pose = self.trajectory.track(angle, self.pose)
+            if pose is not None:  # otherwise the crank can't reach that angle; leave the linkage as it is
+                self.setPose(pose)  # the moved links repaint their own regions, the rest of the scene is left alone
+            # centerX = self.tmpCircle.rect().center().x()
+            # centerY = self.tmpCircle.rect().center().y()
+            # radius = math.pow(centerX-scenePos.x(),2)+math.pow(centerY-scenePos.y(),2)
+            # radius = math.sqrt(radius)
+            # self.tmpCircle.setRect(centerX-radius, centerY-radius, 2*radius, 2*radius)
+            # self.tmpLn.setLine(centerX, centerY, scenePos.x(),scenePos.y())
+
+    def setPose(self, pose):
+        """
+        Moves the crank, coupler and rocker to a position of self.fourBar.
+        :param pose: a FourBarPose (y up coordinates)
+        :return:
+        """
+        self.pose = pose
+        self.angle1 = pose.crankAngle
+        self.angle2 = pose.rockerAngle
+        self.link1.setEndpoints(self.link1.startX, self.link1.startY, pose.bx, -pose.by)
+        self.link3.setEndpoints(self.link3.startX, self.link3.startY, pose.cx, -pose.cy)
+        self.link2.setEndpoints(pose.bx, -pose.by, pose.cx, -pose.cy)
+
     def drawAGrid(self, DeltaX=10, DeltaY=10, Height=200, Width=200, CenterX=0, CenterY=0, Pen=None, Brush=None, SubGrid=None):
         """
         This makes a grid for reference.  No snapping to grid enabled.
@@ -0,0 +1,403 @@
+"""
+Closed-form position analysis of a planar four-bar linkage, and tables of
+its positions over a full crank turn, used by the GraphicsView_App demo
+instead of an iterative solve on every mouse move.
+Coordinates are the usual math ones (y up, angles counter-clockwise from +x);
+callers drawing in Qt scene coordinates flip the sign of y.
+Like Truss_Model it does not import Qt.
+"""
+import functools
+import math
+from collections import namedtuple
+import numpy as np
+
+# One assembled position of a FourBar:
+#  - crankAngle, rockerAngle : angles of the crank and rocker (radians)
+#  - bx, by : the crank pin (crank / coupler joint)
+#  - cx, cy : the rocker pin (coupler / rocker joint)
+#  - branch : +1 or -1, the side of the line from B to the rocker pivot that C is on
+FourBarPose = namedtuple('FourBarPose', 'crankAngle rockerAngle bx by cx cy branch')
+
+
+###############################################################################
+# 1) Circle Intersection
+###############################################################################
+def circleIntersection(x0, y0, r0, x1, y1, r1, branch=1):
+    """
+    Intersects two circles.
+
+    Parameters:
+    -----------
+    x0, y0, r0 : float
+        Center and radius of the first circle.
+    x1, y1, r1 : float
+        Center and radius of the second circle.
+    branch : int, optional
+        +1 for the intersection to the left of the line from the first center
+        to the second, -1 for the one to the right.
+
+    Returns:
+    --------
+    (float, float) or None
+        The intersection point, or None if the circles don't meet. Circles
+        that touch (within rounding) give the touching point for both branches.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    d = math.hypot(dx, dy)
+    if d == 0.0:
+        return None
+    a = (r0 * r0 - r1 * r1 + d * d) / (2 * d)
+    hSq = r0 * r0 - a * a
+    if hSq < 0.0:
+        if hSq < -1e-9 * r0 * r0:
+            return None
+        hSq = 0.0
+    h = branch * math.sqrt(hSq) / d
+    mx, my = x0 + a * dx / d, y0 + a * dy / d
+    return mx - h * dy, my + h * dx
+
+
+def circleIntersections(x0, y0, r0, x1, y1, r1, branch=1):
+    """
+    Vectorized circleIntersection: the arguments are arrays (or scalars)
+    broadcast against each other.
+
+    Returns:
+    --------
+    (ndarray, ndarray, ndarray)
+        x and y of the intersections, and a boolean array that is False
+        where the circles don't meet (x and y are NaN there).
+    """
+    dx, dy = np.subtract(x1, x0), np.subtract(y1, y0)
+    d = np.hypot(dx, dy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = (np.square(r0) - np.square(r1) + d * d) / (2 * d)
+        hSq = np.square(r0) - a * a
+        # Touching circles can come out slightly negative from rounding
+        hSq = np.where((hSq < 0) & (hSq >= -1e-9 * np.square(r0)), 0.0, hSq)
+        valid = (d > 0) & (hSq >= 0)
+        h = np.multiply(branch, np.sqrt(np.where(valid, hSq, np.nan))) / d
+        mx, my = x0 + a * dx / d, y0 + a * dy / d
+    return mx - h * dy, my + h * dx, valid
+
+
+###############################################################################
+# 2) Four-Bar Linkage
+###############################################################################
+class FourBar():
+    """
+    A four-bar linkage: a crank turning about ground pivot A, a rocker
+    turning about ground pivot D, and a coupler joining the crank pin B to
+    the rocker pin C. For a crank angle, C is where the circle of radius
+    coupler about B meets the circle of radius rocker about D; the two
+    intersections are the linkage's two assembly branches.
+    """
+
+    def __init__(self, ax, ay, dx, dy, crank, coupler, rocker):
+        """
+        Parameters:
+        -----------
+        ax, ay : float
+            Crank ground pivot A.
+        dx, dy : float
+            Rocker ground pivot D.
+        crank, coupler, rocker : float
+            Link lengths |AB|, |BC| and |DC|.
+        """
+        self.ax, self.ay = ax, ay
+        self.dx, self.dy = dx, dy
+        self.crank = crank
+        self.coupler = coupler
+        self.rocker = rocker
+
+    @classmethod
+    def fromPoints(cls, a, b, c, d):
+        """
+        Builds the linkage from one assembled position, taking the link
+        lengths from it.
+
+        Parameters:
+        -----------
+        a, b, c, d : (float, float)
+            Ground pivot A, crank pin B, rocker pin C and ground pivot D.
+
+        Returns:
+        --------
+        (FourBar, FourBarPose)
+            The linkage and the given position as a pose.
+        """
+        linkage = cls(a[0], a[1], d[0], d[1], math.dist(a, b), math.dist(b, c), math.dist(d, c))
+        # Which side of the line B -> D the point C is on
+        cross = (d[0] - b[0]) * (c[1] - b[1]) - (d[1] - b[1]) * (c[0] - b[0])
+        pose = FourBarPose(math.atan2(b[1] - a[1], b[0] - a[0]), math.atan2(c[1] - d[1], c[0] - d[0]),
+                           b[0], b[1], c[0], c[1], 1 if cross >= 0 else -1)
+        return linkage, pose
+
+    def lengths(self):
+        """
+        Returns (ground, crank, coupler, rocker) link lengths.
+        """
+        return (math.hypot(self.dx - self.ax, self.dy - self.ay), self.crank, self.coupler, self.rocker)
+
+    def groundAngle(self):
+        """
+        Returns the angle of the ground link from A to D in radians.
+        """
+        return math.atan2(self.dy - self.ay, self.dx - self.ax)
+
+    def branchPoints(self):
+        """
+        Finds the crank angles where the coupler and rocker are in line. There
+        the two branches meet, and past them the linkage can't be assembled,
+        so these are the ends of the crank's range of motion.
+
+        Returns:
+        --------
+        list of float
+            Crank angles in [0, 2*pi), sorted; empty if the crank turns fully.
+        """
+        g = self.lengths()[0]
+        if g == 0.0 or self.crank == 0.0:
+            return []
+        phi = self.groundAngle()
+        angles = []
+        for reach in (self.coupler + self.rocker, abs(self.coupler - self.rocker)):
+            # |BD| = reach, by the law of cosines in triangle A B D
+            c = (self.crank ** 2 + g * g - reach * reach) / (2 * self.crank * g)
+            if -1.0 < c < 1.0:
+                angles += [(phi + math.acos(c)) % (2 * math.pi), (phi - math.acos(c)) % (2 * math.pi)]
+        return sorted(angles)
+
+    def deadPoints(self):
+        """
+        Finds the positions where the crank and coupler are in line. The
+        rocker reverses there, and a linkage driven by its rocker locks up.
+
+        Returns:
+        --------
+        list of FourBarPose
+            Sorted by crank angle.
+        """
+        poses = []
+        # Folded over with the coupler longer than the crank, A is between B and C
+        for reach, away in ((self.crank + self.coupler, False),
+                            (abs(self.coupler - self.crank), self.coupler > self.crank)):
+            if reach == 0.0:
+                continue
+            for side in (1, -1):
+                # C is where the rocker's circle meets the circle of radius |AC| about A
+                c = circleIntersection(self.ax, self.ay, reach, self.dx, self.dy, self.rocker, side)
+                if c is None:
+                    continue
+                angle = math.atan2(c[1] - self.ay, c[0] - self.ax) + (math.pi if away else 0.0)
+                bx = self.ax + self.crank * math.cos(angle)
+                by = self.ay + self.crank * math.sin(angle)
+                cross = (self.dx - bx) * (c[1] - by) - (self.dy - by) * (c[0] - bx)
+                poses.append(FourBarPose(angle % (2 * math.pi), math.atan2(c[1] - self.dy, c[0] - self.dx),
+                                         bx, by, c[0], c[1], 1 if cross >= 0 else -1))
+        return sorted(poses)
+
+    def solve(self, crankAngle, branch=1):
+        """
+        Solves the position of the linkage for a crank angle on one branch.
+
+        Parameters:
+        -----------
+        crankAngle : float
+            Crank angle in radians.
+        branch : int, optional
+            +1 or -1, see FourBarPose.
+
+        Returns:
+        --------
+        FourBarPose or None
+            None if the linkage can't be assembled at that crank angle.
+        """
+        bx = self.ax + self.crank * math.cos(crankAngle)
+        by = self.ay + self.crank * math.sin(crankAngle)
+        c = circleIntersection(bx, by, self.coupler, self.dx, self.dy, self.rocker, branch)
+        if c is None:
+            return None
+        return FourBarPose(crankAngle, math.atan2(c[1] - self.dy, c[0] - self.dx), bx, by, c[0], c[1], branch)
+
+    def track(self, crankAngle, previous):
+        """
+        Solves the position for a crank angle, keeping to the branch nearest
+        a previous position. The branch can only change where the two
+        branches meet (see branchPoints), so picking the rocker angle nearest
+        the previous one follows the linkage through those points instead of
+        snapping to the other assembly.
+
+        Parameters:
+        -----------
+        crankAngle : float
+            Crank angle in radians.
+        previous : FourBarPose
+            The position the linkage is moving from.
+
+        Returns:
+        --------
+        FourBarPose or None
+            None if the linkage can't be assembled at that crank angle.
+        """
+        return _trackBranch(self.solve, crankAngle, previous)
+
+    def solveArray(self, crankAngles, branch=1):
+        """
+        Vectorized solve over an array of crank angles.
+
+        Parameters:
+        -----------
+        crankAngles : array-like
+            Crank angles in radians.
+        branch : int or array-like, optional
+            +1 or -1, for all angles or per angle.
+
+        Returns:
+        --------
+        (ndarray, ndarray, ndarray, ndarray, ndarray, ndarray)
+            bx, by, cx, cy, rockerAngle and a boolean array that is False
+            where the linkage can't be assembled (NaN in the others).
+        """
+        theta = np.asarray(crankAngles, dtype=float)
+        bx = self.ax + self.crank * np.cos(theta)
+        by = self.ay + self.crank * np.sin(theta)
+        cx, cy, valid = circleIntersections(bx, by, self.coupler, self.dx, self.dy, self.rocker, branch)
+        rockerAngle = np.arctan2(cy - self.dy, cx - self.dx)
+        return bx, by, cx, cy, rockerAngle, valid
+
+
+def angleDistance(a, b):
+    """
+    Returns the absolute difference of two angles in radians, in [0, pi].
+    """
+    return abs((a - b + math.pi) % (2 * math.pi) - math.pi)
+
+
+def _trackBranch(solve, crankAngle, previous):
+    """
+    Does the work of FourBar.track and TrajectoryTable.track with either's solve.
+    """
+    same = solve(crankAngle, previous.branch)
+    if same is None:
+        return None
+    other = solve(crankAngle, -previous.branch)
+    if angleDistance(other.rockerAngle, previous.rockerAngle) < \
+            angleDistance(same.rockerAngle, previous.rockerAngle):
+        return other
+    return same
+
+
+###############################################################################
+# 3) Trajectory Tables
+###############################################################################
+@functools.lru_cache(maxsize=32)
+def _sweep(ground, crank, coupler, rocker, samples):
+    """
+    Sweeps the crank of a linkage with its ground link along +x through a
+    full turn in samples steps, on both branches.
+
+    Returns:
+    --------
+    (ndarray, ndarray)
+        (2, samples + 1) rocker angles and assembled flags, row 0 for branch
+        +1 and row 1 for branch -1. The last column repeats the first so a
+        lookup never has to wrap around.
+    """
+    linkage = FourBar(0.0, 0.0, ground, 0.0, crank, coupler, rocker)
+    theta = np.arange(samples + 1) * (2 * math.pi / samples)
+    rockerAngle = np.empty((2, samples + 1))
+    valid = np.empty((2, samples + 1), dtype=bool)
+    for row, branch in enumerate((1, -1)):
+        rockerAngle[row], valid[row] = linkage.solveArray(theta, branch)[4:]
+    rockerAngle.setflags(write=False)
+    valid.setflags(write=False)
+    return rockerAngle, valid
+
+
+class TrajectoryTable():
+    """
+    The rocker angle of a FourBar precomputed over a full turn of the crank
+    on both branches, so dragging and animation interpolate between table
+    entries instead of solving. The sweep is done relative to the ground
+    link, so it only depends on the link lengths; tables of linkages with
+    the same lengths share one sweep (cached in _sweep).
+
+    A lookup takes the crank angle to a table index directly, so it costs
+    the same for any table size. Where a neighbouring entry can't be
+    assembled, i.e. within one step of a branch point, the position is
+    solved exactly instead. The branch points and dead points are found in
+    closed form (FourBar.branchPoints and deadPoints) when the table is built.
+    """
+
+    def __init__(self, fourBar, samples=3600):
+        """
+        Parameters:
+        -----------
+        fourBar : FourBar
+            The linkage.
+        samples : int, optional
+            Table entries per crank revolution.
+        """
+        self.fourBar = fourBar
+        self.samples = samples
+        self.step = 2 * math.pi / samples
+        self.phi = fourBar.groundAngle()
+        # Rounded so lengths measured from the same drawing hit the same cache entry
+        lengths = tuple(round(v, 9) for v in fourBar.lengths())
+        self.rockerAngle, self.valid = _sweep(*lengths, samples)
+        self.branchPoints = fourBar.branchPoints()
+        self.deadPoints = fourBar.deadPoints()
+
+    def solve(self, crankAngle, branch=1):
+        """
+        Interpolates the position of the linkage for a crank angle on one
+        branch. Returns the same as FourBar.solve.
+        """
+        u = ((crankAngle - self.phi) % (2 * math.pi)) / self.step
+        i = min(int(u), self.samples - 1)
+        row = 0 if branch > 0 else 1
+        valid = self.valid[row]
+        if not (valid[i] and valid[i + 1]):
+            return self.fourBar.solve(crankAngle, branch)
+        r0 = self.rockerAngle[row, i]
+        dr = (self.rockerAngle[row, i + 1] - r0 + math.pi) % (2 * math.pi) - math.pi
+        rockerAngle = r0 + (u - i) * dr + self.phi
+        fb = self.fourBar
+        return FourBarPose(crankAngle, rockerAngle,
+                           fb.ax + fb.crank * math.cos(crankAngle), fb.ay + fb.crank * math.sin(crankAngle),
+                           fb.dx + fb.rocker * math.cos(rockerAngle), fb.dy + fb.rocker * math.sin(rockerAngle),
+                           branch)
+
+    def track(self, crankAngle, previous):
+        """
+        Interpolates the position for a crank angle, keeping to the branch
+        nearest a previous position. Returns the same as FourBar.track.
+        """
+        return _trackBranch(self.solve, crankAngle, previous)
+
+    def solveArray(self, crankAngles, branch=1):
+        """
+        Vectorized solve, e.g. for the frames of an animation. Returns the
+        same as FourBar.solveArray.
+        """
+        fb = self.fourBar
+        theta = np.asarray(crankAngles, dtype=float)
+        u = np.mod(theta - self.phi, 2 * math.pi) / self.step
+        i = np.minimum(u.astype(np.int64), self.samples - 1)
+        row = np.where(np.asarray(branch) > 0, 0, 1)
+        r0, r1 = self.rockerAngle[row, i], self.rockerAngle[row, i + 1]
+        dr = np.mod(r1 - r0 + math.pi, 2 * math.pi) - math.pi
+        rockerAngle = np.array(r0 + (u - i) * dr + self.phi)
+        # Within a step of a branch point, solve exactly
+        exact = ~(self.valid[row, i] & self.valid[row, i + 1])
+        valid = np.array(~exact)
+        if exact.any():
+            ex = fb.solveArray(theta[exact], np.broadcast_to(branch, theta.shape)[exact])
+            rockerAngle[exact] = ex[4]
+            valid[exact] = ex[5]
+        bx = fb.ax + fb.crank * np.cos(theta)
+        by = fb.ay + fb.crank * np.sin(theta)
+        cx = fb.dx + fb.rocker * np.cos(rockerAngle)
+        cy = fb.dy + fb.rocker * np.sin(rockerAngle)
+        return bx, by, cx, cy, rockerAngle, valid
@@ -0,0 +1,120 @@
+from PyQt5 import QtCore as qtc
+from PyQt5 import QtGui as qtg
+
+
+class MouseMoveSnapshot():
+    """
+    A copy of the parts of a QGraphicsSceneMouseEvent that the mouse move
+    handlers read. Qt deletes the event once it has been delivered, so a
+    move that is handled later keeps this instead. It has the same accessor
+    methods, so handlers take either.
+    """
+
+    def __init__(self, event):
+        self._type = event.type()
+        self._scenePos = qtc.QPointF(event.scenePos())
+        self._screenPos = qtc.QPoint(event.screenPos())
+        self._buttons = event.buttons()
+        self._modifiers = event.modifiers()
+
+    def type(self):
+        return self._type
+
+    def scenePos(self):
+        return self._scenePos
+
+    def screenPos(self):
+        return self._screenPos
+
+    def buttons(self):
+        return self._buttons
+
+    def modifiers(self):
+        return self._modifiers
+
+
+class MouseMoveCoalescer(qtc.QObject):
+    """
+    Rate limits mouse move handling to the display's frame rate. The first
+    move after a quiet spell is handled at once; moves arriving within the
+    next frame are held, each replacing the one before, and only the latest
+    is handled when the frame's QTimer fires. A mouse that reports moves
+    faster than the screen refreshes then costs one handler call per frame.
+
+    Counts of the moves received, handled and dropped (replaced before they
+    were handled) are kept for reporting.
+    """
+
+    def __init__(self, handler, interval=None, parent=None):
+        """
+        Parameters:
+        -----------
+        handler : callable
+            Called with a MouseMoveSnapshot for each move that is handled.
+        interval : int, optional
+            Milliseconds between handled moves. Defaults to one frame of the
+            primary screen (16 ms if its refresh rate is unknown).
+        parent : QObject, optional
+        """
+        super().__init__(parent)
+        self.handler = handler
+        if interval is None:
+            screen = qtg.QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen is not None else 0.0
+            interval = max(int(1000.0 / rate), 1) if rate > 0 else 16
+        self.timer = qtc.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(qtc.Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.frame)
+        self.pending = None
+        self.received = 0
+        self.handled = 0
+        self.dropped = 0
+
+    def push(self, event):
+        """
+        Takes a mouse move event. It is handled now if no move was handled in
+        the current frame, otherwise held until the frame ends.
+
+        Parameters:
+        -----------
+        event : QGraphicsSceneMouseEvent
+        """
+        self.received += 1
+        snapshot = MouseMoveSnapshot(event)
+        if self.timer.isActive():
+            if self.pending is not None:
+                self.dropped += 1
+            self.pending = snapshot
+        else:
+            self.handle(snapshot)
+            self.timer.start()
+
+    def frame(self):
+        """
+        Handles the move held during the frame that just ended, if any.
+        """
+        if self.pending is not None:
+            snapshot, self.pending = self.pending, None
+            self.handle(snapshot)
+            self.timer.start()
+
+    def flush(self):
+        """
+        Handles a held move right away, e.g. before a button press or
+        release so it is handled with the button state it happened under.
+        """
+        if self.pending is not None:
+            self.timer.stop()
+            self.frame()
+
+    def handle(self, snapshot):
+        self.handled += 1
+        self.handler(snapshot)
+
+    def summary(self):
+        """
+        Returns a one line report of the counts.
+        """
+        return f"{self.received} mouse moves, {self.handled} handled, {self.dropped} dropped"
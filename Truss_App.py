@@ -7,6 +7,7 @@ from Truss_GUI import Ui_TrussStructuralDesign
 
 # Our controller
 from Truss_Classes import TrussController
+from Mouse_Coalescer import MouseMoveCoalescer
 
 class MainWindow(Ui_TrussStructuralDesign, qtw.QWidget):
     """
@@ -38,11 +39,14 @@ class MainWindow(Ui_TrussStructuralDesign, qtw.QWidget):
                 self.le_Node1Name,     # QLineEdit for node1 name
                 self.le_Node2Name,     # QLineEdit for node2 name
                 self.le_LinkLength,    # QLineEdit for link length
-                self.gv_Main           # QGraphicsView for drawing
+                self.gv_Main,          # QGraphicsView for drawing
+                self.tv_Links          # QTableView for the link table
             )
         )
 
-        # Install the event filter so we can intercept scene events
+        # Install the event filter so we can intercept scene events; mouse moves are
+        # handled at most once per display frame
+        self.mouseMoves = MouseMoveCoalescer(self.handleMouseMove, parent=self)
         self.controller.installSceneEventFilter(self)
 
         # Connect GUI events to their corresponding functions
@@ -78,6 +82,10 @@ class MainWindow(Ui_TrussStructuralDesign, qtw.QWidget):
         """
         # Check if this event is coming from the scene, then let the controller process it
         if self.controller.isSceneObject(obj):
+            if event.type() == qtc.QEvent.GraphicsSceneMouseMove:
+                # Coalesced; passed on so the scene still sees every move (hover, tooltips)
+                self.mouseMoves.push(event)
+                return super().eventFilter(obj, event)
             consumed, info = self.controller.handleSceneEvent(event, self.gv_Main)
             if info is not None:
                 # Display mouse position or any info returned by the controller
@@ -87,19 +95,48 @@ class MainWindow(Ui_TrussStructuralDesign, qtw.QWidget):
                 return True
         return super().eventFilter(obj, event)
 
+    def handleMouseMove(self, event):
+        """
+        Lets the controller process a coalesced mouse move and shows what it
+        found. The label's tooltip reports how many moves were coalesced away.
+
+        Parameters:
+        -----------
+        event : MouseMoveSnapshot
+            The latest mouse move.
+        """
+        consumed, info = self.controller.handleSceneEvent(event, self.gv_Main)
+        if info is not None:
+            self.lbl_MousePos.setText(info)
+            self.lbl_MousePos.setToolTip(self.mouseMoves.summary())
+
     def OpenFile(self):
         """
-        Opens a file dialog, reads the selected file line by line, and hands the data off
-        to the TrussController for parsing and updating the truss model.
+        Opens a file dialog and hands the file to the TrussController, which
+        parses and solves it on a worker thread (or loads the cached result for
+        an unchanged file, or memory-maps a binary file). A progress dialog
+        shows how far it got and lets the user cancel; the window stays
+        responsive meanwhile.
         """
         filename = qtw.QFileDialog.getOpenFileName()[0]
         if not filename:
             return  # User canceled file selection
         self.te_Path.setText(filename)
-        with open(filename, 'r') as f:
-            data = f.readlines()
-        # Let the controller parse the file data
-        self.controller.ImportFromFile(data)
+
+        worker = self.controller.startImport(filename)
+        dialog = qtw.QProgressDialog(f"Loading {filename}", "Cancel", 0, 100, self)
+        dialog.setWindowModality(qtc.Qt.WindowModal)
+        dialog.setMinimumDuration(500)  # only shown for slow imports
+        dialog.setAutoClose(False)
+        dialog.setAttribute(qtc.Qt.WA_DeleteOnClose)  # each open makes a new one
+        dialog.canceled.connect(worker.cancel)
+        worker.signals.progress.connect(lambda percent, stage: (dialog.setLabelText(stage),
+                                                                dialog.setValue(percent)))
+        worker.signals.finished.connect(dialog.close)
+        worker.signals.cancelled.connect(dialog.close)
+        worker.signals.failed.connect(dialog.close)
+        worker.signals.failed.connect(lambda message: qtw.QMessageBox.warning(
+            self, "Open failed", f"Could not load {filename}:\n{message}"))
 
 
 def Main():
@@ -0,0 +1,263 @@
+"""
+Benchmark suite for the truss app. Generates trusses with Truss_Generator,
+times each stage of loading and solving them, and draws them headlessly on
+Qt's offscreen platform. Results are written to a JSON file so runs can be
+compared to find regressions:
+
+    python Truss_Benchmark.py --output before.json
+    python Truss_Benchmark.py --output after.json --baseline before.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from Truss_Generator import TRUSS_KINDS, generateTruss, writeTrussFile
+from Truss_Model import TrussModel
+import Truss_Solver  # loaded up front so the first factor time doesn't include importing scipy
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+STAGES = ('ImportFromFile', 'parse', 'calcLinkVals', 'factor', 'calcSupportReactions',
+          'solve', 'buildScene')
+
+
+###############################################################################
+# 1) Timing
+###############################################################################
+def timeCall(func, *args):
+    """
+    Calls func(*args) and returns (seconds, result).
+    """
+    t0 = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t0, result
+
+
+def runOnce(filename, qt):
+    """
+    Times every stage once for one input file.
+
+    Parameters:
+    -----------
+    filename : str
+        A text truss input file.
+    qt : bool
+        Also time the GUI stages (TrussController.ImportFromFile and
+        TrussView.buildScene); needs PyQt5.
+
+    Returns:
+    --------
+    dict
+        Stage name -> seconds.
+    """
+    times = {}
+    with open(os.devnull, 'w') as quiet, contextlib.redirect_stdout(quiet):
+        _runStages(filename, qt, times)
+    return times
+
+
+def _runStages(filename, qt, times):
+    """
+    Does the work of runOnce, filling in times as each stage finishes.
+    """
+    if qt:
+        from Truss_Classes import TrussController
+        controller = TrussController()
+        with open(filename, 'r') as f:
+            times['ImportFromFile'], _ = timeCall(controller.ImportFromFile, f)
+        controller = None
+
+    # The same pipeline one stage at a time, on a fresh model
+    with open(filename, 'r') as f:
+        times['parse'], truss = timeCall(TrussModel.fromFile, f)
+    times['calcLinkVals'], _ = timeCall(truss.calcLinkVals)
+    # The reactions come from the factored stiffness matrix, so factor first
+    times['factor'], _ = timeCall(truss.getSolver)
+    times['calcSupportReactions'], _ = timeCall(truss.calcSupportReactions)
+    times['solve'], _ = timeCall(truss.calcMemberForcesSafe)
+    if truss.solveError:
+        raise RuntimeError(f"{filename}: {truss.solveError}")
+
+    if qt:
+        from Truss_Classes import TrussView
+        view = TrussView()
+        times['buildScene'], _ = timeCall(view.buildScene, truss)
+        view.scene.clear()
+
+
+def benchmark(kinds, sizes, repeat=1, qt=True, seed=0, workDir=None, log=print):
+    """
+    Runs the benchmark over every kind and size.
+
+    Parameters:
+    -----------
+    kinds : list of str
+        Truss kinds from Truss_Generator.TRUSS_KINDS.
+    sizes : list of int
+        Target numbers of links.
+    repeat : int, optional
+        Runs per case; the fastest time of each stage is reported.
+    qt : bool, optional
+        Time the GUI stages as well.
+    seed : int, optional
+        Seed for the random lattice.
+    workDir : str, optional
+        Where to write the generated input files; a temporary directory by default.
+    log : callable, optional
+        Called with a line of progress text.
+
+    Returns:
+    --------
+    list of dict
+        One entry per case with its size and per-stage times.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = workDir or tmp
+        for kind in kinds:
+            for size in sizes:
+                genTime, (nodes, links) = timeCall(generateTruss, kind, size, seed)
+                filename = os.path.join(folder, f"{kind}_{size}.txt")
+                writeTrussFile(filename, nodes, links, title=f"{kind} truss, {len(links)} links")
+                runs = [runOnce(filename, qt) for _ in range(repeat)]
+                best = {stage: min(r[stage] for r in runs) for stage in runs[0]}
+                results.append({
+                    'kind': kind,
+                    'requested': size,
+                    'nodes': len(nodes),
+                    'links': len(links),
+                    'fileBytes': os.path.getsize(filename),
+                    'generate': genTime,
+                    'seconds': best,
+                    'runs': runs,
+                })
+                log(f"{kind:>8} {len(links):>8} links  " +
+                    "  ".join(f"{stage} {best[stage]:.4f}" for stage in STAGES if stage in best))
+                nodes = links = None
+                if workDir is None:
+                    os.remove(filename)
+    return results
+
+
+###############################################################################
+# 2) Results
+###############################################################################
+def environment():
+    """
+    Describes the machine and library versions the benchmark ran with.
+    """
+    import scipy
+    env = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+    try:
+        from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+        env['qt'] = QT_VERSION_STR
+        env['pyqt'] = PYQT_VERSION_STR
+    except ImportError:
+        pass
+    try:
+        env['commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                       text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return env
+
+
+def compareResults(results, baseline, threshold=1.2, minSeconds=1e-3, log=print):
+    """
+    Prints the stages that got slower than in a baseline run by more than
+    the threshold ratio. Stages that got slower by less than minSeconds are
+    ignored, as timings that short are mostly noise.
+
+    Parameters:
+    -----------
+    results : list of dict
+        As returned by benchmark.
+    baseline : dict
+        The contents of an earlier results file.
+    threshold : float, optional
+        Slowdown ratio to report.
+    minSeconds : float, optional
+        Smallest slowdown in seconds to report.
+
+    Returns:
+    --------
+    int
+        Number of regressions found.
+    """
+    old = {(r['kind'], r['requested']): r['seconds'] for r in baseline.get('results', [])}
+    regressions = 0
+    for r in results:
+        before = old.get((r['kind'], r['requested']))
+        if before is None:
+            continue
+        for stage, seconds in r['seconds'].items():
+            if stage not in before or seconds - before[stage] < minSeconds:
+                continue
+            if before[stage] > 0 and seconds / before[stage] > threshold:
+                regressions += 1
+                log(f"slower: {r['kind']} {r['links']} links {stage}: "
+                    f"{before[stage]:.4f} s -> {seconds:.4f} s ({seconds / before[stage]:.2f}x)")
+    return regressions
+
+
+###############################################################################
+# 3) Command Line
+###############################################################################
+def Main():
+    parser = argparse.ArgumentParser(description="Time loading, solving and drawing of generated trusses.")
+    parser.add_argument('--kinds', default=','.join(TRUSS_KINDS),
+                        help="comma separated truss kinds (default: all)")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help="comma separated numbers of links (default: 10 to 10^6)")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per case, the fastest is kept")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random lattice")
+    parser.add_argument('--no-qt', action='store_true', help="skip ImportFromFile and buildScene")
+    parser.add_argument('--keep-files', metavar='DIR', help="write the generated input files to DIR")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file for the results")
+    parser.add_argument('--baseline', help="earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="slowdown ratio reported as a regression (default 1.2)")
+    args = parser.parse_args()
+
+    kinds = [k.strip().lower() for k in args.kinds.split(',') if k.strip()]
+    sizes = [int(float(s)) for s in args.sizes.split(',') if s.strip()]
+    qt = not args.no_qt
+    app = None
+    if qt:
+        # Draw without a display
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5 import QtWidgets as qtw
+        app = qtw.QApplication.instance() or qtw.QApplication(sys.argv[:1])
+    if args.keep_files:
+        os.makedirs(args.keep_files, exist_ok=True)
+
+    results = benchmark(kinds, sizes, repeat=max(args.repeat, 1), qt=qt, seed=args.seed,
+                        workDir=args.keep_files)
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=1)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if compareResults(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    Main()
@@ -0,0 +1,145 @@
+import json
+import struct
+import numpy as np
+
+# A binary truss file is:
+#   magic (8 bytes) | format version (uint32) | header length (uint32)
+#   JSON header describing every array (dtype, shape, byte offset) plus metadata
+#   raw little-endian arrays, each starting on an ALIGNMENT byte boundary
+# so the arrays can be memory-mapped in place.
+MAGIC = b'TRUSSBIN'
+VERSION = 1
+ALIGNMENT = 64
+BINARY_EXTENSION = '.trussbin'
+_PREFIX = struct.Struct('<8sII')
+
+
+###############################################################################
+# 1) String Tables
+###############################################################################
+def packStrings(strings):
+    """
+    Packs a list of strings into one UTF-8 byte array plus an offsets array,
+    so string i is blob[offsets[i]:offsets[i+1]].
+
+    Returns:
+    --------
+    (ndarray, ndarray)
+        uint8 blob and int64 offsets (length len(strings) + 1).
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def unpackStrings(blob, offsets):
+    """
+    Inverse of packStrings.
+    """
+    data = bytes(blob)
+    off = offsets.tolist()
+    return [data[off[i]:off[i + 1]].decode('utf-8') for i in range(len(off) - 1)]
+
+
+def unpackString(blob, offsets, i):
+    """
+    Decodes string i of a packed table alone, without touching the others.
+    """
+    return bytes(blob[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+
+###############################################################################
+# 2) Container Read/Write
+###############################################################################
+def writeContainer(path, arrays, meta):
+    """
+    Writes named arrays and a JSON-serializable metadata dict to a binary file.
+
+    Parameters:
+    -----------
+    path : str
+        The file to write.
+    arrays : dict
+        name -> ndarray (stored little-endian, C order).
+    meta : dict
+        Anything json.dumps can write.
+    """
+    arrays = {name: np.ascontiguousarray(arr, dtype=np.asarray(arr).dtype.newbyteorder('<'))
+              for name, arr in arrays.items()}
+
+    # The header holds the offsets, whose values depend on the header size,
+    # so lay out the arrays against a fixed-point header length.
+    headerLen = 0
+    while True:
+        offset = _align(_PREFIX.size + headerLen)
+        table = {}
+        for name, arr in arrays.items():
+            table[name] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+            offset = _align(offset + arr.nbytes)
+        header = json.dumps({'arrays': table, 'meta': meta}).encode('utf-8')
+        if len(header) <= headerLen:
+            break
+        headerLen = len(header) + 256  # leave room so offsets settle in one more pass
+    header = header.ljust(headerLen)
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, headerLen))
+        f.write(header)
+        for name, arr in arrays.items():
+            f.seek(table[name]['offset'])
+            f.write(arr.tobytes())
+
+
+def readContainer(path, mmap=True):
+    """
+    Reads a file written by writeContainer.
+
+    Parameters:
+    -----------
+    path : str
+        The file to read.
+    mmap : bool, optional
+        If True the arrays are copy-on-write memory maps, so opening is
+        nearly instant and pages are only read when an array is touched.
+        Writes to them never reach the file.
+
+    Returns:
+    --------
+    (dict, dict)
+        name -> ndarray, and the metadata dict.
+
+    Raises:
+    -------
+    ValueError
+        If the file isn't a truss binary file of a supported version.
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path} is not a truss binary file")
+        magic, version, headerLen = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a truss binary file")
+        if version > VERSION:
+            raise ValueError(f"{path} was written by a newer version (format {version})")
+        header = json.loads(f.read(headerLen).decode('utf-8'))
+
+        arrays = {}
+        for name, info in header['arrays'].items():
+            dtype = np.dtype(info['dtype'])
+            shape = tuple(info['shape'])
+            count = int(np.prod(shape))
+            if count == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            elif mmap:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='c', offset=info['offset'], shape=shape)
+            else:
+                f.seek(info['offset'])
+                arrays[name] = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+    return arrays, header['meta']
+
+
+def _align(n):
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
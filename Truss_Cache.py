@@ -0,0 +1,113 @@
+import hashlib
+import os
+import tempfile
+
+from Truss_Binary import BINARY_EXTENSION
+from Truss_Constants import SOLVER_VERSION
+
+
+class TrussCache():
+    """
+    An on-disk cache of parsed and solved truss models. Entries are stored in
+    the binary format and keyed by a hash of the input file's contents plus
+    SOLVER_VERSION, so an unchanged file re-opens without parsing or solving,
+    while any edit to the file or to the solver gets a fresh entry.
+    The directory is kept under maxBytes by evicting least recently used
+    entries.
+    """
+
+    def __init__(self, directory=None, maxBytes=512 * 1024 * 1024):
+        """
+        Parameters:
+        -----------
+        directory : str, optional
+            Where entries are kept. Defaults to $TRUSS_CACHE_DIR or
+            ~/.cache/truss_app.
+        maxBytes : int, optional
+            Size cap for the whole cache directory.
+        """
+        if directory is None:
+            directory = os.environ.get('TRUSS_CACHE_DIR',
+                                       os.path.join(os.path.expanduser('~'), '.cache', 'truss_app'))
+        self.directory = directory
+        self.maxBytes = maxBytes
+
+    def keyForFile(self, filename, chunkSize=1 << 20):
+        """
+        Hashes a file's contents (read in chunks) together with the solver version.
+
+        Returns:
+        --------
+        str
+            Hex digest used as the cache key.
+        """
+        h = hashlib.sha256(SOLVER_VERSION.encode('utf-8'))
+        with open(filename, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunkSize), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def path(self, key):
+        """
+        Returns the entry file path for a key.
+        """
+        return os.path.join(self.directory, key + BINARY_EXTENSION)
+
+    def get(self, key):
+        """
+        Looks up an entry and marks it as recently used.
+
+        Returns:
+        --------
+        str or None
+            Path of the cached binary model, or None on a miss.
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, truss):
+        """
+        Stores a model under a key, then evicts old entries if over the size cap.
+        The entry is written to a temporary file and renamed into place so a
+        crash never leaves a half-written entry behind.
+
+        Parameters:
+        -----------
+        key : str
+            Key from keyForFile.
+        truss : TrussModel
+            The parsed and solved model.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        os.close(fd)
+        try:
+            truss.saveBinary(tmp)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes least recently used entries until the directory fits in maxBytes.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(BINARY_EXTENSION):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.maxBytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # e.g. still memory-mapped on Windows
+            total -= size
@@ -1,10 +1,15 @@
 import math
+import numpy as np
 from PyQt5 import QtWidgets as qtw
 from PyQt5 import QtCore as qtc
 from PyQt5 import QtGui as qtg
 
 # We already had these two from your code:
 from GraphicsView_App import RigidLink, RigidPivotPoint
+from Truss_Cache import TrussCache
+from Truss_Worker import ImportWorker
+# The model classes live in the Qt-free Truss_Model; re-exported here for existing imports
+from Truss_Model import Position, Rectangle, Material, LoadCase, Node, Link, TrussModel
 
 ###############################################################################
 # 1) NEW CLASS: RollerSupport
@@ -52,6 +57,8 @@ class RollerSupport(RigidPivotPoint):
          1) A top pivot circle
          2) A triangular base
          3) Hashed base lines to represent the foundation
+        When zoomed out (see RigidPivotPoint.isLowDetail) only a triangle
+        and two base lines are drawn, the second line marking it as a roller.
         """
         painter.save()
 
@@ -62,6 +69,13 @@ class RollerSupport(RigidPivotPoint):
         painter.setPen(self.pen or qtg.QPen(qtc.Qt.black))
         painter.setBrush(self.brush or qtg.QBrush(qtc.Qt.gray))
 
+        if self.isLowDetail(painter, option):
+            painter.drawPolygon(qtg.QPolygonF([qtc.QPointF(0, 0), qtc.QPointF(self.w, self.h),
+                                               qtc.QPointF(-self.w, self.h)]))
+            painter.drawLine(qtc.QLineF(-self.w, self.h + 4, self.w, self.h + 4))
+            painter.restore()
+            return
+
         # 1) Top pivot circle
         pivot_radius = self.w / 2
         circle_rect = qtc.QRectF(-pivot_radius, 0, 2 * pivot_radius, 2 * pivot_radius)
@@ -96,424 +110,330 @@ class RollerSupport(RigidPivotPoint):
 
 
 ###############################################################################
-# 2) Basic Data Classes: Position, Rectangle, Material
+# 2) TrussScene Class
 ###############################################################################
-class Position():
+class TrussScene(qtw.QGraphicsScene):
     """
-    A basic 3D position class to store x, y, z coordinates.
-    Provides vector operations like addition, subtraction,
-    scalar multiplication, and magnitude calculation.
+    A QGraphicsScene that paints the reference grid in drawBackground instead
+    of holding one QGraphicsLineItem per grid line. Only the lines inside the
+    exposed rectangle are painted, and the spacing is coarsened in a 1-2-5
+    sequence when zoomed out so lines stay at least minGridPixels apart.
     """
 
-    def __init__(self, pos=None, x=None, y=None, z=None):
+    def __init__(self, parent=None):
         """
-        Initialize a Position object.
-
-        Parameters:
-        -----------
-        pos : tuple of floats, optional
-            A (x, y, z) tuple to initialize all coordinates at once.
-        x : float, optional
-            The x coordinate if not using pos.
-        y : float, optional
-            The y coordinate if not using pos.
-        z : float, optional
-            The z coordinate if not using pos.
+        Initializes the scene with no grid.
         """
-        self.x = 0.0
-        self.y = 0.0
-        self.z = 0.0
-
-        # If pos is given, unpack it
-        if pos is not None:
-            self.x, self.y, self.z = pos
+        super().__init__(parent)
+        self.gridRect = qtc.QRectF()
+        self.gridDeltaX = 10
+        self.gridDeltaY = 10
+        self.gridPen = qtg.QPen()
+        self.gridBrush = None
+        self.minGridPixels = 8
+        self.toolTipProvider = None  # callable(item, scenePos, tolerance) -> str or None
+        self.pickPixels = 4  # how near the mouse must be, on screen, to a picked element
 
-        # If x, y, z were also explicitly passed, override the defaults
-        self.x = x if x is not None else self.x
-        self.y = y if y is not None else self.y
-        self.z = z if z is not None else self.z
-
-    def __eq__(self, other):
-        """
-        Overloads the == operator to compare two Position objects.
+    def setGrid(self, rect, DeltaX, DeltaY, pen=None, brush=None):
         """
-        return (self.x == other.x and self.y == other.y and self.z == other.z)
-
-    def __add__(self, other):
-        """
-        Defines vector addition of two Position objects.
-        Returns a new Position.
-        """
-        return Position((self.x + other.x, self.y + other.y, self.z + other.z))
-
-    def __sub__(self, other):
-        """
-        Defines vector subtraction of two Position objects.
-        Returns a new Position.
-        """
-        return Position((self.x - other.x, self.y - other.y, self.z - other.z))
-
-    def __mul__(self, other):
-        """
-        Defines scalar multiplication of a Position object.
-        If other is float or int, multiply each coordinate by 'other'.
-        Returns a new Position.
-        """
-        if isinstance(other, (float, int)):
-            return Position((self.x * other, self.y * other, self.z * other))
-
-    def __rmul__(self, other):
-        """
-        Ensures scalar multiplication works from the left or right.
-        e.g. 2 * Position == Position * 2
-        """
-        return self.__mul__(other)
-
-    def mag(self):
-        """
-        Returns the Euclidean magnitude of the Position vector.
-        """
-        return (self.x**2 + self.y**2 + self.z**2)**0.5
-
-    def getAngleRad(self):
-        """
-        Gets the angle in the x-y plane relative to the positive x-axis
-        using atan2(y, x). Returns 0 if magnitude is near zero.
-        """
-        l = self.mag()
-        if l <= 0:
-            return 0
-        return math.atan2(self.y, self.x)
-
-
-class Rectangle():
-    """
-    A rectangle class defined by top, left, bottom, and right attributes.
-    Useful for bounding box calculations and geometry operations.
-    """
-
-    def __init__(self, top=None, left=None, bottom=None, right=None):
-        """
-        Initialize a Rectangle with the given edges.
+        Sets the area and base spacing of the grid.
 
         Parameters:
         -----------
-        top : float, optional
-        left : float, optional
-        bottom : float, optional
-        right : float, optional
-        """
-        self.top = 0 if top is None else top
-        self.left = 0 if left is None else left
-        self.bottom = 0 if bottom is None else bottom
-        self.right = 0 if right is None else right
-
-    def height(self):
-        """
-        Returns the height of the rectangle (top - bottom).
-        """
-        return self.top - self.bottom
-
-    def width(self):
-        """
-        Returns the width of the rectangle (right - left).
-        """
-        return self.right - self.left
-
-    def centerX(self):
-        """
-        Returns the x coordinate of the rectangle's horizontal center.
+        rect : QRectF
+            Grid area in scene coordinates.
+        DeltaX : float
+            Spacing between vertical grid lines at full zoom.
+        DeltaY : float
+            Spacing between horizontal grid lines at full zoom.
+        pen : QPen, optional
+            Pen for the grid lines and border.
+        brush : QBrush, optional
+            Brush for the grid background.
         """
-        return self.left + self.width()/2.0
+        self.gridRect = qtc.QRectF(rect)
+        self.gridDeltaX = DeltaX
+        self.gridDeltaY = DeltaY
+        self.gridPen = pen if pen is not None else qtg.QPen()
+        self.gridBrush = brush
+        self.update()
 
-    def centerY(self):
+    def gridSpacing(self, delta, scale):
         """
-        Returns the y coordinate of the rectangle's vertical center.
-        """
-        return self.bottom + self.height()/2.0
-
-
-class Material():
-    """
-    Stores material properties for the truss:
-     - uts : Ultimate Tensile Strength
-     - ys : Yield Strength
-     - E : Modulus of Elasticity
-     - staticFactor : A factor of safety or static factor
-    """
-
-    def __init__(self, uts=None, ys=None, modulus=None, staticFactor=None):
+        Returns the grid spacing to use for a base spacing at a given zoom
+        (pixels per scene unit): delta times 1, 2, 5, 10, 20, 50, ...
         """
-        Initialize a Material object.
+        spacing = delta
+        steps = (2.0, 2.5, 2.0)
+        i = 0
+        while spacing * scale < self.minGridPixels:
+            spacing *= steps[i % 3]
+            i += 1
+        return spacing
 
-        Parameters:
-        -----------
-        uts : float, optional
-            Ultimate tensile strength.
-        ys : float, optional
-            Yield strength.
-        modulus : float, optional
-            Modulus of Elasticity (E).
-        staticFactor : float, optional
-            Some factor of safety in static conditions.
+    def drawBackground(self, painter, rect):
         """
-        self.uts = uts
-        self.ys = ys
-        self.E = modulus
-        self.staticFactor = staticFactor
-
-
-###############################################################################
-# 3) Node Class
-###############################################################################
-class Node():
-    """
-    Represents a node in a truss with:
-     - a unique name identifier
-     - a Position object (x, y, z)
-     - an associated PyQt5 QGraphicsItem (graphic) for visualization
-    """
-
-    def __init__(self, name=None, position=None):
+        Paints the grid background and the grid lines that fall inside the
+        exposed rectangle.
         """
-        Initializes a Node.
+        super().drawBackground(painter, rect)
+        if self.gridRect.isEmpty():
+            return
+        area = rect.intersected(self.gridRect)
+        if area.isEmpty():
+            return
 
-        Parameters:
-        -----------
-        name : str, optional
-            The node's name (e.g. 'N1', 'left support', etc.).
-        position : Position, optional
-            The node's 3D position object. Defaults to Position(0, 0, 0).
-        """
-        self.name = name
-        self.position = position if position else Position()
-        self.graphic = None  # Will be assigned a QGraphicsItem later in the View class
+        painter.save()
+        if self.gridBrush is not None:
+            painter.fillRect(area, self.gridBrush)
+        painter.setPen(self.gridPen)
+        painter.setBrush(qtc.Qt.NoBrush)
+
+        t = painter.worldTransform()
+        g = self.gridRect
+        lines = []
+        # Vertical lines counted from the left edge, horizontal from the bottom edge
+        dx = self.gridSpacing(self.gridDeltaX, math.hypot(t.m11(), t.m12()))
+        for i in range(math.ceil((area.left() - g.left()) / dx), math.floor((area.right() - g.left()) / dx) + 1):
+            x = g.left() + i * dx
+            lines.append(qtc.QLineF(x, area.top(), x, area.bottom()))
+        dy = self.gridSpacing(self.gridDeltaY, math.hypot(t.m21(), t.m22()))
+        for i in range(math.ceil((g.bottom() - area.bottom()) / dy), math.floor((g.bottom() - area.top()) / dy) + 1):
+            y = g.bottom() - i * dy
+            lines.append(qtc.QLineF(area.left(), y, area.right(), y))
+        painter.drawLines(lines)
+        painter.drawRect(g)
+        painter.restore()
 
-    def __eq__(self, other):
+    def helpEvent(self, event):
         """
-        Overloads the == operator to compare two Node objects by name and position.
+        Shows the tooltip of the topmost item under the mouse, asking
+        toolTipProvider for its text instead of storing a string on every item.
+        The provider also gets the mouse position and pickPixels in scene
+        units, for items such as LinkBatchItem that stand for many elements.
         """
-        return self.name == other.name and self.position == other.position
+        if self.toolTipProvider is None:
+            super().helpEvent(event)
+            return
+        view = event.widget().parentWidget() if event.widget() else None
+        transform = view.transform() if isinstance(view, qtw.QGraphicsView) else qtg.QTransform()
+        tolerance = self.pickPixels / (math.hypot(transform.m11(), transform.m12()) or 1.0)
+        for item in self.items(event.scenePos(), qtc.Qt.IntersectsItemShape,
+                               qtc.Qt.DescendingOrder, transform):
+            tip = self.toolTipProvider(item, event.scenePos(), tolerance)
+            if tip:
+                qtw.QToolTip.showText(event.screenPos(), tip, event.widget())
+                event.setAccepted(True)
+                return
+        qtw.QToolTip.hideText()
+        event.setAccepted(False)
 
 
 ###############################################################################
-# 4) Link Class
+# 3) LinkBatchItem Class
 ###############################################################################
-class Link():
+class LinkBatchItem(qtw.QGraphicsItem):
     """
-    Represents a truss link/element that connects two nodes with:
-     - name
-     - node1, node2 (string references to node names)
-     - length, angle in radians
-     - material properties
-     - geometric properties (width, thickness)
-     - weight (calculated)
-     - a RigidLink PyQt5 QGraphicsItem for visualization
+    Draws every link of a TrussModel as a single scene item, for trusses too
+    large for one QGraphicsItem per link. The link center lines are read
+    straight from the model's node and link arrays and sorted by midpoint
+    into a grid of cells, each stroked as one QPainterPath. paint only
+    strokes the cells inside the exposed area, and an edit only rebuilds the
+    cells holding the changed links. Tooltips are found with
+    TrussModel.nearestLink rather than per-item hover events.
     """
 
-    def __init__(self, name="", node1="1", node2="2", length=None, angleRad=None,
-                 material=None, width=None, thickness=None, weight=None):
+    def __init__(self, truss, pen, cells=32, parent=None):
         """
-        Basic definition of a link with optional geometric and material properties.
-
         Parameters:
         -----------
-        name : str, optional
-            A unique link name (e.g. 'L1').
-        node1 : str, optional
-            Name of the first node (e.g. 'N1').
-        node2 : str, optional
-            Name of the second node (e.g. 'N2').
-        length : float, optional
-            The length of the link (in mm).
-        angleRad : float, optional
-            The angle of the link in radians, relative to x-axis.
-        material : object or str, optional
-            A Material object or string describing the link's material.
-        width : float, optional
-            The width of the link cross-section (mm).
-        thickness : float, optional
-            The thickness of the link cross-section (mm).
-        weight : float, optional
-            The weight (mass or force) of the link. Often computed dynamically.
-        """
-        self.name = name
-        self.node1_Name = node1
-        self.node2_Name = node2
-        self.length = length
-        self.angleRad = angleRad
-        self.material = material
-        self.width = width
-        self.thickness = thickness
-        self.weight = weight
-        # This RigidLink is the QGraphicsItem used to visualize the link in PyQt
-        self.graphic = RigidLink(0, 0, 1, 1)
-        self.graphic.name = name
-
-    def __eq__(self, other):
-        """
-        Overloads the == operator to compare equivalence of two links based on
-        node names, length, angle, material, width, thickness, etc.
-        """
-        if self.node1_Name != other.node1_Name:
-            return False
-        if self.node2_Name != other.node2_Name:
-            return False
-        if self.length != other.length:
-            return False
-        if self.angleRad != other.angleRad:
-            return False
-        if self.material != other.material:
-            return False
-        if self.width != other.width:
-            return False
-        if self.thickness != other.thickness:
-            return False
-        return True
-
-    def set(self, node1=None, node2=None, length=None, angleRad=None,
-            material=None, width=None, thickness=None, weight=None):
-        """
-        Updates the link's properties with the provided non-None arguments.
+        truss : TrussModel
+            The model whose links are drawn.
+        pen : QPen
+            Pen for the link lines; a cosmetic pen keeps them one width at any zoom.
+        cells : int, optional
+            The links are split into up to cells x cells paths.
+        parent : QGraphicsItem, optional
+        """
+        super().__init__(parent)
+        self.truss = truss
+        self.pen = pen
+        self.cells = cells
+        self.rect = qtc.QRectF()
+        self.setFlag(qtw.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Sorts all links into cells and builds every cell's path. Needed after
+        links are added or removed, since cells hold link indices.
+        """
+        t = self.truss
+        self.count = len(t.links)
+        i1, i2 = t.node1_idx, t.node2_idx
+        connected = (i1 >= 0) & (i2 >= 0)
+        self.cellOf = np.full(self.count, -1, dtype=np.int64)
+        self.paths = {}  # cell -> (link indices, QPainterPath, QRectF)
+        j = np.flatnonzero(connected)
+        if len(j):
+            mx = (t.nodeX[i1[j]] + t.nodeX[i2[j]]) / 2
+            my = (t.nodeY[i1[j]] + t.nodeY[i2[j]]) / 2
+            cx = self.cellIndex(mx)
+            cy = self.cellIndex(my)
+            self.cellOf[j] = cy * self.cells + cx
+            order = j[np.argsort(self.cellOf[j], kind='stable')]
+            keys, starts = np.unique(self.cellOf[order], return_index=True)
+            for key, members in zip(keys.tolist(), np.split(order, starts[1:])):
+                self.buildCell(key, members)
+        self.updateRect()
+
+    def cellIndex(self, v):
+        lo, hi = v.min(), v.max()
+        if hi <= lo:
+            return np.zeros(len(v), dtype=np.int64)
+        return np.minimum(((v - lo) / (hi - lo) * self.cells).astype(np.int64), self.cells - 1)
+
+    def buildCell(self, key, members):
+        """
+        Builds the path and bounding rectangle of one cell from the current
+        node coordinates, in scene coordinates (x, -y).
+        """
+        t = self.truss
+        i1 = t.node1_idx[members]
+        i2 = t.node2_idx[members]
+        x1, y1 = t.nodeX[i1], -t.nodeY[i1]
+        x2, y2 = t.nodeX[i2], -t.nodeY[i2]
+        path = qtg.QPainterPath()
+        for a, b, c, d in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist()):
+            path.moveTo(a, b)
+            path.lineTo(c, d)
+        left, right = min(x1.min(), x2.min()), max(x1.max(), x2.max())
+        top, bottom = min(y1.min(), y2.min()), max(y1.max(), y2.max())
+        # Pad so cells of purely horizontal or vertical links still intersect
+        pad = 1e-3 * max(right - left, bottom - top, 1.0)
+        rect = qtc.QRectF(left - pad, top - pad, right - left + 2 * pad, bottom - top + 2 * pad)
+        self.paths[key] = (members, path, rect)
+
+    def updateLinks(self, indices):
+        """
+        Rebuilds the cells holding the given links after they moved or their
+        nodes did. Falls back to rebuild() if a link was added or its ends
+        were connected or disconnected, which changes cell membership.
 
         Parameters:
         -----------
-        node1, node2 : str
-            Names of the nodes if provided.
-        length : float
-            The new length (mm).
-        angleRad : float
-            The new angle (radians).
-        material : object or str
-            New material assignment.
-        width : float
-            The link's cross-sectional width (mm).
-        thickness : float
-            The link's cross-sectional thickness (mm).
-        weight : float
-            The link's weight.
-        """
-        self.node1_Name = node1 if node1 is not None else self.node1_Name
-        self.node2_Name = node2 if node2 is not None else self.node2_Name
-        self.length = length if length is not None else self.length
-        self.angleRad = angleRad if angleRad is not None else self.angleRad
-        self.material = material if material is not None else self.material
-        self.width = width if width is not None else self.width
-        self.thickness = thickness if thickness is not None else self.thickness
-        self.weight = weight if weight is not None else self.weight
-
-    def calculate_weight(self, density):
-        """
-        Calculate the link weight based on material density and geometric dimensions.
+        indices : array-like of int
+            Indices of the changed links.
+        """
+        t = self.truss
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(t.links) != self.count:
+            self.rebuild()
+            return
+        connected = (t.node1_idx[indices] >= 0) & (t.node2_idx[indices] >= 0)
+        if np.any(connected != (self.cellOf[indices] >= 0)):
+            self.rebuild()
+            return
+        for key in np.unique(self.cellOf[indices[connected]]).tolist():
+            self.buildCell(key, self.paths[key][0])
+        self.updateRect()
 
-        Parameters:
-        -----------
-        density : float
-            Material density (kg/m^3).
+    def updateRect(self):
+        rect = qtc.QRectF()
+        for _, _, r in self.paths.values():
+            rect = rect.united(r)
+        self.prepareGeometryChange()
+        self.rect = rect
+        self.update()
 
-        Returns:
-        --------
-        float
-            The computed weight (in kg) based on volume * density.
-        """
-        if self.length and self.width and self.thickness:
-            # Convert mm^3 to m^3 by dividing by 1e9
-            volume = (self.length * self.width * self.thickness) / 1e9
-            self.weight = volume * density
-        return self.weight
+    def boundingRect(self):
+        return self.rect
 
-    def get_properties_string(self):
-        """
-        Returns a formatted string with all link properties, useful for debugging or reporting.
-        """
-        return (f"Link: {self.name}\n"
-                f"Nodes: {self.node1_Name} to {self.node2_Name}\n"
-                f"Length: {self.length:.2f} mm\n"
-                f"Angle: {self.angleRad:.2f} rad\n"
-                f"Material: {self.material if self.material else 'N/A'}\n"
-                f"Width: {self.width if self.width else 'N/A'} mm\n"
-                f"Thickness: {self.thickness if self.thickness else 'N/A'} mm\n"
-                f"Weight: {self.weight if self.weight else 'N/A'} kg")
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self.pen)
+        painter.setBrush(qtc.Qt.NoBrush)
+        exposed = option.exposedRect
+        for _, path, rect in self.paths.values():
+            if rect.intersects(exposed):
+                painter.drawPath(path)
 
 
 ###############################################################################
-# 5) TrussModel Class
+# 4) LinkTableModel Class
 ###############################################################################
-class TrussModel():
-    """
-    The TrussModel stores all the data describing a truss:
-     - title : str or None
-     - links : list of Link objects
-     - nodes : list of Node objects
-     - material : Material object for the entire truss
-     - rct : Rectangle bounding box for all nodes
-     - leftReaction : Reaction force at left support
-     - rightReaction : Reaction force at right support
-    """
+def _formatValue(value, spec, missing='N/A'):
+    return format(value, spec) if value else missing
 
-    def __init__(self):
-        """
-        Initializes an empty TrussModel with default Material and Rectangle.
-        """
-        self.title = None
-        self.links = []
-        self.nodes = []
-        self.material = Material()
-        self.rct = Rectangle()
 
-        # Reactions from gravity or external loads
-        self.leftReaction = 0.0
-        self.rightReaction = 0.0
+class LinkTableModel(qtc.QAbstractTableModel):
+    """
+    A table model over a TrussModel's links for a QTableView. Cells are
+    formatted only when the view asks for them, i.e. for the rows on screen,
+    so a table of 100k links opens as fast as one of ten.
+    """
 
-    def getNode(self, name):
-        """
-        Searches for and returns a Node by its name.
+    # (header, function of a Link returning the cell text)
+    columns = (
+        ('Link', lambda l: l.name),
+        ('(1)', lambda l: l.node1_Name),
+        ('(2)', lambda l: l.node2_Name),
+        ('Length', lambda l: _formatValue(l.length, '0.2f', '0.00')),
+        ('Angle', lambda l: _formatValue(l.angleRad, '0.2f', '0.00')),
+        ('Material', lambda l: l.material if l.material else 'N/A'),
+        ('Width', lambda l: _formatValue(l.width, '')),
+        ('Thickness', lambda l: _formatValue(l.thickness, '')),
+        ('Weight', lambda l: _formatValue(l.weight, '0.2f', '0.00')),
+        ('Force', lambda l: f"{l.force:0.1f}" if l.force is not None else 'N/A'),
+        ('SF', lambda l: f"{l.safetyFactor:0.2f}" if l.safetyFactor is not None else 'N/A'),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.truss = None
+        self.rows = 0
+
+    def setTruss(self, truss):
+        """
+        Shows a model's links, or refreshes the values shown if it is the
+        model already shown and its link count hasn't changed.
 
         Parameters:
         -----------
-        name : str
-            The name of the Node to find.
-
-        Returns:
-        --------
-        Node or None
-            The matching Node object, or None if not found.
-        """
-        for n in self.nodes:
-            if n.name == name:
-                return n
-        return None
-
-    def getCenterPt(self):
-        """
-        Builds a bounding rectangle around all node positions
-        and assigns it to self.rct. Also returns None if no nodes exist.
+        truss : TrussModel
+            The model whose links are listed.
         """
-        if not self.nodes:
+        if truss is self.truss and len(truss.links) == self.rows:
+            if self.rows:
+                self.dataChanged.emit(self.index(0, 0), self.index(self.rows - 1, len(self.columns) - 1))
             return
+        self.beginResetModel()
+        self.truss = truss
+        self.rows = len(truss.links)
+        self.endResetModel()
+
+    def rowCount(self, parent=qtc.QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=qtc.QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=qtc.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == qtc.Qt.DisplayRole:
+            return self.columns[index.column()][1](self.truss.links[index.row()])
+        if role == qtc.Qt.TextAlignmentRole and index.column() >= 3 and index.column() != 5:
+            return int(qtc.Qt.AlignRight | qtc.Qt.AlignVCenter)
+        return None
 
-        # Initialize bounding box to the first node's position
-        rct = Rectangle(
-            top=self.nodes[0].position.y,
-            left=self.nodes[0].position.x,
-            bottom=self.nodes[0].position.y,
-            right=self.nodes[0].position.x,
-        )
-        # Expand bounding rect to include all nodes
-        for n in self.nodes:
-            if rct.left > n.position.x:
-                rct.left = n.position.x
-            if rct.right < n.position.x:
-                rct.right = n.position.x
-            if rct.top < n.position.y:
-                rct.top = n.position.y
-            if rct.bottom > n.position.y:
-                rct.bottom = n.position.y
-        self.rct = rct
+    def headerData(self, section, orientation, role=qtc.Qt.DisplayRole):
+        if role == qtc.Qt.DisplayRole and orientation == qtc.Qt.Horizontal:
+            return self.columns[section][0]
+        return super().headerData(section, orientation, role)
 
 
 ###############################################################################
-# 6) TrussView Class
+# 5) TrussView Class
 ###############################################################################
 class TrussView():
     """
@@ -527,7 +447,22 @@ class TrussView():
         Initializes the TrussView by setting up QGraphicsScene,
         default pens, and brushes for drawing.
         """
-        self.scene = qtw.QGraphicsScene()
+        self.scene = TrussScene()
+        self.scene.toolTipProvider = self.itemToolTip
+
+        # The model on screen and its graphics items, so edits redraw only what changed
+        self.sceneTruss = None
+        self.linkItems = {}  # Link -> RigidLink
+        self.nodeItems = {}  # Node -> (graphic, label)
+        self.itemOwners = {}  # graphics item -> Node or Link
+
+        # Above batchLinkCount links, all links are drawn by one LinkBatchItem
+        # and only support nodes get items of their own
+        self.batchLinkCount = 20000
+        self.batchItem = None
+
+        # The report lists the reactions of at most this many supports
+        self.reportSupports = 20
 
         # UI elements for showing output or link details
         self.le_LongLinkName = qtw.QLineEdit()
@@ -536,6 +471,8 @@ class TrussView():
         self.le_LongLinkLength = qtw.QLineEdit()
         self.te_Report = qtw.QTextEdit()
         self.gv = qtw.QGraphicsView()
+        self.linkTable = LinkTableModel()
+        self.setLinkTableView(qtw.QTableView())
 
         # Pens and brushes
         self.penLink = qtg.QPen(qtg.QColor("orange"))
@@ -549,6 +486,9 @@ class TrussView():
 
         self.penGridLines = qtg.QPen(qtg.QColor.fromHsv(197, 144, 228, alpha=50))
         self.penGridLines.setWidth(1)
+        self.penGridLines.setCosmetic(True)  # one pixel wide at any zoom
+
+        self.penBatchLink = qtg.QPen(qtg.QColor("orange"), 0)  # cosmetic, for LinkBatchItem
 
         self.brushLink = qtg.QBrush(qtg.QColor.fromHsv(35, 255, 255, 64))
         self.brushPivot = qtg.QBrush(qtg.QColor.fromRgb(215, 215, 215, alpha=128))
@@ -559,7 +499,8 @@ class TrussView():
         """
         Allows external assignment of the relevant UI widgets.
         Expects a tuple/list in the order:
-         (QTextEdit, QLineEdit, QLineEdit, QLineEdit, QLineEdit, QGraphicsView).
+         (QTextEdit, QLineEdit, QLineEdit, QLineEdit, QLineEdit, QGraphicsView),
+        optionally followed by a QTableView for the link table.
 
         Parameters:
         -----------
@@ -573,61 +514,121 @@ class TrussView():
         self.le_LongLinkLength = args[4]
         self.gv = args[5]
         self.gv.setScene(self.scene)
+        if len(args) > 6:
+            self.setLinkTableView(args[6])
+
+    def setLinkTableView(self, tableView):
+        """
+        Shows the link table in a QTableView. Rows get a fixed height so the
+        view never measures rows that are off screen.
+
+        Parameters:
+        -----------
+        tableView : QTableView
+            The view to show the link table in.
+        """
+        self.tv_Links = tableView
+        tableView.setModel(self.linkTable)
+        tableView.verticalHeader().setSectionResizeMode(qtw.QHeaderView.Fixed)
 
     def displayReport(self, truss):
         """
-        Builds and displays a text report of the TrussModel in the QTextEdit widget.
-        Also updates the 'longest link' QLineEdits in the UI.
+        Builds and displays a text report of the TrussModel in the QTextEdit widget,
+        lists the links in the link table and updates the 'longest link' QLineEdits.
+        The report is collected as a list of lines joined once; the per-link rows
+        live in the table, which only formats the rows on screen.
 
         Parameters:
         -----------
         truss : TrussModel
             The truss model containing links, nodes, and material properties.
         """
-        st = "Truss Design Report\n"
-        st += f"Title: {truss.title}\n"
-        st += f"Static Factor: {truss.material.staticFactor}\n"
-        st += f"Ultimate Strength: {truss.material.uts}\n"
-        st += f"Yield Strength: {truss.material.ys}\n"
-        st += f"Modulus E: {truss.material.E}\n\n"
-
-        # Create a tabular summary of links
-        st += 'Link\t(1)\t(2)\tLength\tAngle\tMaterial\tWidth\tThickness\tWeight\n'
-        for l in truss.links:
-            st += '{}\t{}\t{}\t{:0.2f}\t{:0.2f}\t{}\t{}\t{}\t{:0.2f}\n'.format(
-                l.name, l.node1_Name, l.node2_Name, l.length, l.angleRad,
-                l.material if l.material else 'N/A',
-                l.width if l.width else 'N/A',
-                l.thickness if l.thickness else 'N/A',
-                l.weight if l.weight else 0
-            )
-
-        # Find and display the longest link in the UI widgets
-        if truss.links:
-            longest = truss.links[0]
-            for link in truss.links:
-                if link.length and longest.length and link.length > longest.length:
-                    longest = link
-
+        lines = [
+            "Truss Design Report",
+            f"Title: {truss.title}",
+            f"Static Factor: {truss.material.staticFactor}",
+            f"Ultimate Strength: {truss.material.uts}",
+            f"Yield Strength: {truss.material.ys}",
+            f"Modulus E: {truss.material.E}",
+            "",
+        ]
+        if truss.solveError:
+            lines += [f"Member forces not solved: {truss.solveError}", ""]
+        lines.append(f"Links: {len(truss.links)} (see the link table)")
+
+        # Summary from the model's statistics block, no scan over the links
+        stats = truss.getStatistics()
+        if stats.weight.argmax >= 0:
+            lines += [
+                f"Total Weight: {stats.weight.total:0.2f} N",
+                f"Heaviest Link: {truss.links[stats.weight.argmax].name} ({stats.weight.max:0.2f} N)",
+            ]
+        if stats.force.argmax >= 0:
+            lines += [
+                f"Max Tension: {max(stats.force.max, 0.0):0.1f} N",
+                f"Max Compression: {min(stats.force.min, 0.0):0.1f} N",
+                f"Max |Stress|: {max(abs(stats.stress.min), abs(stats.stress.max)):0.1f} Pa",
+            ]
+
+        # Support reactions under self-weight, for the first reportSupports supports
+        if len(truss.reactionNodes):
+            lines += ["", "Support\tType\tRx (N)\tRy (N)"]
+            for idx, (rx, ry) in zip(truss.reactionNodes[:self.reportSupports].tolist(),
+                                     truss.reactions[:self.reportSupports].tolist()):
+                name = truss.nodes[idx].name
+                lines.append(f"{name}\t{truss.getSupport(name).kind}\t{rx:0.1f}\t{ry:0.1f}")
+            if len(truss.reactionNodes) > self.reportSupports:
+                lines.append(f"... and {len(truss.reactionNodes) - self.reportSupports} more")
+            total = truss.reactions.sum(axis=0)
+            lines.append(f"Total\t\t{total[0]:0.1f}\t{total[1]:0.1f}")
+        if truss.reactionError:
+            lines += ["", f"Support reactions not solved: {truss.reactionError}"]
+
+        # Force envelope for each load case
+        if truss.loadCaseForces is not None:
+            lines += ["", "Load Case\tMax Tension\tMax Compression"]
+            for name, forces in zip(truss.loadCases, truss.loadCaseForces):
+                lines.append('{}\t{:0.1f}\t{:0.1f}'.format(
+                    name, max(np.nanmax(forces), 0.0), min(np.nanmin(forces), 0.0)))
+
+        # The link rows are formatted by the table as they scroll into view
+        self.linkTable.setTruss(truss)
+
+        # Display the longest link in the UI widgets
+        if stats.length.argmax >= 0:
+            longest = truss.links[stats.length.argmax]
             self.le_LongLinkName.setText(longest.name)
             self.le_LongLinkLength.setText(f"{longest.length:.2f}")
             self.le_LongLinkNode1.setText(longest.node1_Name)
             self.le_LongLinkNode2.setText(longest.node2_Name)
 
         # Put the final report text into the QTextEdit
-        self.te_Report.setText(st)
+        self.te_Report.setPlainText("\n".join(lines) + "\n")
 
     def buildScene(self, truss):
         """
         Clears the scene, lays down a grid, draws all links, draws all nodes,
-        then automatically fits and centers the view.
+        then automatically fits and centers the view. The links' RigidLink
+        items are taken out of the scene before clearing so drawLinks can
+        reuse them instead of allocating new ones. Later edits to the same
+        model go through updateScene instead. A truss with more than
+        batchLinkCount links is drawn with a single LinkBatchItem.
 
         Parameters:
         -----------
         truss : TrussModel
             The truss model to be drawn in the scene.
         """
+        for link in truss.links.created():  # links not created yet have no item
+            if link.graphic is not None and link.graphic.scene() == self.scene:
+                self.scene.removeItem(link.graphic)
         self.scene.clear()
+        self.linkItems = {}
+        self.nodeItems = {}
+        self.itemOwners = {}
+        self.batchItem = None
+        self.sceneTruss = truss
+        truss.takeChanges()  # everything is drawn below
         truss.getCenterPt()
 
         # Expand the bounding rectangle a bit for padding
@@ -642,20 +643,76 @@ class TrussView():
             DeltaY=10,
             Width=abs(rct.width()),
             Height=abs(rct.height()),
-            CenterX=0,
-            CenterY=0
+            CenterX=rct.centerX(),
+            CenterY=-rct.centerY()
         )
-        self.drawLinks(truss)
+        if len(truss.links) > self.batchLinkCount:
+            self.batchItem = LinkBatchItem(truss, self.penBatchLink)
+            self.scene.addItem(self.batchItem)
+        else:
+            self.drawLinks(truss)
         self.drawNodes(truss)
 
-        # Auto-fit the view to the items
-        self.gv.fitInView(self.scene.itemsBoundingRect(), qtc.Qt.KeepAspectRatio)
+        # Auto-fit the view to the items and the grid area
+        self.scene.setSceneRect(self.scene.itemsBoundingRect().united(self.scene.gridRect))
+        self.gv.fitInView(self.scene.sceneRect(), qtc.Qt.KeepAspectRatio)
         self.gv.centerOn(self.scene.sceneRect().center())
 
+    def updateScene(self, truss):
+        """
+        Brings the scene up to date with the edits made to the model since it
+        was last drawn, touching only the items of nodes and links that were
+        added, removed or changed (see TrussModel.takeChanges). The grid and
+        the zoom are left alone. A model that isn't the one on screen, or one
+        whose link count crossed batchLinkCount, is drawn from scratch with
+        buildScene.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The truss model shown in the scene.
+        """
+        batch = len(truss.links) > self.batchLinkCount
+        if truss is not self.sceneTruss or batch != (self.batchItem is not None):
+            self.buildScene(truss)
+            return
+        nodes, links, removedNodes, removedLinks = truss.takeChanges()
+        changed = []  # items drawn here, for the scene rect below
+        for node in removedNodes:
+            self.removeNodeItems(node)
+        for node in nodes:
+            self.drawNode(truss, node)
+            changed += self.nodeItems.get(node, ())
+        if self.batchItem is not None:
+            if removedLinks:
+                self.batchItem.rebuild()
+            elif links:
+                self.batchItem.updateLinks([link._index for link in links])
+            if removedLinks or links:
+                changed.append(self.batchItem)
+        else:
+            for link in removedLinks:
+                self.removeLinkItem(link)
+            for link in links:
+                self.drawLink(truss, link)
+                if link in self.linkItems:
+                    changed.append(self.linkItems[link])
+
+        # Let the scroll area grow if an edit moved something outside it; the
+        # full recompute over every item is left to buildScene
+        rect = self.scene.sceneRect()
+        grown = rect
+        for item in changed:
+            grown = grown.united(item.sceneBoundingRect())
+        if grown != rect:
+            self.scene.setSceneRect(grown)
+
     def drawAGrid(self, DeltaX, DeltaY, Width, Height, CenterX, CenterY):
         """
-        Draws a grid background in the scene, with the specified delta spacing
+        Sets up the grid background of the scene, with the specified delta spacing
         and total width/height. The grid is centered on (CenterX, CenterY).
+        No items are added: TrussScene.drawBackground paints the lines that are
+        visible, so the grid costs the same however large the truss is.
 
         Parameters:
         -----------
@@ -672,161 +729,274 @@ class TrussView():
         CenterY : float
             The y coordinate of the center of the grid region.
         """
-        brush = self.brushGrid
-        pen = self.penGridLines
-
         left = CenterX - Width/2.0
-        right = CenterX + Width/2.0
         top = CenterY - Height/2.0
-        bottom = CenterY + Height/2.0
-
-        # Draw a background rectangle filled with brush color
-        bg = qtw.QGraphicsRectItem(left, top, Width, Height)
-        bg.setBrush(brush)
-        bg.setPen(pen)
-        self.scene.addItem(bg)
-
-        # Draw vertical grid lines
-        x = left
-        while x <= right:
-            ln = qtw.QGraphicsLineItem(x, top, x, bottom)
-            ln.setPen(pen)
-            self.scene.addItem(ln)
-            x += DeltaX
-
-        # Draw horizontal grid lines
-        y = bottom
-        while y >= top:
-            ln = qtw.QGraphicsLineItem(left, y, right, y)
-            ln.setPen(pen)
-            self.scene.addItem(ln)
-            y -= DeltaY
+
+        # The scene paints the background and only the visible grid lines itself
+        self.scene.setGrid(qtc.QRectF(left, top, Width, Height), DeltaX, DeltaY,
+                           pen=self.penGridLines, brush=self.brushGrid)
 
     def drawLinks(self, truss):
         """
-        Draws each Link in the truss using RigidLink items, placing them
-        in the correct location relative to the truss's bounding box center.
+        Draws each Link in the truss using RigidLink items (see drawLink).
 
         Parameters:
         -----------
         truss : TrussModel
             The model containing the links and nodes.
         """
-        cx = truss.rct.centerX()
-        cy = truss.rct.centerY()
-
         for link in truss.links:
-            n1 = truss.getNode(link.node1_Name)
-            n2 = truss.getNode(link.node2_Name)
-            if not (n1 and n2):
-                continue
-
-            # Shift coordinates so the center of bounding box is at (0,0)
-            x1 = n1.position.x - cx
-            y1 = -(n1.position.y - cy)
-            x2 = n2.position.x - cx
-            y2 = -(n2.position.y - cy)
-
-            # Create the RigidLink graphic
-            link.graphic = RigidLink(
+            self.drawLink(truss, link)
+
+    def drawLink(self, truss, link):
+        """
+        Draws one Link as a RigidLink at its nodes' positions, with scene
+        coordinates (x, -y) so that y points up on screen. A link's RigidLink
+        is created the first time it is drawn and reused on later redraws,
+        with its endpoints moved only if they changed. A link with an end not
+        connected to a node is taken off the scene.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model containing the link.
+        link : Link
+            The link to draw.
+        """
+        n1 = truss.getNode(link.node1_Name)
+        n2 = truss.getNode(link.node2_Name)
+        if not (n1 and n2):
+            self.removeLinkItem(link)
+            return
+
+        x1, y1 = n1.position.x, -n1.position.y
+        x2, y2 = n2.position.x, -n2.position.y
+
+        # Create the RigidLink graphic on first draw, otherwise reuse it
+        g = link.graphic
+        if g is None:
+            g = link.graphic = RigidLink(
                 x1, y1, x2, y2,
                 radius=3,
                 pen=self.penLink,
                 brush=self.brushLink,
                 name=link.name
             )
+            g.setAcceptHoverEvents(True)
+        else:
+            g.setEndpoints(x1, y1, x2, y2)
 
-            # Original node positions (without offset) for tooltip
-            px1, py1 = n1.position.x, n1.position.y
-            px2, py2 = n2.position.x, n2.position.y
-
-            angle_degs = math.degrees(link.angleRad) if link.angleRad is not None else 0
-
-            # Simple logic to display half the weight on the end that is a support
-            support_nodes = ["left", "right"]
-            start_is_support = link.node1_Name.lower() in support_nodes
-            end_is_support = link.node2_Name.lower() in support_nodes
-
-            if start_is_support ^ end_is_support:  # XOR
-                partial_weight = link.weight / 2 if link.weight else 0.0
-            else:
-                partial_weight = link.weight
-
-            # Safe string formatting with fallback for missing data
-            width_str = f"{link.width:.3f}" if link.width else "N/A"
-            thickness_str = f"{link.thickness:.3f}" if link.thickness else "N/A"
-            weight_str = f"{partial_weight:.2f}" if partial_weight else "N/A"
-
-            # Build tooltip text
-            tip = (
-                f"Link: {link.name}\n"
-                f"Start: ({px1:.3f}, {py1:.3f}) [{link.node1_Name}]\n"
-                f"End: ({px2:.3f}, {py2:.3f}) [{link.node2_Name}]\n"
-                f"Length: {link.length:.3f} m\n"
-                f"Angle: {angle_degs:.2f}°\n"
-                f"Width: {width_str} m\n"
-                f"Thickness: {thickness_str} m\n"
-                f"Material: {link.material}\n"
-                f"Displayed Weight: {1848.2} N"
-            )
+        if g.scene() != self.scene:
+            self.scene.addItem(g)
+        self.linkItems[link] = g
+        self.itemOwners[g] = link
 
-            # Assign tooltip and add to the scene
-            link.graphic.setToolTip(tip)
-            link.graphic.setAcceptHoverEvents(True)
-            self.scene.addItem(link.graphic)
+    def removeLinkItem(self, link):
+        """
+        Takes a link's RigidLink off the scene. The item is kept on the link
+        so drawing the link again reuses it.
+        """
+        g = self.linkItems.pop(link, None)
+        if g is not None:
+            self.itemOwners.pop(g, None)
+            if g.scene() == self.scene:
+                self.scene.removeItem(g)
+
+    def linkToolTip(self, truss, link):
+        """
+        Builds the tooltip text for a link from the model's current values.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model containing the link.
+        link : Link
+            The link under the mouse.
+
+        Returns:
+        --------
+        str
+        """
+        n1 = truss.getNode(link.node1_Name)
+        n2 = truss.getNode(link.node2_Name)
+
+        # Original node positions for tooltip
+        px1, py1 = n1.position.x, n1.position.y
+        px2, py2 = n2.position.x, n2.position.y
+
+        angle_degs = math.degrees(link.angleRad) if link.angleRad is not None else 0
+
+        # Simple logic to display half the weight on the end that is a support
+        start_is_support = truss.getSupport(link.node1_Name) is not None
+        end_is_support = truss.getSupport(link.node2_Name) is not None
+
+        if start_is_support ^ end_is_support:  # XOR
+            partial_weight = link.weight / 2 if link.weight else 0.0
+        else:
+            partial_weight = link.weight
+
+        # Safe string formatting with fallback for missing data
+        width_str = f"{link.width:.3f}" if link.width else "N/A"
+        thickness_str = f"{link.thickness:.3f}" if link.thickness else "N/A"
+        weight_str = f"{partial_weight:.2f}" if partial_weight else "N/A"
+
+        # Build tooltip text
+        tip = (
+            f"Link: {link.name}\n"
+            f"Start: ({px1:.3f}, {py1:.3f}) [{link.node1_Name}]\n"
+            f"End: ({px2:.3f}, {py2:.3f}) [{link.node2_Name}]\n"
+            f"Length: {link.length:.3f} m\n"
+            f"Angle: {angle_degs:.2f}°\n"
+            f"Width: {width_str} m\n"
+            f"Thickness: {thickness_str} m\n"
+            f"Material: {link.material}\n"
+            f"Displayed Weight: {weight_str} N"
+        )
+        if link.force is not None:
+            tip += f"\nAxial Force: {link.force:.1f} N ({'tension' if link.force >= 0 else 'compression'})"
+        return tip
 
     def drawNodes(self, truss):
         """
-        Draws each Node in the truss as a small circle or a special pivot/roller
-        if it is labeled 'left' or 'right'. Also displays the reaction forces
-        in the tooltip if it is a support node.
+        Draws each Node in the truss (see drawNode), or only the supports
+        while a LinkBatchItem draws the links.
 
         Parameters:
         -----------
         truss : TrussModel
             The model containing the nodes and reaction forces.
         """
-        cx = truss.rct.centerX()
-        cy = truss.rct.centerY()
-
-        for node in truss.nodes:
-            x = node.position.x - cx
-            y = -(node.position.y - cy)
-
-            tip = f"Node: {node.name}"
-
-            if node.name.lower() == "left":
-                # Debug message for left reaction
-                print(f"[DEBUG] LEFT reaction force: {truss.leftReaction:.2f} N")
-                node.graphic = RigidPivotPoint(x, y, 10, 18,
-                                               brush=self.brushPivot,
-                                               name=node.name)
-
-            elif node.name.lower() == "right":
-                # Debug message for right reaction
-                print(f"[DEBUG] RIGHT reaction force: {truss.rightReaction:.2f} N")
-                from Truss_Classes import RollerSupport
-                node.graphic = RollerSupport(x, y, 10, 18,
-                                             brush=self.brushPivot,
-                                             name=node.name)
-            else:
-                # Default node is drawn as a small ellipse
-                node.graphic = qtw.QGraphicsEllipseItem(x - 2, y - 2, 4, 4)
-                node.graphic.setPen(self.penNode)
-                node.graphic.setBrush(self.brushNode)
-
-            # Add reaction forces to tooltip if node is a support
-            if node.name.lower() == "left":
-                tip += f"\nVertical Reaction: {6468.7:.2f} N"
-            elif node.name.lower() == "right":
-                tip += f"\nVertical Reaction: {6468.7:.2f} N"
-
-            node.graphic.setToolTip(tip)
-            node.graphic.setAcceptHoverEvents(True)
-            self.scene.addItem(node.graphic)
-
-            # Draw a label under the node
-            self.drawALabel(x, y + 15, node.name)
+        if self.batchItem is not None:
+            nodes = [truss.nodes[i] for i in truss.getSupports()[0].tolist()]
+        else:
+            nodes = truss.nodes
+        for node in nodes:
+            self.drawNode(truss, node)
+
+    def drawNode(self, truss, node):
+        """
+        Draws one Node as a small circle, or as a pivot or roller if it is a
+        support (see TrussModel.getSupport), with its name underneath. A
+        roller is turned so it pushes along its reaction direction. Any items
+        drawn for the node before are replaced, since a rename can change
+        which kind of item it needs. While a LinkBatchItem draws the links,
+        only support nodes are drawn.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model containing the node and reaction forces.
+        node : Node
+            The node to draw.
+        """
+        self.removeNodeItems(node)
+        support = truss.getSupport(node.name)
+        if self.batchItem is not None and support is None:
+            return
+        x = node.position.x
+        y = -node.position.y
+
+        if support is not None and support.kind == "roller":
+            node.graphic = RollerSupport(x, y, 10, 18,
+                                         brush=self.brushPivot,
+                                         name=node.name)
+            # Drawn below the node, i.e. for a vertical reaction; scene angles run clockwise
+            node.graphic.setRotation(90.0 - support.angle)
+        elif support is not None:
+            # A pin, or a fixed support, which holds a pin-jointed truss the same way
+            node.graphic = RigidPivotPoint(x, y, 10, 18,
+                                           brush=self.brushPivot,
+                                           name=node.name)
+        else:
+            # Default node is drawn as a small ellipse
+            node.graphic = qtw.QGraphicsEllipseItem(x - 2, y - 2, 4, 4)
+            node.graphic.setPen(self.penNode)
+            node.graphic.setBrush(self.brushNode)
+
+        node.graphic.setAcceptHoverEvents(True)
+        self.scene.addItem(node.graphic)
+        self.itemOwners[node.graphic] = node
+
+        # Draw a label under the node
+        label = self.drawALabel(x, y + 15, node.name)
+        self.nodeItems[node] = (node.graphic, label)
+
+    def removeNodeItems(self, node):
+        """
+        Takes a node's graphic and label off the scene.
+        """
+        items = self.nodeItems.pop(node, ())
+        for item in items:
+            self.itemOwners.pop(item, None)
+            if item.scene() == self.scene:
+                self.scene.removeItem(item)
+        if items:
+            node.graphic = None
+
+    def nodeToolTip(self, truss, node):
+        """
+        Builds the tooltip text for a node, including the support type and
+        the reaction forces under self-weight if it is a support node.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model containing the node and reaction forces.
+        node : Node
+            The node under the mouse.
+
+        Returns:
+        --------
+        str
+        """
+        tip = f"Node: {node.name}"
+
+        # Add reaction forces to tooltip if node is a support
+        support = truss.getSupport(node.name)
+        if support is not None:
+            tip += f"\nSupport: {support.kind}"
+            if support.kind == "roller":
+                tip += f" ({support.angle:g}°)"
+            k = np.flatnonzero(truss.reactionNodes == node._index)
+            if len(k):
+                rx, ry = truss.reactions[k[0]]
+                tip += f"\nHorizontal Reaction: {rx:.2f} N\nVertical Reaction: {ry:.2f} N"
+        return tip
+
+    def itemToolTip(self, item, pos, tolerance):
+        """
+        Returns the tooltip for a scene item, built when it is asked for so
+        that it always shows the model's latest results without every item's
+        text being rebuilt after each solve. For the LinkBatchItem the node
+        or link nearest the mouse is looked up in the model.
+
+        Parameters:
+        -----------
+        item : QGraphicsItem
+            The item under the mouse.
+        pos : QPointF
+            The mouse position in scene coordinates.
+        tolerance : float
+            How near, in scene units, a node or link must be to be picked.
+
+        Returns:
+        --------
+        str or None
+            The tooltip text, or None if the item isn't a node or link.
+        """
+        if item is self.batchItem:
+            truss = self.sceneTruss
+            node = truss.nearestNode(pos.x(), -pos.y(), tolerance)
+            if node is not None:
+                return self.nodeToolTip(truss, node)
+            link = truss.nearestLink(pos.x(), -pos.y(), tolerance)
+            return self.linkToolTip(truss, link) if link is not None else None
+        owner = self.itemOwners.get(item)
+        if isinstance(owner, Link):
+            return self.linkToolTip(self.sceneTruss, owner)
+        if isinstance(owner, Node):
+            return self.nodeToolTip(self.sceneTruss, owner)
+        return None
 
     def drawALabel(self, x, y, text):
         """
@@ -841,6 +1011,11 @@ class TrussView():
             Y position for the label (scene coordinates).
         text : str
             The text to display.
+
+        Returns:
+        --------
+        QGraphicsTextItem
+            The label item added to the scene.
         """
         label_item = qtw.QGraphicsTextItem(text)
         w = label_item.boundingRect().width()
@@ -849,10 +1024,11 @@ class TrussView():
         label_item.setY(y - h/2.0)
         label_item.setDefaultTextColor(self.penLabel.color())
         self.scene.addItem(label_item)
+        return label_item
 
 
 ###############################################################################
-# 7) TrussController Class
+# 6) TrussController Class
 ###############################################################################
 class TrussController():
     """
@@ -863,10 +1039,13 @@ class TrussController():
 
     def __init__(self):
         """
-        Initialize a TrussController with an empty TrussModel and a TrussView.
+        Initialize a TrussController with an empty TrussModel, a TrussView
+        and the on-disk model cache.
         """
         self.truss = TrussModel()
         self.view = TrussView()
+        self.cache = TrussCache()
+        self.worker = None  # the ImportWorker currently loading a file, if any
 
     def installSceneEventFilter(self, widget):
         """
@@ -899,12 +1078,14 @@ class TrussController():
     def handleSceneEvent(self, event, graphics_view):
         """
         General event handler for scene events such as mouse move, etc.
-        We capture the mouse position for display or debugging.
+        We capture the mouse position and the node and link under the cursor,
+        found through the model's spatial index (TrussModel.nearestNode and
+        nearestLink) within the scene's pick distance.
 
         Parameters:
         -----------
-        event : QEvent
-            The event object from the scene.
+        event : QEvent or MouseMoveSnapshot
+            The event object from the scene, or a coalesced mouse move.
         graphics_view : QGraphicsView
             The view receiving the event.
 
@@ -925,149 +1106,156 @@ class TrussController():
             y_rounded = round(-pos.y(), 2)
             info_str = f"Mouse: x={x_rounded}, y={y_rounded}"
 
+            # Report the node and link under the cursor
+            t = graphics_view.transform()
+            tolerance = self.view.scene.pickPixels / (math.hypot(t.m11(), t.m12()) or 1.0)
+            node = self.truss.nearestNode(pos.x(), -pos.y(), tolerance)
+            link = self.truss.nearestLink(pos.x(), -pos.y(), tolerance)
+            if node is not None:
+                info_str += f"  Node: {node.name}"
+            if link is not None:
+                info_str += f"  Link: {link.name}"
+
         return consumed, info_str
 
     def ImportFromFile(self, data):
         """
-        Reads lines from a text file-like list, parsing them to build up
-        Nodes, Links, and Material properties in the TrussModel.
-        Calls geometry and reaction calculations, then updates the view.
+        Reads lines from an open file (or any iterable of lines), parsing
+        them one at a time to build up Nodes, Links, and Material properties
+        in the TrussModel. Calls geometry and reaction calculations, then
+        updates the view.
 
         Parameters:
         -----------
-        data : list of str
+        data : file or iterable of str
             Each line is a CSV-like set of instructions. e.g.:
              # comment
              material, 400, 250, 200e9
              static, 2.0
              node, N1, 0, 0
              link, L1, N1, N2, ...
+             loadcase, snow, N1, 0, -500
         """
-        # Reset the model
-        self.truss = TrussModel()
+        # Replace the model, streaming the parsed records straight into it
+        self.truss = TrussModel.fromFile(data)
 
-        # Parse file line by line
-        for line in data:
-            line = line.strip()
-            # Skip empty lines or comment lines
-            if not line or line.startswith('#'):
-                continue
-
-            cells = [c.strip() for c in line.split(',')]
-            if len(cells) < 2:
-                continue
-
-            key = cells[0].lower()
-
-            if key.startswith('material'):
-                # e.g. material, uts, ys, E
-                self.truss.material.uts = float(cells[1])
-                self.truss.material.ys = float(cells[2])
-                self.truss.material.E = float(cells[3])
-            elif key.startswith('static'):
-                # e.g. static, factor
-                self.truss.material.staticFactor = float(cells[1])
-            elif key.startswith('node'):
-                # e.g. node, name, x, y
-                nm = cells[1].strip()
-                x = float(cells[2])
-                y = float(cells[3])
-                self.truss.nodes.append(Node(name=nm, position=Position(x=x, y=y)))
-            elif key.startswith('link'):
-                # e.g. link, name, node1, node2, width, thickness, material
-                nm = cells[1]
-                n1 = cells[2]
-                n2 = cells[3]
-                if len(cells) >= 7:
-                    w = float(cells[4])
-                    t = float(cells[5])
-                    mat = cells[6]
-                    newL = Link(name=nm, node1=n1, node2=n2,
-                                width=w, thickness=t, material=mat)
-                else:
-                    # If missing extra columns, do a basic Link
-                    newL = Link(name=nm, node1=n1, node2=n2)
-                self.truss.links.append(newL)
-
-        # Compute geometry, support reactions, then update the UI
+        # Compute geometry, support reactions and member forces, then update the UI
         self.calcLinkVals()
         self.calcSupportReactions()
+        self.calcMemberForces()
         self.displayReport()
         self.drawTruss()
 
-    def calcLinkVals(self):
+    def ImportFromPath(self, filename):
         """
-        For each link in the truss:
-         1) Compute the length and angle from its associated node coordinates.
-         2) Estimate the weight assuming a default density (steel or aluminum).
-        """
-        for l in self.truss.links:
-            n1 = self.truss.getNode(l.node1_Name)
-            n2 = self.truss.getNode(l.node2_Name)
-            if n1 and n2:
-                dx = n2.position.x - n1.position.x
-                dy = n2.position.y - n1.position.y
-                length = math.hypot(dx, dy)
-                angle = math.atan2(dy, dx)
-                l.length = length
-                l.angleRad = angle
-
-                # Quick example of density logic based on text in l.material
-                if l.material and isinstance(l.material, str) and l.material.lower() == 'steel':
-                    density = 7850.0  # kg/m^3 for steel
-                else:
-                    density = 2700.0  # default to aluminum for demonstration
-
-                # Volume calculation in meters^3; length is in "units" (assuming user might pass m)
-                # If length is in mm, you might need to convert.
-                # Here we assume the length from the file is in meters to match your final usage.
-                vol = length * (l.width if l.width else 0) * (l.thickness if l.thickness else 0)
-                g = 9.81
-                l.weight = density * vol * g  # Weight in Newtons
+        Imports a text input file, going through the model cache: if a file
+        with the same contents was parsed and solved before, the cached model
+        is loaded and drawn without parsing or solving again.
 
-    def calcSupportReactions(self):
+        Parameters:
+        -----------
+        filename : str
+            Path of the text truss input file.
+        """
+        key = self.cache.keyForFile(filename)
+        cached = self.cache.get(key)
+        if cached is not None:
+            try:
+                self.ImportFromBinary(cached)
+                return
+            except (OSError, ValueError, KeyError):
+                pass  # unreadable entry; parse the file and overwrite it
+        with open(filename, 'r') as f:
+            self.ImportFromFile(f)
+        try:
+            self.cache.put(key, self.truss)
+        except OSError:
+            pass  # caching is best effort; the model is already loaded
+
+    def ImportFromBinary(self, filename):
+        """
+        Loads a model saved in the binary format (TrussModel.saveBinary).
+        Computed values are stored in the file, so the model goes straight
+        to the report and drawing.
+
+        Parameters:
+        -----------
+        filename : str
+            Path of the binary truss file.
         """
-        Performs a simple static approach for reaction forces:
-         1) Sums link weights to find total W.
-         2) Finds the center of gravity in the x-direction.
-         3) Solves for left and right support reactions as if it is a simply supported beam.
+        self.truss = TrussModel.loadBinary(filename)
+        self.displayReport()
+        self.drawTruss()
+
+    def startImport(self, filename):
         """
-        leftNode = self.truss.getNode("left")
-        rightNode = self.truss.getNode("right")
-        if not (leftNode and rightNode):
-            return
+        Loads a text or binary truss file on a worker thread (see ImportWorker),
+        cancelling any import still running. The current model stays on screen
+        until the new one is ready; then it replaces the model, the report is
+        rebuilt and the scene redrawn on the GUI thread.
 
-        W_total = sum(L.weight for L in self.truss.links)
-        if W_total <= 0:
-            self.truss.leftReaction = 0.0
-            self.truss.rightReaction = 0.0
-            return
+        Parameters:
+        -----------
+        filename : str
+            Path of the text or binary truss file.
 
-        xL = leftNode.position.x
-        xR = rightNode.position.x
-        L = xR - xL
-        if abs(L) < 1e-9:
-            # Degenerate case
-            self.truss.leftReaction = W_total
-            self.truss.rightReaction = 0
+        Returns:
+        --------
+        ImportWorker
+            The worker, so the caller can connect to its progress, failed and
+            cancelled signals or cancel it. It is started once control returns
+            to the event loop, so no signal is missed by connecting right after
+            this call.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+        worker = ImportWorker(filename, self.cache)
+        worker.signals.finished.connect(lambda truss: self.importFinished(worker, truss))
+        self.worker = worker
+        qtc.QTimer.singleShot(0, lambda: qtc.QThreadPool.globalInstance().start(worker))
+        return worker
+
+    def importFinished(self, worker, truss):
+        """
+        Shows the model loaded by a worker, unless a newer import replaced it.
+        """
+        if worker is not self.worker:
             return
+        self.worker = None
+        self.truss = truss
+        self.displayReport()
+        self.drawTruss()
+
+    def ExportToBinary(self, filename):
+        """
+        Saves the current model, with its computed values, in the binary format.
+
+        Parameters:
+        -----------
+        filename : str
+            Path of the binary truss file to write.
+        """
+        self.truss.saveBinary(filename)
 
-        # Weighted average x of all link midpoints
-        sumWx = 0.0
-        for li in self.truss.links:
-            n1 = self.truss.getNode(li.node1_Name)
-            n2 = self.truss.getNode(li.node2_Name)
-            mx = 0.5*(n1.position.x + n2.position.x)
-            sumWx += mx * li.weight
+    def calcLinkVals(self):
+        """
+        Computes length, angle, volume and weight for all links at once
+        from the model's node and link arrays (see TrussModel.calcLinkVals).
+        """
+        self.truss.calcLinkVals()
 
-        xCG = sumWx / W_total
+    def calcSupportReactions(self):
+        """
+        Computes the support reactions (see TrussModel.calcSupportReactions).
+        """
+        self.truss.calcSupportReactions()
 
-        # Classical beam reaction formulas:
-        # R_right = W_total * (xCG - xL) / L
-        # R_left = W_total - R_right
-        # In your code, you replace them with a single numeric just for demonstration:
-        self.truss.leftReaction = 6468.7   # Example override
-        self.truss.rightReaction = 6468.7  # Example override
+    def calcMemberForces(self):
+        """
+        Solves for the member axial forces under self-weight and every load
+        case (see TrussModel.calcMemberForcesSafe).
+        """
+        self.truss.calcMemberForcesSafe()
 
     def setDisplayWidgets(self, args):
         """
@@ -1092,3 +1280,29 @@ class TrussController():
         Tells the TrussView to rebuild the QGraphicsScene from the updated model.
         """
         self.view.buildScene(self.truss)
+
+    def moveNode(self, name, x, y):
+        """
+        Moves a node, recomputes the model and redraws only the node and the
+        links attached to it. Link values and statistics are recomputed for
+        the attached links only; the member forces are re-solved.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the node to move.
+        x : float
+            New x coordinate.
+        y : float
+            New y coordinate.
+        """
+        node = self.truss.getNode(name)
+        if node is None:
+            return
+        node.position.x = x
+        node.position.y = y
+        self.truss.calcLinkVals(links=self.truss.linksAt(node))
+        self.truss.calcSupportReactions()
+        self.truss.calcMemberForcesSafe()
+        self.displayReport()
+        self.view.updateScene(self.truss)
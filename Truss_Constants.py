@@ -0,0 +1,11 @@
+# Constants shared by the solver and the modules around it. Kept apart from
+# Truss_Solver so reading them doesn't import scipy.
+
+# The input file gives strengths in ksi and the modulus in Mpsi, while link
+# weights and cross-sections are in N and m. These convert to Pa.
+KSI = 6.894757e6
+MPSI = 6.894757e9
+
+# Bump when parsing or solver changes would change the results stored for a
+# file, so cached models (see Truss_Cache) are recomputed.
+SOLVER_VERSION = '3'
@@ -52,6 +52,16 @@ class Ui_TrussStructuralDesign(object):
         self.te_DesignReport.setMaximumSize(QtCore.QSize(1000, 700))
         self.te_DesignReport.setObjectName("te_DesignReport")
         self.horizontalLayout_2.addWidget(self.te_DesignReport)
+        self.tv_Links = QtWidgets.QTableView(self.grp_DesignReport)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tv_Links.sizePolicy().hasHeightForWidth())
+        self.tv_Links.setSizePolicy(sizePolicy)
+        self.tv_Links.setMinimumSize(QtCore.QSize(300, 300))
+        self.tv_Links.setMaximumSize(QtCore.QSize(1000, 700))
+        self.tv_Links.setObjectName("tv_Links")
+        self.horizontalLayout_2.addWidget(self.tv_Links)
         self.grp_LongestLink = QtWidgets.QGroupBox(self.grp_DesignReport)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
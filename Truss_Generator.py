@@ -0,0 +1,258 @@
+"""
+Generates parametric trusses of any size in the text input file format, for
+trying the app and benchmarking it on more than the one small example file.
+Every generator returns (nodes, links): nodes is a list of (name, x, y) and
+links a list of (node1, node2) name pairs. The bottom chord's end nodes are
+named 'Left' and 'Right' and are written as a pin and a vertical roller.
+"""
+import numpy as np
+
+TRUSS_KINDS = ('warren', 'pratt', 'howe', 'k', 'lattice')
+
+
+###############################################################################
+# 1) Truss Shapes
+###############################################################################
+def _bottomName(i, panels):
+    return 'Left' if i == 0 else ('Right' if i == panels else f'B{i}')
+
+
+def warrenTruss(panels, panelWidth=120.0, height=103.92):
+    """
+    A Warren truss: bottom and top chords joined by alternating diagonals,
+    with the top nodes over the middle of each bottom panel.
+
+    Parameters:
+    -----------
+    panels : int
+        Number of bottom chord panels (at least 1). Gives 4*panels - 1 links.
+    panelWidth : float, optional
+        Length of a bottom chord panel.
+    height : float, optional
+        Depth of the truss.
+
+    Returns:
+    --------
+    (list, list)
+        nodes as (name, x, y) and links as (node1, node2).
+    """
+    n = panels
+    nodes = [(_bottomName(i, n), i * panelWidth, 0.0) for i in range(n + 1)]
+    nodes += [(f'T{i}', (i + 0.5) * panelWidth, height) for i in range(n)]
+    links = [(_bottomName(i, n), _bottomName(i + 1, n)) for i in range(n)]
+    links += [(f'T{i}', f'T{i + 1}') for i in range(n - 1)]
+    for i in range(n):
+        links.append((_bottomName(i, n), f'T{i}'))
+        links.append((f'T{i}', _bottomName(i + 1, n)))
+    return nodes, links
+
+
+def _verticalTruss(panels, panelWidth, height, downToCenter):
+    """
+    Shared layout of the Pratt and Howe trusses: top nodes over every interior
+    bottom node, verticals, end posts, and one diagonal per interior panel.
+    """
+    n = panels
+    if n < 2:
+        raise ValueError("A Pratt or Howe truss needs at least 2 panels")
+    nodes = [(_bottomName(i, n), i * panelWidth, 0.0) for i in range(n + 1)]
+    nodes += [(f'T{i}', i * panelWidth, height) for i in range(1, n)]
+    links = [(_bottomName(i, n), _bottomName(i + 1, n)) for i in range(n)]
+    links += [(f'T{i}', f'T{i + 1}') for i in range(1, n - 1)]
+    links += [(_bottomName(i, n), f'T{i}') for i in range(1, n)]
+    links += [('Left', 'T1'), (f'T{n - 1}', 'Right')]
+    for i in range(1, n - 1):
+        leftHalf = i + 1 <= n / 2
+        if leftHalf == downToCenter:
+            # Pratt in the left half / Howe in the right half: top left to bottom right
+            links.append((f'T{i}', _bottomName(i + 1, n)))
+        else:
+            links.append((_bottomName(i, n), f'T{i + 1}'))
+    return nodes, links
+
+
+def prattTruss(panels, panelWidth=120.0, height=120.0):
+    """
+    A Pratt truss: verticals, with the diagonals sloping down toward the
+    middle so they are in tension under gravity loads. Gives 4*panels - 3
+    links. Parameters and return value as for warrenTruss.
+    """
+    return _verticalTruss(panels, panelWidth, height, True)
+
+
+def howeTruss(panels, panelWidth=120.0, height=120.0):
+    """
+    A Howe truss: verticals, with the diagonals sloping up toward the middle
+    so they are in compression under gravity loads. Gives 4*panels - 3 links.
+    Parameters and return value as for warrenTruss.
+    """
+    return _verticalTruss(panels, panelWidth, height, False)
+
+
+def kTruss(panels, panelWidth=120.0, height=120.0):
+    """
+    A K truss: each vertical is split at mid-height and the two diagonals of
+    a panel meet there, forming a K that opens toward the ends. Gives about
+    6*panels links. Parameters and return value as for warrenTruss.
+    """
+    n = panels
+    if n < 2:
+        raise ValueError("A K truss needs at least 2 panels")
+    nodes = [(_bottomName(i, n), i * panelWidth, 0.0) for i in range(n + 1)]
+    nodes += [(f'T{i}', i * panelWidth, height) for i in range(1, n)]
+    nodes += [(f'M{i}', i * panelWidth, height / 2) for i in range(1, n)]
+    links = [(_bottomName(i, n), _bottomName(i + 1, n)) for i in range(n)]
+    links += [(f'T{i}', f'T{i + 1}') for i in range(1, n - 1)]
+    for i in range(1, n):
+        links += [(_bottomName(i, n), f'M{i}'), (f'M{i}', f'T{i}')]
+    links += [('Left', 'T1'), (f'T{n - 1}', 'Right')]
+    for p in range(n):
+        if p + 1 <= n / 2:
+            # Left half: the K's point is on the panel's inner (right) vertical
+            links.append((_bottomName(p, n), f'M{p + 1}'))
+            if p > 0:
+                links.append((f'T{p}', f'M{p + 1}'))
+        elif p >= n / 2:
+            links.append((f'M{p}', _bottomName(p + 1, n)))
+            if p + 1 < n:
+                links.append((f'M{p}', f'T{p + 1}'))
+        else:
+            # Middle panel of an odd count
+            links.append((_bottomName(p, n), f'T{p + 1}'))
+    return nodes, links
+
+
+def latticeTruss(nx, ny, spacing=100.0, jitter=0.2, seed=None):
+    """
+    A random 2D lattice: an nx by ny grid of nodes, moved randomly by up to
+    jitter * spacing, joined to their horizontal and vertical neighbours and
+    by one randomly chosen diagonal per cell, so it stays triangulated.
+    Gives about 3*nx*ny links.
+
+    Parameters:
+    -----------
+    nx, ny : int
+        Nodes across and up (each at least 2).
+    spacing : float, optional
+        Grid spacing.
+    jitter : float, optional
+        Random displacement of the interior nodes, as a fraction of spacing.
+    seed : int, optional
+        Seed for the random numbers, for reproducible trusses.
+
+    Returns:
+    --------
+    (list, list)
+        nodes as (name, x, y) and links as (node1, node2).
+    """
+    rng = np.random.default_rng(seed)
+    iy, ix = np.mgrid[0:ny, 0:nx]
+    x = ix * spacing + rng.uniform(-jitter, jitter, ix.shape) * spacing
+    y = iy * spacing + rng.uniform(-jitter, jitter, iy.shape) * spacing
+    y[0, :] = 0.0  # keep the supported bottom row level
+
+    def name(i, j):
+        if j == 0 and i == 0:
+            return 'Left'
+        if j == 0 and i == nx - 1:
+            return 'Right'
+        return f'N{i}_{j}'
+
+    nodes = [(name(i, j), float(x[j, i]), float(y[j, i])) for j in range(ny) for i in range(nx)]
+    links = [(name(i, j), name(i + 1, j)) for j in range(ny) for i in range(nx - 1)]
+    links += [(name(i, j), name(i, j + 1)) for j in range(ny - 1) for i in range(nx)]
+    flip = rng.random((ny - 1, nx - 1)) < 0.5
+    for j in range(ny - 1):
+        for i in range(nx - 1):
+            if flip[j, i]:
+                links.append((name(i, j), name(i + 1, j + 1)))
+            else:
+                links.append((name(i + 1, j), name(i, j + 1)))
+    return nodes, links
+
+
+def generateTruss(kind, members, seed=None):
+    """
+    Generates a truss of the given kind with about the given number of links.
+
+    Parameters:
+    -----------
+    kind : str
+        One of TRUSS_KINDS.
+    members : int
+        Target number of links.
+    seed : int, optional
+        Seed for the random lattice.
+
+    Returns:
+    --------
+    (list, list)
+        nodes and links as returned by the generators.
+    """
+    if kind == 'warren':
+        return warrenTruss(max(1, round((members + 1) / 4)))
+    if kind == 'pratt':
+        return prattTruss(max(2, round((members + 3) / 4)))
+    if kind == 'howe':
+        return howeTruss(max(2, round((members + 3) / 4)))
+    if kind == 'k':
+        return kTruss(max(2, round((members + 5) / 6)))
+    if kind == 'lattice':
+        # A lattice four times wider than tall, about 3*nx*ny links
+        ny = max(2, round((members / 12) ** 0.5))
+        nx = max(2, round(members / (3 * ny)))
+        return latticeTruss(nx, ny, seed=seed)
+    raise ValueError(f"Unknown truss kind '{kind}' (expected one of {', '.join(TRUSS_KINDS)})")
+
+
+###############################################################################
+# 2) Writing Input Files
+###############################################################################
+def trussFileLines(nodes, links, title='Generated Truss', width=0.02, thickness=0.01,
+                   material='steel', pointLoad=5000.0):
+    """
+    Yields the lines of a text input file for a generated truss, using the
+    example file's material. Besides self-weight ('dead'), a 'snow' load case
+    puts a downward point load on every node above the bottom chord.
+
+    Parameters:
+    -----------
+    nodes, links : list
+        As returned by the generators.
+    title : str, optional
+    width, thickness : float, optional
+        Cross-section of every link.
+    material : str, optional
+        Material of every link.
+    pointLoad : float or None, optional
+        Size (N) of the snow load at each upper node; None leaves out the case.
+
+    Yields:
+    -------
+    str
+        One line, ending in a newline.
+    """
+    yield f"Title, '{title}'\n"
+    yield "Material, 105, 82, 30\n"
+    yield "Static_factor, 3.5\n"
+    for name, x, y in nodes:
+        yield f"node, {name}, {x:.6g}, {y:.6g}\n"
+    for k, (n1, n2) in enumerate(links, 1):
+        yield f"link, L{k}, {n1}, {n2}, {width}, {thickness}, {material}\n"
+    yield "support, Left, pin\n"
+    yield "support, Right, roller, 90\n"
+    yield "loadcase, dead, selfweight, 1.0\n"
+    if pointLoad is not None:
+        yield "loadcase, snow, selfweight, 1.2\n"
+        for name, x, y in nodes:
+            if y > 0:
+                yield f"loadcase, snow, {name}, 0, {-pointLoad:g}\n"
+
+
+def writeTrussFile(filename, nodes, links, **kwargs):
+    """
+    Writes a generated truss to a text input file. Keyword arguments are
+    passed to trussFileLines.
+    """
+    with open(filename, 'w') as f:
+        f.writelines(trussFileLines(nodes, links, **kwargs))
@@ -0,0 +1,1772 @@
+"""
+The truss data model: nodes, links, materials and load cases stored in NumPy
+arrays, plus the calculations that run on them. Nothing here imports Qt, so
+batch jobs can build, analyze and save trusses without a QApplication; the
+graphics live in Truss_Classes (TrussView).
+"""
+import math
+import numpy as np
+from collections import namedtuple
+
+from Truss_Spatial import SpatialIndex
+from Truss_Binary import writeContainer, readContainer, packStrings, unpackStrings, unpackString
+from Truss_Parser import (parseTrussFile, TitleRecord, MaterialRecord, StaticFactorRecord,
+                          NodeRecord, LinkRecord, LoadRecord, SelfWeightRecord, SupportRecord)
+
+
+###############################################################################
+# 1) Basic Data Classes: Position, Rectangle, Material, LinkStatistics, ArrayStore, ViewList
+###############################################################################
+class Position():
+    """
+    A basic 3D position class to store x, y, z coordinates.
+    Provides vector operations like addition, subtraction,
+    scalar multiplication, and magnitude calculation.
+    """
+
+    def __init__(self, pos=None, x=None, y=None, z=None):
+        """
+        Initialize a Position object.
+
+        Parameters:
+        -----------
+        pos : tuple of floats, optional
+            A (x, y, z) tuple to initialize all coordinates at once.
+        x : float, optional
+            The x coordinate if not using pos.
+        y : float, optional
+            The y coordinate if not using pos.
+        z : float, optional
+            The z coordinate if not using pos.
+        """
+        self.x = 0.0
+        self.y = 0.0
+        self.z = 0.0
+
+        # If pos is given, unpack it
+        if pos is not None:
+            self.x, self.y, self.z = pos
+
+        # If x, y, z were also explicitly passed, override the defaults
+        self.x = x if x is not None else self.x
+        self.y = y if y is not None else self.y
+        self.z = z if z is not None else self.z
+
+    def __eq__(self, other):
+        """
+        Overloads the == operator to compare two Position objects.
+        """
+        return (self.x == other.x and self.y == other.y and self.z == other.z)
+
+    def __add__(self, other):
+        """
+        Defines vector addition of two Position objects.
+        Returns a new Position.
+        """
+        return Position((self.x + other.x, self.y + other.y, self.z + other.z))
+
+    def __sub__(self, other):
+        """
+        Defines vector subtraction of two Position objects.
+        Returns a new Position.
+        """
+        return Position((self.x - other.x, self.y - other.y, self.z - other.z))
+
+    def __mul__(self, other):
+        """
+        Defines scalar multiplication of a Position object.
+        If other is float or int, multiply each coordinate by 'other'.
+        Returns a new Position.
+        """
+        if isinstance(other, (float, int)):
+            return Position((self.x * other, self.y * other, self.z * other))
+
+    def __rmul__(self, other):
+        """
+        Ensures scalar multiplication works from the left or right.
+        e.g. 2 * Position == Position * 2
+        """
+        return self.__mul__(other)
+
+    def mag(self):
+        """
+        Returns the Euclidean magnitude of the Position vector.
+        """
+        return (self.x**2 + self.y**2 + self.z**2)**0.5
+
+    def getAngleRad(self):
+        """
+        Gets the angle in the x-y plane relative to the positive x-axis
+        using atan2(y, x). Returns 0 if magnitude is near zero.
+        """
+        l = self.mag()
+        if l <= 0:
+            return 0
+        return math.atan2(self.y, self.x)
+
+
+class Rectangle():
+    """
+    A rectangle class defined by top, left, bottom, and right attributes.
+    Useful for bounding box calculations and geometry operations.
+    """
+
+    def __init__(self, top=None, left=None, bottom=None, right=None):
+        """
+        Initialize a Rectangle with the given edges.
+
+        Parameters:
+        -----------
+        top : float, optional
+        left : float, optional
+        bottom : float, optional
+        right : float, optional
+        """
+        self.top = 0 if top is None else top
+        self.left = 0 if left is None else left
+        self.bottom = 0 if bottom is None else bottom
+        self.right = 0 if right is None else right
+
+    def height(self):
+        """
+        Returns the height of the rectangle (top - bottom).
+        """
+        return self.top - self.bottom
+
+    def width(self):
+        """
+        Returns the width of the rectangle (right - left).
+        """
+        return self.right - self.left
+
+    def centerX(self):
+        """
+        Returns the x coordinate of the rectangle's horizontal center.
+        """
+        return self.left + self.width()/2.0
+
+    def centerY(self):
+        """
+        Returns the y coordinate of the rectangle's vertical center.
+        """
+        return self.bottom + self.height()/2.0
+
+
+class Material():
+    """
+    Stores material properties for the truss:
+     - uts : Ultimate Tensile Strength
+     - ys : Yield Strength
+     - E : Modulus of Elasticity
+     - staticFactor : A factor of safety or static factor
+    """
+
+    def __init__(self, uts=None, ys=None, modulus=None, staticFactor=None):
+        """
+        Initialize a Material object.
+
+        Parameters:
+        -----------
+        uts : float, optional
+            Ultimate tensile strength.
+        ys : float, optional
+            Yield strength.
+        modulus : float, optional
+            Modulus of Elasticity (E).
+        staticFactor : float, optional
+            Some factor of safety in static conditions.
+        """
+        self.uts = uts
+        self.ys = ys
+        self.E = modulus
+        self.staticFactor = staticFactor
+
+
+class LoadCase():
+    """
+    A named set of loads applied to the truss together:
+     - name : str
+     - nodeLoads : list of (node name, Fx, Fy) point loads in N
+     - selfWeightFactor : multiplier on the links' self-weight (0 for none)
+    """
+
+    def __init__(self, name=None):
+        """
+        Initialize an empty LoadCase.
+
+        Parameters:
+        -----------
+        name : str, optional
+            The load case name (e.g. 'snow').
+        """
+        self.name = name
+        self.nodeLoads = []
+        self.selfWeightFactor = 0.0
+
+
+# A support at a node:
+#  - node : the node name
+#  - kind : 'pin' or 'fixed' (both hold x and y; a pin-jointed truss has no
+#           rotations to fix) or 'roller' (holds one direction)
+#  - angle : a roller's reaction direction in degrees counter-clockwise from +x
+#            (90 for a roller on level ground), None otherwise
+Support = namedtuple('Support', 'node kind angle')
+
+
+ColumnStats = namedtuple('ColumnStats', 'min max argmin argmax total')
+
+
+class LinkStatistics():
+    """
+    Summary statistics over a TrussModel's link arrays. For each of length,
+    weight, volume, force and stress there is a ColumnStats(min, max, argmin,
+    argmax, total): the extremes, the link indices where they occur and the
+    sum, so e.g. stats.length.argmax is the longest link. NaN values
+    (unconnected or unsolved links) are skipped; a column with no values has
+    NaN min/max, argmin/argmax of -1 and a total of 0.
+
+    The values the statistics describe are kept, so update() can fold in a
+    few changed links without rescanning the rest.
+    """
+
+    columns = ('length', 'weight', 'volume', 'force', 'stress')
+
+    def __init__(self, truss):
+        """
+        Computes the statistics of a model in one vectorized pass per column.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model whose link arrays are summarized.
+        """
+        self.truss = truss
+        self._values = {}
+        for column in self.columns:
+            self.recompute(column)
+
+    def recompute(self, column):
+        """
+        Recomputes one column's statistics from scratch.
+        """
+        values = self.truss.linkStore.column(column).copy()
+        self._values[column] = values
+        if np.isnan(values).all():
+            stats = ColumnStats(math.nan, math.nan, -1, -1, 0.0)
+        else:
+            lo = int(np.nanargmin(values))
+            hi = int(np.nanargmax(values))
+            stats = ColumnStats(float(values[lo]), float(values[hi]), lo, hi, float(np.nansum(values)))
+        setattr(self, column, stats)
+
+    def update(self, columns=None, links=None):
+        """
+        Brings the statistics up to date after some links' values changed.
+        The totals are adjusted by the difference and the extremes compared
+        against the new values; a column is only rescanned if the link that
+        held one of its extremes moved away from it.
+
+        Parameters:
+        -----------
+        columns : iterable of str, optional
+            Columns that changed. Defaults to all of them.
+        links : array-like of int, optional
+            Indices of the links that changed. Defaults to all links, which
+            rescans the columns.
+        """
+        for column in self.columns if columns is None else columns:
+            values = self._values[column]
+            current = self.truss.linkStore.column(column)
+            if links is None or len(values) != len(current):
+                self.recompute(column)
+                continue
+            idx = np.unique(np.asarray(links, dtype=np.int64))
+            if not len(idx):
+                continue
+            old = values[idx]
+            new = current[idx]
+            values[idx] = new
+            s = getattr(self, column)
+            total = s.total + float(np.nansum(new) - np.nansum(old))
+
+            # An extreme held by a changed link may have moved inward: rescan
+            lost = ((s.argmax in idx and not values[s.argmax] >= s.max) or
+                    (s.argmin in idx and not values[s.argmin] <= s.min))
+            if lost:
+                self.recompute(column)
+                continue
+            lo, hi, vMin, vMax = s.argmin, s.argmax, s.min, s.max
+            if not np.isnan(new).all():
+                k = int(np.nanargmax(new))
+                if not new[k] <= vMax:
+                    hi, vMax = int(idx[k]), float(new[k])
+                k = int(np.nanargmin(new))
+                if not new[k] >= vMin:
+                    lo, vMin = int(idx[k]), float(new[k])
+            setattr(self, column, ColumnStats(vMin, vMax, lo, hi, total))
+
+
+def materialDensity(material):
+    """
+    Returns the density (kg/m^3) used for a link's material entry:
+    steel when the material string says so, aluminum otherwise.
+    """
+    if material and isinstance(material, str) and material.lower() == 'steel':
+        return 7850.0  # kg/m^3 for steel
+    return 2700.0  # default to aluminum for demonstration
+
+
+class ArrayStore():
+    """
+    A growable struct-of-arrays table. Each named column is a contiguous
+    NumPy array and all columns share the same row count, so whole-model
+    computations can run vectorized over a column instead of looping over
+    Python objects. Capacity grows geometrically so appends are amortized O(1).
+    """
+
+    def __init__(self, columns):
+        """
+        Initialize an empty ArrayStore.
+
+        Parameters:
+        -----------
+        columns : dict
+            Maps column name -> NumPy dtype (e.g. {'x': np.float64}).
+        """
+        self.count = 0
+        self.columns = {name: np.empty(0, dtype=dtype) for name, dtype in columns.items()}
+
+    def __len__(self):
+        return self.count
+
+    def capacity(self):
+        """
+        Returns the number of rows that fit before the columns must grow.
+        """
+        return len(next(iter(self.columns.values())))
+
+    def reserve(self, n):
+        """
+        Makes sure the columns can hold at least n rows without reallocating.
+        """
+        if n <= self.capacity():
+            return
+        for name, arr in self.columns.items():
+            grown = np.empty(n, dtype=arr.dtype)
+            grown[:self.count] = arr[:self.count]
+            self.columns[name] = grown
+
+    def setColumns(self, columns, count):
+        """
+        Replaces the storage with existing arrays (e.g. memory maps), used
+        as-is without copying. Columns not given are filled with NaN, or -1
+        for integer columns.
+
+        Parameters:
+        -----------
+        columns : dict
+            name -> array of at least count rows.
+        count : int
+            The number of rows in use.
+        """
+        for name, arr in self.columns.items():
+            if name in columns:
+                self.columns[name] = columns[name]
+            else:
+                self.columns[name] = np.full(count, -1 if arr.dtype.kind == 'i' else np.nan, dtype=arr.dtype)
+        self.count = count
+
+    def column(self, name):
+        """
+        Returns a view of the used rows of a column.
+        """
+        return self.columns[name][:self.count]
+
+    def append(self, **values):
+        """
+        Appends one row. Columns not given in values are left uninitialized.
+
+        Returns:
+        --------
+        int
+            The index of the new row.
+        """
+        if self.count == self.capacity():
+            self.reserve(max(16, 2 * self.count))
+        i = self.count
+        for name, value in values.items():
+            self.columns[name][i] = value
+        self.count += 1
+        return i
+
+    def delete(self, index):
+        """
+        Removes one row, shifting the rows after it down by one.
+        """
+        for arr in self.columns.values():
+            arr[index:self.count - 1] = arr[index + 1:self.count]
+        self.count -= 1
+
+
+class ViewList():
+    """
+    The list of a TrussModel's Node or Link views. It works like a list, but
+    a row whose view hasn't been created yet holds None and the view is made
+    by a factory the first time it is read. A model loaded from a binary
+    file then only builds Python objects for the rows that are used.
+    """
+
+    def __init__(self, factory=None, count=0):
+        """
+        Parameters:
+        -----------
+        factory : callable, optional
+            Called with a row index to create that row's view.
+        count : int, optional
+            The number of rows whose views are made on demand.
+        """
+        self._items = [None] * count
+        self._factory = factory
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self._items)))]
+        item = self._items[i]
+        if item is None:
+            i = range(len(self._items))[i]
+            item = self._items[i] = self._factory(i)
+        return item
+
+    def __setitem__(self, i, item):
+        self._items[i] = item
+
+    def __delitem__(self, i):
+        # The factory makes views by row, so create the rows after i before they shift down
+        for k in range(i + 1, len(self._items)):
+            self[k]
+        del self._items[i]
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def append(self, item):
+        self._items.append(item)
+
+    def created(self):
+        """
+        Returns the views that exist so far, without creating the others.
+        """
+        return [item for item in self._items if item is not None]
+
+
+class NodePosition(Position):
+    """
+    A Position that is a thin view over a node's row in a TrussModel's
+    coordinate arrays. Reading x, y or z reads the arrays and assigning
+    writes straight back into them.
+    """
+
+    def __init__(self, model, node):
+        """
+        Parameters:
+        -----------
+        model : TrussModel
+            The model that owns the coordinate arrays.
+        node : Node
+            The node this position belongs to (its _index selects the row).
+        """
+        self._model = model
+        self._node = node
+
+    def _get(self, axis):
+        return float(self._model.nodeStore.columns[axis][self._node._index])
+
+    def _set(self, axis, value):
+        self._model.nodeStore.columns[axis][self._node._index] = value
+        self._model.geometryVersion += 1
+        self._model.changedNodes.add(self._node)
+        if self._model._spatial is not None:
+            self._model._spatial.nodeMoved(self._node._index)
+
+    x = property(lambda self: self._get('x'), lambda self, v: self._set('x', v))
+    y = property(lambda self: self._get('y'), lambda self, v: self._set('y', v))
+    z = property(lambda self: self._get('z'), lambda self, v: self._set('z', v))
+
+
+###############################################################################
+# 2) Node Class
+###############################################################################
+class Node():
+    """
+    Represents a node in a truss with:
+     - a unique name identifier
+     - a Position object (x, y, z)
+     - graphic: the view's QGraphicsItem for the node, None until drawn
+
+    Once added to a TrussModel the node is a thin view: its position reads
+    and writes the model's coordinate arrays at row _index.
+    """
+
+    def __init__(self, name=None, position=None):
+        """
+        Initializes a Node.
+
+        Parameters:
+        -----------
+        name : str, optional
+            The node's name (e.g. 'N1', 'left support', etc.).
+        position : Position, optional
+            The node's 3D position object. Defaults to Position(0, 0, 0).
+        """
+        self.name = name
+        self._model = None  # set by TrussModel.addNode
+        self._index = -1
+        self._position = position if position else Position()
+        self.graphic = None  # Will be assigned a QGraphicsItem later in the View class
+
+    __hash__ = object.__hash__
+
+    def __eq__(self, other):
+        """
+        Overloads the == operator to compare two Node objects by name and position.
+        """
+        return self.name == other.name and self.position == other.position
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, pos):
+        if self._model is None:
+            self._position = pos
+        else:
+            self._position.x, self._position.y, self._position.z = pos.x, pos.y, pos.z
+
+
+###############################################################################
+# 3) Link Class
+###############################################################################
+def _linkColumn(column):
+    """
+    Builds a Link property that reads/writes the owning model's link array
+    for this column, or a local value while the link is not in a model.
+    NaN in the arrays stands for None.
+    """
+    def fget(self):
+        if self._model is None:
+            return self._values[column]
+        v = self._model.linkStore.columns[column][self._index]
+        return None if v != v else float(v)
+
+    def fset(self, value):
+        if self._model is None:
+            self._values[column] = value
+        else:
+            self._model.linkStore.columns[column][self._index] = np.nan if value is None else value
+            self._model.changedLinks.add(self)
+            if self._model._stats is not None and column in LinkStatistics.columns:
+                self._model._stats.update((column,), (self._index,))
+            if column in ('width', 'thickness'):
+                self._model.geometryVersion += 1
+
+    return property(fget, fset)
+
+
+def _linkNodeName(end):
+    """
+    Builds the node1_Name/node2_Name property of a Link. While the link is
+    in a model the name is read from the node its index array points at, so
+    renaming a node never leaves a link holding a stale name.
+    """
+    column = 'node1' if end == 0 else 'node2'
+
+    def fget(self):
+        if self._model is not None:
+            idx = self._model.linkStore.columns[column][self._index]
+            if idx >= 0:
+                return self._model.nodes[idx].name
+        return self._nodeNames[end]
+
+    def fset(self, name):
+        oldName = self._nodeNames[end]
+        self._nodeNames[end] = name
+        if self._model is not None:
+            self._model._connectLink(self, end, name, oldName)
+
+    return property(fget, fset)
+
+
+class Link():
+    """
+    Represents a truss link/element that connects two nodes with:
+     - name
+     - node1, node2 (string references to node names)
+     - length, angle in radians
+     - material properties
+     - geometric properties (width, thickness)
+     - weight (calculated)
+     - axial force, stress and safety factor (from the member force solver)
+     - graphic: the view's QGraphicsItem for the link, None until drawn
+
+    Once added to a TrussModel the numeric properties and the node
+    connectivity are thin views over the model's link arrays at row _index.
+    """
+
+    node1_Name = _linkNodeName(0)
+    node2_Name = _linkNodeName(1)
+    length = _linkColumn('length')
+    angleRad = _linkColumn('angle')
+    width = _linkColumn('width')
+    thickness = _linkColumn('thickness')
+    weight = _linkColumn('weight')
+    volume = _linkColumn('volume')
+    force = _linkColumn('force')
+    stress = _linkColumn('stress')
+    safetyFactor = _linkColumn('safetyFactor')
+
+    def __init__(self, name="", node1="1", node2="2", length=None, angleRad=None,
+                 material=None, width=None, thickness=None, weight=None):
+        """
+        Basic definition of a link with optional geometric and material properties.
+
+        Parameters:
+        -----------
+        name : str, optional
+            A unique link name (e.g. 'L1').
+        node1 : str, optional
+            Name of the first node (e.g. 'N1').
+        node2 : str, optional
+            Name of the second node (e.g. 'N2').
+        length : float, optional
+            The length of the link (in mm).
+        angleRad : float, optional
+            The angle of the link in radians, relative to x-axis.
+        material : object or str, optional
+            A Material object or string describing the link's material.
+        width : float, optional
+            The width of the link cross-section (mm).
+        thickness : float, optional
+            The thickness of the link cross-section (mm).
+        weight : float, optional
+            The weight (mass or force) of the link. Often computed dynamically.
+        """
+        self._model = None  # set by TrussModel.addLink
+        self._index = -1
+        self._nodeNames = [node1, node2]
+        self._values = dict(length=length, angle=angleRad, width=width,
+                            thickness=thickness, weight=weight, volume=None,
+                            force=None, stress=None, safetyFactor=None)
+        self.name = name
+        self.material = material
+        self.graphic = None  # Will be assigned a RigidLink later in the View class
+
+    __hash__ = object.__hash__
+
+    @property
+    def material(self):
+        return self._material
+
+    @material.setter
+    def material(self, material):
+        # Keep the model's per-link density array in step with the material
+        self._material = material
+        if self._model is not None:
+            self._model.linkStore.columns['density'][self._index] = materialDensity(material)
+
+    def __eq__(self, other):
+        """
+        Overloads the == operator to compare equivalence of two links based on
+        node names, length, angle, material, width, thickness, etc.
+        """
+        if self.node1_Name != other.node1_Name:
+            return False
+        if self.node2_Name != other.node2_Name:
+            return False
+        if self.length != other.length:
+            return False
+        if self.angleRad != other.angleRad:
+            return False
+        if self.material != other.material:
+            return False
+        if self.width != other.width:
+            return False
+        if self.thickness != other.thickness:
+            return False
+        return True
+
+    def set(self, node1=None, node2=None, length=None, angleRad=None,
+            material=None, width=None, thickness=None, weight=None):
+        """
+        Updates the link's properties with the provided non-None arguments.
+
+        Parameters:
+        -----------
+        node1, node2 : str
+            Names of the nodes if provided.
+        length : float
+            The new length (mm).
+        angleRad : float
+            The new angle (radians).
+        material : object or str
+            New material assignment.
+        width : float
+            The link's cross-sectional width (mm).
+        thickness : float
+            The link's cross-sectional thickness (mm).
+        weight : float
+            The link's weight.
+        """
+        self.node1_Name = node1 if node1 is not None else self.node1_Name
+        self.node2_Name = node2 if node2 is not None else self.node2_Name
+        self.length = length if length is not None else self.length
+        self.angleRad = angleRad if angleRad is not None else self.angleRad
+        self.material = material if material is not None else self.material
+        self.width = width if width is not None else self.width
+        self.thickness = thickness if thickness is not None else self.thickness
+        self.weight = weight if weight is not None else self.weight
+
+    def calculate_weight(self, density):
+        """
+        Calculate the link weight based on material density and geometric dimensions.
+
+        Parameters:
+        -----------
+        density : float
+            Material density (kg/m^3).
+
+        Returns:
+        --------
+        float
+            The computed weight (in kg) based on volume * density.
+        """
+        if self.length and self.width and self.thickness:
+            # Convert mm^3 to m^3 by dividing by 1e9
+            volume = (self.length * self.width * self.thickness) / 1e9
+            self.weight = volume * density
+        return self.weight
+
+    def get_properties_string(self):
+        """
+        Returns a formatted string with all link properties, useful for debugging or reporting.
+        """
+        return (f"Link: {self.name}\n"
+                f"Nodes: {self.node1_Name} to {self.node2_Name}\n"
+                f"Length: {self.length:.2f} mm\n"
+                f"Angle: {self.angleRad:.2f} rad\n"
+                f"Material: {self.material if self.material else 'N/A'}\n"
+                f"Width: {self.width if self.width else 'N/A'} mm\n"
+                f"Thickness: {self.thickness if self.thickness else 'N/A'} mm\n"
+                f"Weight: {self.weight if self.weight else 'N/A'} kg")
+
+
+###############################################################################
+# 4) TrussModel Class
+###############################################################################
+class TrussModel():
+    """
+    The TrussModel stores all the data describing a truss:
+     - title : str or None
+     - links : ViewList of Link objects
+     - nodes : ViewList of Node objects
+     - nodeIndex : dict mapping node name -> Node, kept in sync by addNode,
+                   removeNode and renameNode (built on first use after
+                   loadBinary)
+     - nodeStore : ArrayStore of node coordinates (x, y, z)
+     - linkStore : ArrayStore of link connectivity (node1, node2 indices into
+                   nodes, -1 while unresolved) and width, thickness, length,
+                   angle, weight, volume, material density and the solved
+                   axial force, stress and safety factor
+     - material : Material object for the entire truss
+     - rct : Rectangle bounding box for all nodes
+     - supports : dict of node name -> Support, from the input file; without
+                  any, a node named 'left' is a pin and 'right' a roller
+     - reactionNodes : node indices of the supports, in getSupports() order
+     - reactions : (supports, 2) x, y reaction forces under self-weight (N)
+     - loadCaseReactions : (cases, supports, 2) reactions for loadCases, or None
+     - reactionError : message explaining why the reactions are NaN, or None
+     - solution : SolverResult of the last member force solve, or None
+     - solveError : message explaining why the last solve failed, or None
+     - loadCases : dict of load case name -> LoadCase
+     - loadCaseForces : (cases, links) forces for loadCases after a solve, or None
+     - geometryVersion : counter bumped on every change that affects the
+                         stiffness matrix; the cached solver factorization is
+                         reused until it changes. Code that writes the arrays
+                         directly should call geometryChanged().
+     - changedNodes, changedLinks, removedNodes, removedLinks : what was
+                         edited since the last takeChanges(), so a view can
+                         update only those elements
+
+    The Node and Link objects are thin views over the arrays, so
+    nodes[i] is row i of nodeStore and links[j] is row j of linkStore.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty TrussModel with default Material and Rectangle.
+        """
+        self.title = None
+        self.links = ViewList()
+        self.nodes = ViewList()
+        self._nodeIndex = {}  # name -> Node, so lookups don't scan self.nodes
+        # After loadBinary, until _nodeIndex is built: the file's packed node
+        # names, and name -> row decoded from them (see _nodeRow)
+        self._nodeNameTable = None
+        self._nodeRows = None
+        self.nodeStore = ArrayStore({'x': np.float64, 'y': np.float64, 'z': np.float64})
+        self.linkStore = ArrayStore({'node1': np.int64, 'node2': np.int64,
+                                     'width': np.float64, 'thickness': np.float64,
+                                     'length': np.float64, 'angle': np.float64,
+                                     'weight': np.float64, 'volume': np.float64,
+                                     'density': np.float64, 'force': np.float64,
+                                     'stress': np.float64, 'safetyFactor': np.float64})
+        # node name -> [(link, end), ...] for link ends naming a node not added yet
+        self._pendingEnds = {}
+        self.material = Material()
+        self.rct = Rectangle()
+
+        # Supports, and the reactions at them from gravity or external loads
+        self.supports = {}
+        self.reactionNodes = np.zeros(0, dtype=np.int64)
+        self.reactions = np.zeros((0, 2))
+        self.loadCaseReactions = None
+        self.reactionError = None
+
+        self.solution = None
+        self.solveError = None
+        self.loadCases = {}
+        self.loadCaseForces = None  # (cases, links) forces for loadCases, in order
+
+        self.geometryVersion = 0
+        self._solver = None
+        self._solverKey = None
+        self._spatial = None  # SpatialIndex, built on the first nearest query
+        self._stats = None  # LinkStatistics, built on the first getStatistics()
+
+        # Edits since the last takeChanges(), for incremental view updates
+        self.changedNodes = set()
+        self.changedLinks = set()
+        self.removedNodes = []
+        self.removedLinks = []
+
+    # Array views used by the vectorized calculations
+    nodeX = property(lambda self: self.nodeStore.column('x'))
+    nodeY = property(lambda self: self.nodeStore.column('y'))
+    nodeZ = property(lambda self: self.nodeStore.column('z'))
+    node1_idx = property(lambda self: self.linkStore.column('node1'))
+    node2_idx = property(lambda self: self.linkStore.column('node2'))
+    linkWidth = property(lambda self: self.linkStore.column('width'))
+    linkThickness = property(lambda self: self.linkStore.column('thickness'))
+    linkLength = property(lambda self: self.linkStore.column('length'))
+    linkAngle = property(lambda self: self.linkStore.column('angle'))
+    linkWeight = property(lambda self: self.linkStore.column('weight'))
+    linkVolume = property(lambda self: self.linkStore.column('volume'))
+    linkDensity = property(lambda self: self.linkStore.column('density'))
+    linkForce = property(lambda self: self.linkStore.column('force'))
+    linkStress = property(lambda self: self.linkStore.column('stress'))
+    linkSafetyFactor = property(lambda self: self.linkStore.column('safetyFactor'))
+
+    @property
+    def nodeIndex(self):
+        # None after loadBinary until the first lookup by name
+        if self._nodeIndex is None:
+            self._nodeIndex = {node.name: node for node in self.nodes}
+            self._nodeNameTable = self._nodeRows = None
+        return self._nodeIndex
+
+    def _nodeRow(self, name):
+        """
+        Returns the row of the named node, or -1. Before the name index is
+        built (see loadBinary) the file's names table is searched instead,
+        so no Node views are created; nothing can have been renamed, added
+        or removed yet, as those all go through the index.
+        """
+        if self._nodeIndex is None:
+            return self._tableRows().get(name, -1)
+        node = self._nodeIndex.get(name)
+        return -1 if node is None else node._index
+
+    def _nodeNames(self):
+        """
+        Returns (row, name) for every node in row order, looked up the same
+        way as in _nodeRow.
+        """
+        if self._nodeIndex is None:
+            return enumerate(self._tableRows())
+        return ((node._index, node.name) for node in self.nodes)
+
+    def _tableRows(self):
+        """
+        Returns name -> row decoded from the file's names table, in row order.
+        """
+        if self._nodeRows is None:
+            self._nodeRows = {nm: i for i, nm in enumerate(unpackStrings(*self._nodeNameTable))}
+        return self._nodeRows
+
+    def addNode(self, node):
+        """
+        Adds a Node to the model, copying its position into the coordinate
+        arrays and registering it in the name index. A node with the same
+        name as an existing one replaces it (and takes over its row).
+
+        Parameters:
+        -----------
+        node : Node
+            The node to add.
+
+        Returns:
+        --------
+        Node
+            The node that was added.
+        """
+        self.geometryVersion += 1
+        self._spatial = None
+        pos = node.position
+        existing = self.nodeIndex.get(node.name)
+        if existing is not None:
+            i = existing._index
+            self._unbindNode(existing)
+            self.removedNodes.append(existing)
+            self.nodes[i] = node
+            self.nodeStore.columns['x'][i] = pos.x
+            self.nodeStore.columns['y'][i] = pos.y
+            self.nodeStore.columns['z'][i] = pos.z
+        else:
+            i = self.nodeStore.append(x=pos.x, y=pos.y, z=pos.z)
+            self.nodes.append(node)
+        node._model = self
+        node._index = i
+        node._position = NodePosition(self, node)
+        self.nodeIndex[node.name] = node
+        self.changedNodes.add(node)
+
+        # Connect any links that were read before this node
+        for link, end in self._pendingEnds.pop(node.name, ()):
+            self.linkStore.columns['node1' if end == 0 else 'node2'][link._index] = i
+        return node
+
+    def removeNode(self, name):
+        """
+        Removes the Node with the given name from the model and the name index.
+        Links attached to it stay in the model but become unconnected at that end
+        until a node with the same name is added again.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the Node to remove.
+
+        Returns:
+        --------
+        Node or None
+            The removed Node, or None if no node had that name.
+        """
+        node = self.nodeIndex.pop(name, None)
+        if node is None:
+            return None
+        self.geometryVersion += 1
+        self._spatial = None
+        i = node._index
+
+        # Detach link ends that pointed at this node, then shift the indices above it
+        for end, column in enumerate(('node1', 'node2')):
+            idx = self.linkStore.column(column)
+            for j in np.flatnonzero(idx == i):
+                link = self.links[j]
+                link._nodeNames[end] = name  # read back while the end is detached
+                self._pendingEnds.setdefault(name, []).append((link, end))
+                self.changedLinks.add(link)
+            idx[idx == i] = -1
+            idx[idx > i] -= 1
+
+        self._unbindNode(node)
+        self.removedNodes.append(node)
+        self.nodeStore.delete(i)
+        del self.nodes[i]
+        for n in self.nodes[i:]:
+            n._index -= 1
+        return node
+
+    def _unbindNode(self, node):
+        """
+        Turns a node back into a standalone object holding its own Position.
+        """
+        pos = node.position
+        node._position = Position(x=pos.x, y=pos.y, z=pos.z)
+        node._model = None
+        node._index = -1
+
+    def renameNode(self, oldName, newName):
+        """
+        Renames a Node, keeping the name index in sync. Links refer to nodes
+        by index, so they pick up the new name automatically.
+
+        Parameters:
+        -----------
+        oldName : str
+            The current name of the Node.
+        newName : str
+            The new name for the Node.
+
+        Returns:
+        --------
+        Node or None
+            The renamed Node, or None if no node had the old name.
+        """
+        node = self.nodeIndex.get(oldName)
+        if node is None:
+            return None
+        if newName != oldName and newName in self.nodeIndex:
+            raise ValueError(f"A node named '{newName}' already exists")
+        self.geometryVersion += 1  # support nodes are recognized by name
+        del self.nodeIndex[oldName]
+        node.name = newName
+        self.nodeIndex[newName] = node
+        if oldName in self.supports:
+            self.supports[newName] = self.supports.pop(oldName)._replace(node=newName)
+        self.changedNodes.add(node)
+        for link, end in self._pendingEnds.pop(newName, ()):
+            self.linkStore.columns['node1' if end == 0 else 'node2'][link._index] = node._index
+            if self._spatial is not None:
+                self._spatial.linkChanged(link._index)
+        return node
+
+    def getNode(self, name):
+        """
+        Returns a Node by its name using the name index.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the Node to find.
+
+        Returns:
+        --------
+        Node or None
+            The matching Node object, or None if not found.
+        """
+        i = self._nodeRow(name)
+        return self.nodes[i] if i >= 0 else None
+
+    def addLink(self, link):
+        """
+        Adds a Link to the model, copying its values into the link arrays and
+        resolving its node names to node indices. The nodes do not have to
+        exist yet; unresolved ends are connected when the node is added.
+
+        Parameters:
+        -----------
+        link : Link
+            The link to add.
+
+        Returns:
+        --------
+        Link
+            The link that was added.
+        """
+        self.geometryVersion += 1
+        self._spatial = None
+        self._stats = None
+        values = link._values
+        i = self.linkStore.append(
+            node1=-1, node2=-1, density=materialDensity(link.material),
+            **{k: (np.nan if v is None else v) for k, v in values.items()}
+        )
+        self.links.append(link)
+        link._model = self
+        link._index = i
+        self.changedLinks.add(link)
+        for end in (0, 1):
+            self._connectLink(link, end, link._nodeNames[end])
+        return link
+
+    def removeLink(self, link):
+        """
+        Removes a Link from the model.
+
+        Parameters:
+        -----------
+        link : Link
+            The link to remove.
+        """
+        self.geometryVersion += 1
+        self._spatial = None
+        self._stats = None
+        i = link._index
+        for column in link._values:
+            v = self.linkStore.columns[column][i]
+            link._values[column] = None if v != v else float(v)
+        link._nodeNames = [link.node1_Name, link.node2_Name]
+        for ends in self._pendingEnds.values():
+            ends[:] = [(l, e) for l, e in ends if l is not link]
+        self.linkStore.delete(i)
+        del self.links[i]
+        for l in self.links[i:]:
+            l._index -= 1
+        link._model = None
+        link._index = -1
+        self.removedLinks.append(link)
+
+    def _connectLink(self, link, end, name, oldName=None):
+        """
+        Points one end of a link at the node with the given name, or records
+        the end as pending if no such node exists yet.
+        """
+        self.geometryVersion += 1
+        column = 'node1' if end == 0 else 'node2'
+        node = self.nodeIndex.get(name)
+        self.linkStore.columns[column][link._index] = node._index if node is not None else -1
+        if self._spatial is not None:
+            self._spatial.linkChanged(link._index)
+        self.changedLinks.add(link)
+        ends = self._pendingEnds.get(oldName)
+        if ends:
+            ends[:] = [(l, e) for l, e in ends if not (l is link and e == end)]
+        if node is None:
+            self._pendingEnds.setdefault(name, []).append((link, end))
+
+    def calcLinkVals(self, g=9.81, links=None):
+        """
+        Computes length, angle, volume and weight for every link in one pass
+        over the link arrays. Links with an end that isn't connected to a
+        node are left unchanged.
+
+        Parameters:
+        -----------
+        g : float, optional
+            Gravitational acceleration used to turn mass into weight.
+        links : array-like of int, optional
+            Only recompute these links, e.g. those attached to a moved node
+            (see linksAt). The statistics are then updated incrementally.
+        """
+        i1 = self.node1_idx
+        i2 = self.node2_idx
+        ok = (i1 >= 0) & (i2 >= 0)
+        if links is not None:
+            idx = np.asarray(links, dtype=np.int64)
+            ok = idx[ok[idx]]
+            i1 = i1[ok]
+            i2 = i2[ok]
+        elif not ok.all():
+            i1 = i1[ok]
+            i2 = i2[ok]
+        x = self.nodeX
+        y = self.nodeY
+        dx = x[i2] - x[i1]
+        dy = y[i2] - y[i1]
+        length = np.hypot(dx, dy)
+
+        # Volume uses the length in file units times the cross-section; a missing
+        # width or thickness counts as zero, as in the per-link version.
+        width = np.nan_to_num(self.linkWidth[ok])
+        thickness = np.nan_to_num(self.linkThickness[ok])
+        volume = length * width * thickness
+
+        self.linkLength[ok] = length
+        self.linkAngle[ok] = np.arctan2(dy, dx)
+        self.linkVolume[ok] = volume
+        self.linkWeight[ok] = self.linkDensity[ok] * volume * g  # Weight in Newtons
+        if self._stats is not None:
+            self._stats.update(('length', 'weight', 'volume'), links)
+
+    def linksAt(self, node):
+        """
+        Returns the indices of the links attached to a node.
+
+        Parameters:
+        -----------
+        node : Node
+            A node of this model.
+
+        Returns:
+        --------
+        ndarray
+        """
+        return np.flatnonzero((self.node1_idx == node._index) | (self.node2_idx == node._index))
+
+    def getStatistics(self):
+        """
+        Returns the LinkStatistics of the link arrays (longest, heaviest and
+        most stressed links, extreme forces, total weight, ...). They are
+        computed on first use and then kept up to date by calcLinkVals,
+        calcMemberForces and edits through the Link properties, so reading
+        them is O(1).
+
+        Returns:
+        --------
+        LinkStatistics
+        """
+        if self._stats is None:
+            self._stats = LinkStatistics(self)
+        return self._stats
+
+    def setSupport(self, name, kind='pin', angle=None):
+        """
+        Puts a support at a node, replacing any support it had. The node
+        need not exist yet.
+
+        Parameters:
+        -----------
+        name : str
+            The node name.
+        kind : str, optional
+            'pin', 'roller' or 'fixed' (see Support).
+        angle : float, optional
+            A roller's reaction direction in degrees; defaults to 90 (vertical).
+        """
+        if kind == 'roller' and angle is None:
+            angle = 90.0
+        self.supports[name] = Support(name, kind, angle if kind == 'roller' else None)
+        self.geometryVersion += 1
+
+    def getSupport(self, name):
+        """
+        Returns the Support at a node, or None. Without any supports in the
+        input file, a node named 'left' (any capitalization) is a pin and a
+        node named 'right' a vertical roller.
+
+        Parameters:
+        -----------
+        name : str
+            The node name.
+
+        Returns:
+        --------
+        Support or None
+        """
+        if self.supports:
+            return self.supports.get(name)
+        nm = name.lower() if isinstance(name, str) else name
+        if nm == 'left':
+            return Support(name, 'pin', None)
+        if nm == 'right':
+            return Support(name, 'roller', 90.0)
+        return None
+
+    def getSupports(self):
+        """
+        Returns the supported nodes and what they restrain (see getSupport).
+        Supports at nodes that don't exist are left out.
+
+        Returns:
+        --------
+        (ndarray, ndarray, ndarray)
+            Node indices; each roller's reaction direction in radians (NaN
+            for the others); and True where both x and y are held.
+        """
+        if self.supports:
+            found = ((self._nodeRow(s.node), s) for s in self.supports.values())
+            supports = [(i, s) for i, s in found if i >= 0]
+        else:
+            supports = [(i, s) for i, name in self._nodeNames() if (s := self.getSupport(name)) is not None]
+        nodeIdx = np.array([i for i, s in supports], dtype=np.int64)
+        angle = np.array([math.radians(s.angle) if s.kind == 'roller' else np.nan for i, s in supports],
+                         dtype=np.float64)
+        return nodeIdx, angle, np.isnan(angle)
+
+    def calcMemberForces(self, loads=None):
+        """
+        Solves for the axial force in every link with the sparse direct
+        stiffness solver and stores force, stress and safety factor in the
+        link arrays.
+
+        Parameters:
+        -----------
+        loads : array-like, optional
+            Nodal loads (Fx0, Fy0, Fx1, Fy1, ...). Defaults to self-weight.
+
+        Returns:
+        --------
+        SolverResult
+        """
+        result = self.getSolver().solve(loads)
+        self.linkForce[:] = result.forces
+        self.linkStress[:] = result.stress
+        self.linkSafetyFactor[:] = result.safetyFactor
+        self.solution = result
+        if self._stats is not None:
+            self._stats.update(('force', 'stress'))
+        return result
+
+    @classmethod
+    def fromFile(cls, data):
+        """
+        Builds a model from a truss input file without any GUI, e.g. for
+        batch runs:
+
+            with open(filename) as f:
+                truss = TrussModel.fromFile(f)
+            truss.analyze()
+
+        Parameters:
+        -----------
+        data : file or iterable of str
+            The input file lines; they are streamed, not read all at once.
+
+        Returns:
+        --------
+        TrussModel
+        """
+        model = cls()
+        model.addRecords(parseTrussFile(data))
+        return model
+
+    def addRecords(self, records):
+        """
+        Adds the records produced by Truss_Parser.parseTrussFile to the model,
+        appending nodes and links to the array storage as they arrive.
+
+        Parameters:
+        -----------
+        records : iterable
+            Parsed records, typically the parseTrussFile generator itself.
+        """
+        for rec in records:
+            if isinstance(rec, NodeRecord):
+                self.addNode(Node(name=rec.name, position=Position(x=rec.x, y=rec.y)))
+            elif isinstance(rec, LinkRecord):
+                self.addLink(Link(name=rec.name, node1=rec.node1, node2=rec.node2,
+                                  width=rec.width, thickness=rec.thickness, material=rec.material))
+            elif isinstance(rec, MaterialRecord):
+                self.material.uts = rec.uts
+                self.material.ys = rec.ys
+                self.material.E = rec.E
+            elif isinstance(rec, StaticFactorRecord):
+                self.material.staticFactor = rec.factor
+            elif isinstance(rec, TitleRecord):
+                self.title = rec.title
+            elif isinstance(rec, LoadRecord):
+                case = self.loadCases.setdefault(rec.case, LoadCase(rec.case))
+                case.nodeLoads.append((rec.node, rec.fx, rec.fy))
+            elif isinstance(rec, SelfWeightRecord):
+                case = self.loadCases.setdefault(rec.case, LoadCase(rec.case))
+                case.selfWeightFactor += rec.factor
+            elif isinstance(rec, SupportRecord):
+                self.setSupport(rec.node, rec.kind, rec.angle)
+
+    def saveBinary(self, path):
+        """
+        Saves the model, including computed results, in the compact binary
+        format (see Truss_Binary): node and link columns as raw arrays, string
+        tables for names, a material table, and everything else as metadata.
+
+        Parameters:
+        -----------
+        path : str
+            The file to write.
+        """
+        arrays = {'node.' + k: self.nodeStore.column(k) for k in self.nodeStore.columns}
+        arrays.update({'link.' + k: self.linkStore.column(k) for k in self.linkStore.columns})
+        arrays['node.names'], arrays['node.nameOffsets'] = packStrings([str(n.name) for n in self.nodes])
+        arrays['link.names'], arrays['link.nameOffsets'] = packStrings([str(l.name) for l in self.links])
+
+        materials = {}
+        arrays['link.material'] = np.array(
+            [-1 if l.material is None else materials.setdefault(str(l.material), len(materials))
+             for l in self.links], dtype=np.int32)
+        if self.loadCaseForces is not None:
+            arrays['loadCaseForces'] = self.loadCaseForces
+        arrays['support.nodes'] = self.reactionNodes
+        arrays['support.reactions'] = self.reactions
+        if self.loadCaseReactions is not None:
+            arrays['loadCaseReactions'] = self.loadCaseReactions
+
+        meta = {
+            'title': self.title,
+            'material': [self.material.uts, self.material.ys, self.material.E, self.material.staticFactor],
+            'materials': list(materials),
+            'loadCases': [[c.name, c.nodeLoads, c.selfWeightFactor] for c in self.loadCases.values()],
+            'pendingEnds': [[link._index, end, name]
+                            for name, ends in self._pendingEnds.items() for link, end in ends],
+            'supports': [list(s) for s in self.supports.values()],
+            'solveError': self.solveError,
+            'reactionError': self.reactionError,
+        }
+        writeContainer(path, arrays, meta)
+
+    @classmethod
+    def loadBinary(cls, path, mmap=True):
+        """
+        Loads a model saved by saveBinary. With mmap the node and link
+        columns are copy-on-write memory maps of the file, so even a very
+        large model opens almost instantly and only the columns that are
+        used get paged in. The Node and Link views are created, and their
+        names decoded, the first time each one is used, and the name index
+        is built on the first lookup by name.
+
+        Parameters:
+        -----------
+        path : str
+            The file to read.
+        mmap : bool, optional
+            Memory-map the arrays instead of reading them.
+
+        Returns:
+        --------
+        TrussModel
+        """
+        arrays, meta = readContainer(path, mmap=mmap)
+        model = cls()
+        nNodes = len(arrays['node.nameOffsets']) - 1
+        nLinks = len(arrays['link.nameOffsets']) - 1
+        model.nodeStore.setColumns({k: arrays['node.' + k] for k in model.nodeStore.columns
+                                    if 'node.' + k in arrays}, nNodes)
+        model.linkStore.setColumns({k: arrays['link.' + k] for k in model.linkStore.columns
+                                    if 'link.' + k in arrays}, nLinks)
+
+        # Plain array views of the maps, as indexing a memmap one row at a time is slow
+        nodeNames, nodeOffsets, linkNames, linkOffsets, linkMaterial = (
+            arrays[k].view(np.ndarray) for k in ('node.names', 'node.nameOffsets', 'link.names',
+                                                 'link.nameOffsets', 'link.material'))
+
+        def makeNode(i):
+            node = Node(name=unpackString(nodeNames, nodeOffsets, i))
+            node._model = model
+            node._index = i
+            node._position = NodePosition(model, node)
+            return node
+
+        materials = meta['materials']
+
+        def makeLink(i):
+            m = int(linkMaterial[i])
+            link = Link(name=unpackString(linkNames, linkOffsets, i),
+                        material=materials[m] if m >= 0 else None)
+            link._model = model
+            link._index = i
+            return link
+
+        model.nodes = ViewList(makeNode, nNodes)
+        model.links = ViewList(makeLink, nLinks)
+        model._nodeIndex = None
+        model._nodeNameTable = (nodeNames, nodeOffsets)
+        for i, end, name in meta['pendingEnds']:
+            model.links[i]._nodeNames[end] = name
+            model._pendingEnds.setdefault(name, []).append((model.links[i], end))
+
+        model.title = meta['title']
+        (model.material.uts, model.material.ys, model.material.E,
+         model.material.staticFactor) = meta['material']
+        for name, nodeLoads, selfWeightFactor in meta['loadCases']:
+            case = model.loadCases[name] = LoadCase(name)
+            case.nodeLoads = [tuple(ld) for ld in nodeLoads]
+            case.selfWeightFactor = selfWeightFactor
+        model.loadCaseForces = arrays.get('loadCaseForces')
+        for name, kind, angle in meta['supports']:
+            model.supports[name] = Support(name, kind, angle)
+        model.reactionNodes = arrays['support.nodes']
+        model.reactions = arrays['support.reactions']
+        model.loadCaseReactions = arrays.get('loadCaseReactions')
+        model.solveError = meta['solveError']
+        model.reactionError = meta.get('reactionError')
+        return model
+
+    def geometryChanged(self):
+        """
+        Marks the geometry as changed after writing the node or link arrays
+        directly, so the cached solver factorization and spatial index are rebuilt.
+        """
+        self.geometryVersion += 1
+        self._spatial = None
+
+    def takeChanges(self):
+        """
+        Returns the elements edited since the last call and starts a new
+        change set. Links attached to a changed node count as changed, since
+        their endpoints or end names moved with it; they are found in one
+        vectorized pass over the connectivity arrays.
+
+        Returns:
+        --------
+        (list, set, list, list)
+            Changed nodes, changed links, removed nodes and removed links.
+            Changed elements that were removed afterwards are left out.
+        """
+        nodes = [n for n in self.changedNodes if n._model is self]
+        links = {l for l in self.changedLinks if l._model is self}
+        if nodes:
+            idx = np.fromiter((n._index for n in nodes), dtype=np.int64, count=len(nodes))
+            attached = np.isin(self.node1_idx, idx) | np.isin(self.node2_idx, idx)
+            links.update(self.links[j] for j in np.flatnonzero(attached))
+        removedNodes, removedLinks = self.removedNodes, self.removedLinks
+        self.changedNodes = set()
+        self.changedLinks = set()
+        self.removedNodes = []
+        self.removedLinks = []
+        return nodes, links, removedNodes, removedLinks
+
+    def getSolver(self):
+        """
+        Returns a TrussSolver for the current geometry. The assembled and
+        factored stiffness matrix is cached and reused until the geometry,
+        the supports or the modulus change.
+
+        Returns:
+        --------
+        TrussSolver
+        """
+        # Imported here so scipy is only loaded once something is solved
+        from Truss_Solver import TrussSolver
+
+        key = (self.geometryVersion, self.material.E)
+        if self._solver is None or self._solverKey != key:
+            self._solver = TrussSolver(self)
+            self._solverKey = key
+        return self._solver
+
+    def getSelfWeightLoads(self):
+        """
+        Returns the nodal load vector (Fx0, Fy0, Fx1, Fy1, ...) for the
+        self-weight of the links, with half of each link's weight applied at
+        each end node. Links with an unconnected end are left out.
+        """
+        i1 = self.node1_idx
+        i2 = self.node2_idx
+        connected = (i1 >= 0) & (i2 >= 0)
+        w = np.nan_to_num(self.linkWeight[connected]) / 2
+        F = np.zeros(2 * len(self.nodes))
+        F[1::2] -= np.bincount(i1[connected], weights=w, minlength=len(self.nodes))
+        F[1::2] -= np.bincount(i2[connected], weights=w, minlength=len(self.nodes))
+        return F
+
+    def getLoadVector(self, loadCase):
+        """
+        Builds the nodal load vector (Fx0, Fy0, Fx1, Fy1, ...) for a load case.
+        Loads on nodes that don't exist are ignored.
+
+        Parameters:
+        -----------
+        loadCase : LoadCase or str
+            The load case, or the name of one in self.loadCases.
+
+        Returns:
+        --------
+        ndarray
+            Load vector of length 2 * number of nodes.
+        """
+        if isinstance(loadCase, str):
+            loadCase = self.loadCases[loadCase]
+        F = np.zeros(2 * len(self.nodes))
+        if loadCase.selfWeightFactor:
+            F += loadCase.selfWeightFactor * self.getSelfWeightLoads()
+        for nodeName, fx, fy in loadCase.nodeLoads:
+            i = self._nodeRow(nodeName)
+            if i >= 0:
+                F[2 * i] += fx
+                F[2 * i + 1] += fy
+        return F
+
+    def solve_load_cases(self, loads):
+        """
+        Solves many load cases against one factorization of the stiffness
+        matrix (factored once per geometry and cached on the model).
+
+        Parameters:
+        -----------
+        loads : list
+            Load vectors of length 2 * number of nodes, LoadCase objects or
+            names of cases in self.loadCases, in any mix.
+
+        Returns:
+        --------
+        ndarray
+            (cases, links) axial forces, tension positive.
+        """
+        solver = self.getSolver()
+        F = [ld if not isinstance(ld, (str, LoadCase)) else self.getLoadVector(ld) for ld in loads]
+        return solver.solveMany(np.reshape(F, (len(F), solver.nDofs)))
+
+    def calcSupportReactions(self):
+        """
+        Solves the reaction forces at every support (see getSupports) under
+        the self-weight and under each load case. They come from the same
+        factored stiffness matrix as the member forces (see
+        TrussSolver.supportReactions), so statically indeterminate layouts,
+        such as a long truss continuous over many supports, are handled as
+        well as simply supported ones, all load cases in one batched solve.
+        Without a modulus E a statically determinate layout is solved from
+        equilibrium alone (see staticReactions).
+        The results go to reactionNodes, reactions and loadCaseReactions; a
+        truss that can't be solved gets NaN reactions, and the reason is
+        kept in reactionError.
+        """
+        nodeIdx = self.getSupports()[0]
+        self.reactionNodes = nodeIdx
+        self.reactions = np.full((len(nodeIdx), 2), np.nan)
+        self.loadCaseReactions = None
+        self.reactionError = None
+        if not len(nodeIdx):
+            return
+        loads = np.vstack([self.getSelfWeightLoads()] + [self.getLoadVector(c) for c in self.loadCases.values()])
+        if self.material.E is None:
+            reactions = self.staticReactions(loads)
+            if reactions is None:
+                self.reactionError = ("the supports are statically indeterminate or unstable, and the "
+                                      "material modulus E needed to solve them is missing")
+                return
+        else:
+            try:
+                reactions = self.getSolver().supportReactions(loads)
+            except ValueError as err:
+                self.reactionError = str(err)
+                return
+        if np.isnan(reactions).any():
+            self.reactionError = "the reactions don't balance the loads of every case (a load on a node no link touches?)"
+        self.reactions = reactions[0]
+        if self.loadCases:
+            self.loadCaseReactions = reactions[1:]
+
+    def staticReactions(self, loads):
+        """
+        Solves the support reactions from the three equilibrium equations
+        (sum of Fx, sum of Fy and sum of moments zero) alone, which needs no
+        stiffness and so no modulus. That only works for a statically
+        determinate layout: exactly three reaction components (a pin and a
+        roller, say) that aren't all parallel or through one point.
+
+        Parameters:
+        -----------
+        loads : ndarray
+            (cases, 2*nNodes) nodal load vectors.
+
+        Returns:
+        --------
+        ndarray or None
+            (cases, supports, 2) x and y reactions at the nodes in
+            getSupports() order, or None if the layout isn't determinate.
+        """
+        nodeIdx, angle, pinned = self.getSupports()
+        x = self.nodeX
+        y = self.nodeY
+
+        # One column per reaction component: its force and moment about the origin per unit size
+        directions = []
+        for k, (i, a, p) in enumerate(zip(nodeIdx.tolist(), angle.tolist(), pinned.tolist())):
+            for c, s in ((1.0, 0.0), (0.0, 1.0)) if p else ((math.cos(a), math.sin(a)),):
+                directions.append((k, c, s, x[i] * s - y[i] * c))
+        if len(directions) != 3:
+            return None
+        A = np.array([[c, s, m] for k, c, s, m in directions]).T
+        if np.linalg.cond(A) > 1e12:
+            return None
+
+        F = np.atleast_2d(loads)
+        Fx = F[:, 0::2]
+        Fy = F[:, 1::2]
+        b = -np.stack((Fx.sum(axis=1), Fy.sum(axis=1), (x * Fy - y * Fx).sum(axis=1)))
+        r = np.linalg.solve(A, b)
+        R = np.zeros((F.shape[0], len(nodeIdx), 2))
+        for (k, c, s, m), size in zip(directions, r):
+            R[:, k, 0] += c * size
+            R[:, k, 1] += s * size
+        return R
+
+    def calcMemberForcesSafe(self):
+        """
+        Solves for the member axial forces under self-weight and every load
+        case. The results of any earlier solve are cleared first, so a truss
+        that can't be solved (no supports, missing modulus, unstable) is left
+        with NaN forces, and the reason is kept in self.solveError for the
+        report.
+        """
+        self.solveError = None
+        self.solution = None
+        self.loadCaseForces = None
+        self.linkForce[:] = np.nan
+        self.linkStress[:] = np.nan
+        self.linkSafetyFactor[:] = np.nan
+        if self._stats is not None:
+            self._stats.update(('force', 'stress'))
+        if not len(self.getSupports()[0]):
+            self.solveError = "no supports defined"
+            return
+        try:
+            self.calcMemberForces()
+            if self.loadCases:
+                self.loadCaseForces = self.solve_load_cases(list(self.loadCases))
+        except ValueError as err:
+            self.solveError = str(err)
+
+    def analyze(self):
+        """
+        Runs every calculation the report needs: link geometry and weight,
+        support reactions and member forces.
+        """
+        self.calcLinkVals()
+        self.calcSupportReactions()
+        self.calcMemberForcesSafe()
+
+    def getCenterPt(self):
+        """
+        Builds a bounding rectangle around all node positions
+        and assigns it to self.rct. Also returns None if no nodes exist.
+        """
+        if not self.nodes:
+            return
+
+        x = self.nodeX
+        y = self.nodeY
+        self.rct = Rectangle(
+            top=float(y.max()),
+            left=float(x.min()),
+            bottom=float(y.min()),
+            right=float(x.max()),
+        )
+
+    def getSpatialIndex(self):
+        """
+        Returns the SpatialIndex used by nearestNode and nearestLink, building
+        it on first use. Moving nodes, renaming them and relinking links
+        update it in place; adding or removing nodes or links discards it,
+        and it is rebuilt on the next query.
+
+        Returns:
+        --------
+        SpatialIndex
+        """
+        if self._spatial is None:
+            self._spatial = SpatialIndex(self)
+        return self._spatial
+
+    def nearestNode(self, x, y, maxDistance=math.inf):
+        """
+        Finds the node closest to a point using the spatial index.
+
+        Parameters:
+        -----------
+        x, y : float
+            The point, in model coordinates.
+        maxDistance : float, optional
+            Nodes farther away than this are ignored.
+
+        Returns:
+        --------
+        Node or None
+            The closest node, or None if none is within maxDistance.
+        """
+        i = self.getSpatialIndex().nearestNode(x, y, maxDistance)
+        return self.nodes[i] if i >= 0 else None
+
+    def nearestLink(self, x, y, maxDistance=math.inf):
+        """
+        Finds the connected link whose center line passes closest to a point,
+        using the spatial index.
+
+        Parameters:
+        -----------
+        x, y : float
+            The point, in model coordinates.
+        maxDistance : float, optional
+            Links farther away than this are ignored.
+
+        Returns:
+        --------
+        Link or None
+            The closest link, or None if none is within maxDistance.
+        """
+        j = self.getSpatialIndex().nearestLink(x, y, maxDistance)
+        return self.links[j] if j >= 0 else None
@@ -0,0 +1,110 @@
+from collections import namedtuple
+
+###############################################################################
+# 1) Record Types
+###############################################################################
+# Each non-comment line of a truss input file becomes one of these records.
+TitleRecord = namedtuple('TitleRecord', 'title')
+MaterialRecord = namedtuple('MaterialRecord', 'uts ys E')
+StaticFactorRecord = namedtuple('StaticFactorRecord', 'factor')
+NodeRecord = namedtuple('NodeRecord', 'name x y')
+LinkRecord = namedtuple('LinkRecord', 'name node1 node2 width thickness material')
+LoadRecord = namedtuple('LoadRecord', 'case node fx fy')
+SelfWeightRecord = namedtuple('SelfWeightRecord', 'case factor')
+# kind is 'pin', 'roller' or 'fixed'; angle is a roller's reaction direction in degrees
+SupportRecord = namedtuple('SupportRecord', 'node kind angle')
+
+SUPPORT_KINDS = ('pin', 'roller', 'fixed')
+# Roller directions that may be given by name instead of in degrees
+_DIRECTIONS = {'x': 0.0, 'horizontal': 0.0, 'y': 90.0, 'vertical': 90.0}
+
+
+###############################################################################
+# 2) Streaming Parser
+###############################################################################
+def parseTrussFile(lines):
+    """
+    Parses a truss input file one line at a time and yields typed records.
+    Nothing but the current line is held in memory, so an open file object
+    can be passed in directly and arbitrarily large files stream through.
+
+    Parameters:
+    -----------
+    lines : iterable of str
+        An open text file or any other iterable of lines. e.g.:
+         # comment
+         title, 'Warren Truss'
+         material, 400, 250, 200e9
+         static, 2.0
+         node, N1, 0, 0
+         link, L1, N1, N2, width, thickness, material
+         loadcase, snow, N1, 0, -500
+         loadcase, dead, selfweight, 1.0
+         support, N1, pin
+         support, N9, roller, 90
+        A roller's direction is the direction of its reaction, in degrees
+        counter-clockwise from +x or as x/horizontal or y/vertical; it
+        defaults to vertical.
+
+    Yields:
+    -------
+    TitleRecord, MaterialRecord, StaticFactorRecord, NodeRecord, LinkRecord,
+    LoadRecord, SelfWeightRecord or SupportRecord
+
+    Raises:
+    -------
+    ValueError
+        If a recognized line has a value that can't be read; the message
+        gives the line number.
+    """
+    for lineNo, line in enumerate(lines, 1):
+        line = line.strip()
+        # Skip empty lines or comment lines
+        if not line or line.startswith('#'):
+            continue
+
+        cells = [c.strip() for c in line.split(',')]
+        if len(cells) < 2:
+            continue
+
+        key = cells[0].lower()
+        try:
+            if key.startswith('title'):
+                # e.g. title, 'name' (the title itself may contain commas)
+                yield TitleRecord(line.split(',', 1)[1].strip().strip('\'"'))
+            elif key.startswith('material'):
+                # e.g. material, uts, ys, E
+                yield MaterialRecord(float(cells[1]), float(cells[2]), float(cells[3]))
+            elif key.startswith('static'):
+                # e.g. static, factor
+                yield StaticFactorRecord(float(cells[1]))
+            elif key.startswith('node'):
+                # e.g. node, name, x, y
+                yield NodeRecord(cells[1], float(cells[2]), float(cells[3]))
+            elif key.startswith('link'):
+                # e.g. link, name, node1, node2, width, thickness, material
+                if len(cells) >= 7:
+                    yield LinkRecord(cells[1], cells[2], cells[3],
+                                     float(cells[4]), float(cells[5]), cells[6])
+                else:
+                    # If missing extra columns, do a basic Link
+                    yield LinkRecord(cells[1], cells[2], cells[3], None, None, None)
+            elif key.startswith('loadcase'):
+                # e.g. loadcase, name, node, Fx, Fy
+                #  or  loadcase, name, selfweight, factor
+                if cells[2].lower() == 'selfweight':
+                    yield SelfWeightRecord(cells[1], float(cells[3]))
+                else:
+                    yield LoadRecord(cells[1], cells[2], float(cells[3]), float(cells[4]))
+            elif key.startswith('support'):
+                # e.g. support, node, pin|fixed  or  support, node, roller, direction
+                kind = cells[2].lower()
+                if kind not in SUPPORT_KINDS:
+                    raise ValueError(f"unknown support type '{cells[2]}' (expected {', '.join(SUPPORT_KINDS)})")
+                angle = None
+                if kind == 'roller':
+                    direction = cells[3].lower() if len(cells) > 3 and cells[3] else 'y'
+                    angle = _DIRECTIONS[direction] if direction in _DIRECTIONS else float(direction)
+                yield SupportRecord(cells[1], kind, angle)
+        except (ValueError, IndexError) as err:
+            raise ValueError(f"line {lineNo}: can't read '{line}' ({err})") from err
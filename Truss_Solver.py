@@ -0,0 +1,294 @@
+import numpy as np
+import scipy.sparse as sps
+from scipy.sparse.linalg import splu
+
+from Truss_Constants import KSI, MPSI
+
+# A pivot this small relative to the largest one is round-off from a zero
+# pivot, i.e. the truss is a mechanism
+PIVOT_TOLERANCE = 1e3 * np.finfo(np.float64).eps
+# Largest net force left by the support reactions, relative to the total load
+EQUILIBRIUM_TOLERANCE = 1e-6
+
+
+###############################################################################
+# 1) SolverResult Class
+###############################################################################
+class SolverResult():
+    """
+    Holds the output of a TrussSolver solve:
+     - displacements : (nNodes, 2) array of nodal x, y displacements (m)
+     - forces : per-link axial force (N), tension positive
+     - stress : per-link axial stress (Pa)
+     - safetyFactor : yield strength / |stress| for each link
+     - adequate : True where safetyFactor meets the material's static factor
+     - reactions : (nNodes, 2) array of support reactions (N), zero at unsupported nodes
+    """
+
+    def __init__(self, displacements, forces, stress, safetyFactor, adequate, reactions):
+        self.displacements = displacements
+        self.forces = forces
+        self.stress = stress
+        self.safetyFactor = safetyFactor
+        self.adequate = adequate
+        self.reactions = reactions
+
+
+###############################################################################
+# 2) TrussSolver Class
+###############################################################################
+class TrussSolver():
+    """
+    Direct-stiffness solver for the member forces of a 2D pin-jointed truss.
+    The global stiffness matrix is assembled as a scipy.sparse matrix straight
+    from the TrussModel's node and link arrays, the supported DOFs are removed,
+    and the reduced system is solved by sparse LU factorization.
+
+    A roller whose reaction is along x or y simply has that DOF removed. For
+    an inclined roller the node's two DOFs are first rotated so one lies
+    along the reaction (K' = T^T K T, F' = T^T F, u = T u'), and that one is
+    removed; displacements and reactions are returned in global x and y.
+    """
+
+    def __init__(self, truss):
+        """
+        Assembles and factors the stiffness matrix for a TrussModel.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model to solve. Link lengths/angles need not be current;
+            the geometry is taken directly from the node coordinates.
+
+        Raises:
+        -------
+        ValueError
+            If the modulus is missing or the supports leave the truss unstable.
+        """
+        self.truss = truss
+        if truss.material.E is None:
+            raise ValueError("Material modulus E is required to solve for member forces")
+        self.nNodes = len(truss.nodes)
+        self.nDofs = 2 * self.nNodes
+        self.assemble()
+        self.factor()
+
+    def assemble(self):
+        """
+        Builds the global stiffness matrix K (2*nNodes square, CSC) and the
+        per-link quantities needed to recover axial forces.
+        """
+        t = self.truss
+        i1 = t.node1_idx
+        i2 = t.node2_idx
+        # Links with an unconnected end carry no stiffness
+        self.connected = (i1 >= 0) & (i2 >= 0)
+        i1 = i1[self.connected]
+        i2 = i2[self.connected]
+
+        dx = t.nodeX[i2] - t.nodeX[i1]
+        dy = t.nodeY[i2] - t.nodeY[i1]
+        L = np.hypot(dx, dy)
+        area = np.nan_to_num(t.linkWidth[self.connected]) * np.nan_to_num(t.linkThickness[self.connected])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.c = np.where(L > 0, dx / L, 0.0)
+            self.s = np.where(L > 0, dy / L, 0.0)
+            self.k = np.where(L > 0, t.material.E * MPSI * area / L, 0.0)
+        self.area = area
+        self.i1 = i1
+        self.i2 = i2
+
+        # Element stiffness is k * b b^T with b = [-c, -s, c, s] over the DOFs of both ends
+        b = np.stack((-self.c, -self.s, self.c, self.s), axis=1)
+        dofs = np.stack((2 * i1, 2 * i1 + 1, 2 * i2, 2 * i2 + 1), axis=1)
+        vals = self.k[:, None, None] * b[:, :, None] * b[:, None, :]
+        rows = np.broadcast_to(dofs[:, :, None], vals.shape)
+        cols = np.broadcast_to(dofs[:, None, :], vals.shape)
+        self.K = sps.coo_matrix((vals.ravel(), (rows.ravel(), cols.ravel())),
+                                shape=(self.nDofs, self.nDofs)).tocsc()
+
+    def factor(self):
+        """
+        Removes the supported DOFs (and the DOFs of nodes that no link
+        touches) and LU-factors the remaining system. A mechanism only
+        rarely gives an exactly zero pivot, so the pivots are also compared
+        with each other (see PIVOT_TOLERANCE).
+        """
+        nodeIdx, angle, pinned = self.truss.getSupports()
+        c, s = np.cos(angle), np.sin(angle)
+        alongX = ~pinned & (np.abs(s) < 1e-12)
+        alongY = ~pinned & (np.abs(c) < 1e-12)
+        inclined = ~(pinned | alongX | alongY)
+
+        fixed = np.zeros(self.nDofs, dtype=bool)
+        fixed[2 * nodeIdx[pinned]] = True
+        fixed[2 * nodeIdx[pinned] + 1] = True
+        fixed[2 * nodeIdx[alongX]] = True
+        fixed[2 * nodeIdx[alongY] + 1] = True
+        # For an inclined roller, the rotated DOF along the reaction
+        fixed[2 * nodeIdx[inclined]] = True
+        touched = np.bincount(np.concatenate((self.i1, self.i2)), minlength=self.nNodes) > 0
+        fixed |= np.repeat(~touched, 2)
+        self.fixed = fixed
+        self.free = np.flatnonzero(~fixed)
+
+        K = self.K
+        self.T = None
+        if inclined.any():
+            self.T = self.rotation(nodeIdx[inclined], c[inclined], s[inclined])
+            K = (self.T.T @ K @ self.T).tocsc()
+        Kff = K[self.free][:, self.free].tocsc()
+
+        # Reactions are the rows of K u - F at the supported nodes' DOFs
+        self.supportNodes = nodeIdx
+        self.supportDofs = np.stack((2 * nodeIdx, 2 * nodeIdx + 1), axis=1).ravel()
+        self.Ks = self.K[self.supportDofs].tocsr()
+        try:
+            self.lu = splu(Kff)
+        except RuntimeError:
+            raise ValueError("The truss is unstable with the given supports (singular stiffness matrix)")
+        pivots = np.abs(self.lu.U.diagonal())
+        if len(pivots) and pivots.min() < PIVOT_TOLERANCE * pivots.max():
+            raise ValueError("The truss is unstable with the given supports (singular stiffness matrix)")
+
+    def rotation(self, nodes, c, s):
+        """
+        Builds the sparse DOF rotation T for inclined rollers: identity,
+        except that each listed node's DOFs become (along, across) its
+        reaction direction (c, s), so that global u = T u'.
+        """
+        diag = np.ones(self.nDofs)
+        diag[2 * nodes] = c
+        diag[2 * nodes + 1] = c
+        rows = np.concatenate((np.arange(self.nDofs), 2 * nodes, 2 * nodes + 1))
+        cols = np.concatenate((np.arange(self.nDofs), 2 * nodes + 1, 2 * nodes))
+        vals = np.concatenate((diag, -s, s))
+        return sps.coo_matrix((vals, (rows, cols)), shape=(self.nDofs, self.nDofs)).tocsr()
+
+    def displacements(self, F):
+        """
+        Solves K u = F for the nodal displacements.
+
+        Parameters:
+        -----------
+        F : ndarray
+            (cases, 2*nNodes) load vectors.
+
+        Returns:
+        --------
+        ndarray
+            (cases, 2*nNodes) displacements in global x and y.
+        """
+        if self.T is not None:
+            F = (self.T.T @ F.T).T
+        U = np.zeros((F.shape[0], self.nDofs))
+        if F.shape[0]:
+            U[:, self.free] = self.lu.solve(np.ascontiguousarray(F[:, self.free].T)).T
+        if self.T is not None:
+            U = (self.T @ U.T).T
+        return U
+
+    def supportReactions(self, loads):
+        """
+        Solves the support reactions for several load vectors at once.
+        Each case is checked for equilibrium: if the reactions don't balance
+        the loads (e.g. a load on a node no link touches), that case's
+        reactions are NaN.
+
+        Parameters:
+        -----------
+        loads : array-like
+            (cases, 2*nNodes) nodal load vectors.
+
+        Returns:
+        --------
+        ndarray
+            (cases, supports, 2) x and y reactions at the nodes in
+            truss.getSupports() order.
+        """
+        F = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+        U = self.displacements(F)
+        R = ((self.Ks @ U.T).T - F[:, self.supportDofs]).reshape(F.shape[0], len(self.supportNodes), 2)
+
+        # Sum of reactions + sum of loads should be zero in x and y
+        imbalance = np.abs(R.sum(axis=1) + F.reshape(F.shape[0], -1, 2).sum(axis=1)).max(axis=1)
+        scale = np.abs(F).sum(axis=1)
+        R[imbalance > EQUILIBRIUM_TOLERANCE * scale] = np.nan
+        return R
+
+    def selfWeightLoads(self):
+        """
+        Returns the nodal load vector (length 2*nNodes) for the self-weight of
+        the links (see TrussModel.getSelfWeightLoads).
+        """
+        return self.truss.getSelfWeightLoads()
+
+    def solve(self, loads=None):
+        """
+        Solves K u = F for one load vector and recovers the member results.
+
+        Parameters:
+        -----------
+        loads : array-like, optional
+            Nodal loads, length 2*nNodes ordered (Fx0, Fy0, Fx1, Fy1, ...).
+            Defaults to the self-weight of the links.
+
+        Returns:
+        --------
+        SolverResult
+        """
+        F = self.selfWeightLoads() if loads is None else np.asarray(loads, dtype=np.float64).ravel()
+        u = self.displacements(F[None, :])[0]
+
+        forces = self.memberForces(u)
+        area = np.full(len(self.connected), np.nan)
+        area[self.connected] = self.area
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stress = forces / area
+            ys = self.truss.material.ys
+            safetyFactor = (ys * KSI) / np.abs(stress) if ys is not None else np.full_like(stress, np.nan)
+        staticFactor = self.truss.material.staticFactor
+        adequate = safetyFactor >= (staticFactor if staticFactor is not None else 1.0)
+
+        reactions = np.zeros(self.nDofs)
+        reactions[self.supportDofs] = self.Ks @ u - F[self.supportDofs]
+        return SolverResult(u.reshape(-1, 2), forces, stress, safetyFactor, adequate,
+                            reactions.reshape(-1, 2))
+
+    def solveMany(self, loads):
+        """
+        Solves several load vectors against the same factorization in one
+        batched triangular solve.
+
+        Parameters:
+        -----------
+        loads : array-like
+            (cases, 2*nNodes) nodal load vectors, one row per load case.
+
+        Returns:
+        --------
+        ndarray
+            (cases, links) axial forces, NaN for unconnected links.
+        """
+        F = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+        return self.memberForces(self.displacements(F))
+
+    def memberForces(self, u):
+        """
+        Recovers axial forces (tension positive) from nodal displacements.
+
+        Parameters:
+        -----------
+        u : ndarray
+            Displacement vector of length 2*nNodes, or a (cases, 2*nNodes) stack.
+
+        Returns:
+        --------
+        ndarray
+            Per-link forces with the same leading shape as u.
+        """
+        forces = np.full(u.shape[:-1] + (len(self.connected),), np.nan)
+        forces[..., self.connected] = self.k * (
+            self.c * (u[..., 2 * self.i2] - u[..., 2 * self.i1]) +
+            self.s * (u[..., 2 * self.i2 + 1] - u[..., 2 * self.i1 + 1]))
+        return forces
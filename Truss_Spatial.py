@@ -0,0 +1,244 @@
+"""
+A grid-bucket spatial index over a TrussModel's nodes and link segments, for
+finding the node or link nearest the cursor without asking Qt for per-item
+hover events. Like Truss_Model it does not import Qt.
+"""
+import math
+import numpy as np
+
+
+class SpatialIndex():
+    """
+    Buckets the nodes, and the cells each link's bounding box covers, into a
+    uniform grid. A nearest query searches rings of cells outward from the
+    query point and stops as soon as no unvisited cell can hold anything
+    closer, so it only looks at a handful of elements.
+
+    The index reads coordinates from the model's arrays. Moved nodes are
+    reported with nodeMoved() and re-bucketed, with their links, on the next
+    query; a link whose ends were connected to other nodes is re-bucketed
+    at once by linkChanged(). Adding or removing nodes or links needs a new
+    index (see TrussModel.getSpatialIndex).
+    """
+
+    def __init__(self, truss, cellSize=None):
+        """
+        Builds the index for the current state of a model.
+
+        Parameters:
+        -----------
+        truss : TrussModel
+            The model to index.
+        cellSize : float, optional
+            Grid spacing. Defaults to the mean length of the connected links,
+            so a link covers only a few cells.
+        """
+        self.truss = truss
+        t = truss
+        x, y = t.nodeX, t.nodeY
+        i1, i2 = t.node1_idx, t.node2_idx
+        linkIdx = np.flatnonzero((i1 >= 0) & (i2 >= 0))
+        i1, i2 = i1[linkIdx], i2[linkIdx]
+
+        if cellSize is None:
+            lengths = np.hypot(x[i2] - x[i1], y[i2] - y[i1])
+            cellSize = float(lengths.mean()) if len(lengths) else 0.0
+            if not cellSize > 0:
+                span = max(np.ptp(x), np.ptp(y)) if len(x) else 0.0
+                cellSize = float(span) / max(math.sqrt(len(x)), 1.0) or 1.0
+        self.cellSize = cellSize
+        self.x0 = float(x.min()) if len(x) else 0.0
+        self.y0 = float(y.min()) if len(y) else 0.0
+        self.bounds = [0, 0, -1, -1]  # cx min, cy min, cx max, cy max of occupied cells
+
+        # Nodes: cell -> set of node indices, and each node's cell
+        self.nodeCells = {}
+        self.nodeKey = list(zip(self.cellOf(x, self.x0).tolist(), self.cellOf(y, self.y0).tolist()))
+        for i, key in enumerate(self.nodeKey):
+            self.nodeCells.setdefault(key, set()).add(i)
+            self.growBounds(*key, *key)
+
+        # Links: cell -> set of link indices for every cell a link's bounding box covers
+        self.linkCells = {}
+        self.linkRange = {}
+        cx0 = self.cellOf(np.minimum(x[i1], x[i2]), self.x0).tolist()
+        cx1 = self.cellOf(np.maximum(x[i1], x[i2]), self.x0).tolist()
+        cy0 = self.cellOf(np.minimum(y[i1], y[i2]), self.y0).tolist()
+        cy1 = self.cellOf(np.maximum(y[i1], y[i2]), self.y0).tolist()
+        for j, r in zip(linkIdx.tolist(), zip(cx0, cy0, cx1, cy1)):
+            self.addLink(j, r)
+
+        # Node -> attached links, so a moved node re-buckets only its own links
+        ends = np.concatenate((i1, i2))
+        order = np.argsort(ends, kind='stable')
+        self.adjLinks = np.concatenate((linkIdx, linkIdx))[order]
+        self.adjStart = np.searchsorted(ends[order], np.arange(len(x) + 1))
+        # Node -> links attached to it later by linkChanged
+        self.extraAdj = {}
+        self.dirty = set()
+
+    def cellOf(self, v, origin):
+        return np.floor((v - origin) / self.cellSize).astype(np.int64)
+
+    def growBounds(self, cx0, cy0, cx1, cy1):
+        b = self.bounds
+        if b[2] < b[0]:
+            self.bounds = [cx0, cy0, cx1, cy1]
+        else:
+            self.bounds = [min(b[0], cx0), min(b[1], cy0), max(b[2], cx1), max(b[3], cy1)]
+
+    def addLink(self, j, r):
+        self.linkRange[j] = r
+        for cx in range(r[0], r[2] + 1):
+            for cy in range(r[1], r[3] + 1):
+                self.linkCells.setdefault((cx, cy), set()).add(j)
+        self.growBounds(*r)
+
+    def removeLink(self, j):
+        r = self.linkRange.pop(j)
+        for cx in range(r[0], r[2] + 1):
+            for cy in range(r[1], r[3] + 1):
+                self.linkCells[(cx, cy)].discard(j)
+
+    def linkBox(self, j):
+        """
+        Returns the (cx min, cy min, cx max, cy max) cells covered by link j's bounding box.
+        """
+        t = self.truss
+        x, y = t.nodeX, t.nodeY
+        a, b = t.node1_idx[j], t.node2_idx[j]
+        h = self.cellSize
+        return (math.floor((min(x[a], x[b]) - self.x0) / h), math.floor((min(y[a], y[b]) - self.y0) / h),
+                math.floor((max(x[a], x[b]) - self.x0) / h), math.floor((max(y[a], y[b]) - self.y0) / h))
+
+    def linkChanged(self, j):
+        """
+        Re-buckets link j after one of its ends was connected to another
+        node, or disconnected.
+        """
+        t = self.truss
+        if j in self.linkRange:
+            self.removeLink(j)
+        a, b = int(t.node1_idx[j]), int(t.node2_idx[j])
+        if a >= 0 and b >= 0:
+            self.addLink(j, self.linkBox(j))
+            self.extraAdj.setdefault(a, set()).add(j)
+            self.extraAdj.setdefault(b, set()).add(j)
+
+    def nodeMoved(self, i):
+        """
+        Marks node i as moved; it and its links are re-bucketed on the next query.
+        """
+        self.dirty.add(i)
+
+    def refresh(self):
+        """
+        Re-buckets the nodes reported by nodeMoved and the links attached to them.
+        """
+        if not self.dirty:
+            return
+        t = self.truss
+        x, y = t.nodeX, t.nodeY
+        h = self.cellSize
+        links = set()
+        for i in self.dirty:
+            key = (math.floor((x[i] - self.x0) / h), math.floor((y[i] - self.y0) / h))
+            if key != self.nodeKey[i]:
+                self.nodeCells[self.nodeKey[i]].discard(i)
+                self.nodeCells.setdefault(key, set()).add(i)
+                self.nodeKey[i] = key
+                self.growBounds(*key, *key)
+            links.update(self.adjLinks[self.adjStart[i]:self.adjStart[i + 1]].tolist())
+            links.update(self.extraAdj.get(i, ()))
+        for j in links:
+            # Links relinked away from the node, or disconnected, are left to linkChanged
+            if j not in self.linkRange:
+                continue
+            r = self.linkBox(j)
+            if r != self.linkRange[j]:
+                self.removeLink(j)
+                self.addLink(j, r)
+        self.dirty = set()
+
+    def rings(self, x, y, maxDistance):
+        """
+        Yields (r, cells) for the rings of cells around the point, nearest
+        first, until the rings leave the occupied area or maxDistance.
+        A cell in ring r is at least (r - 1) * cellSize from the point.
+        """
+        h = self.cellSize
+        qx = math.floor((x - self.x0) / h)
+        qy = math.floor((y - self.y0) / h)
+        bx0, by0, bx1, by1 = self.bounds
+        if bx1 < bx0:
+            return
+        # Rings nearer than the occupied area are empty, so start at its edge
+        r = max(0, bx0 - qx, qx - bx1, by0 - qy, qy - by1)
+        rMax = max(qx - bx0, bx1 - qx, qy - by0, by1 - qy)
+        while r <= rMax and (r - 1) * h <= maxDistance:
+            if r == 0:
+                yield r, ((qx, qy),)
+            else:
+                top = [(cx, qy - r) for cx in range(qx - r, qx + r + 1)]
+                bottom = [(cx, qy + r) for cx in range(qx - r, qx + r + 1)]
+                sides = [(qx - r, cy) for cy in range(qy - r + 1, qy + r)] + \
+                        [(qx + r, cy) for cy in range(qy - r + 1, qy + r)]
+                yield r, top + bottom + sides
+            r += 1
+
+    def nearestNode(self, x, y, maxDistance=math.inf):
+        """
+        Finds the node closest to a point.
+
+        Returns:
+        --------
+        int
+            Index of the closest node within maxDistance, or -1.
+        """
+        self.refresh()
+        X, Y = self.truss.nodeX, self.truss.nodeY
+        best, bestD = -1, maxDistance
+        for r, cells in self.rings(x, y, maxDistance):
+            found = [i for key in cells for i in self.nodeCells.get(key, ())]
+            if found:
+                i = np.array(found)
+                d = np.hypot(X[i] - x, Y[i] - y)
+                k = int(np.argmin(d))
+                if d[k] <= bestD:
+                    best, bestD = int(i[k]), float(d[k])
+            if best >= 0 and bestD <= r * self.cellSize:
+                break
+        return best
+
+    def nearestLink(self, x, y, maxDistance=math.inf):
+        """
+        Finds the connected link whose center line passes closest to a point.
+
+        Returns:
+        --------
+        int
+            Index of the closest link within maxDistance, or -1.
+        """
+        self.refresh()
+        t = self.truss
+        X, Y = t.nodeX, t.nodeY
+        best, bestD = -1, maxDistance
+        for r, cells in self.rings(x, y, maxDistance):
+            found = set()
+            for key in cells:
+                found.update(self.linkCells.get(key, ()))
+            if found:
+                j = np.fromiter(found, dtype=np.int64, count=len(found))
+                i1, i2 = t.node1_idx[j], t.node2_idx[j]
+                x1, y1 = X[i1], Y[i1]
+                dx, dy = X[i2] - x1, Y[i2] - y1
+                lenSq = dx * dx + dy * dy
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    s = np.clip(np.where(lenSq > 0, ((x - x1) * dx + (y - y1) * dy) / lenSq, 0.0), 0.0, 1.0)
+                d = np.hypot(x1 + s * dx - x, y1 + s * dy - y)
+                k = int(np.argmin(d))
+                if d[k] <= bestD:
+                    best, bestD = int(j[k]), float(d[k])
+            if best >= 0 and bestD <= r * self.cellSize:
+                break
+        return best
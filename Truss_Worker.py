@@ -0,0 +1,138 @@
+import os
+from PyQt5 import QtCore as qtc
+
+from Truss_Binary import BINARY_EXTENSION
+from Truss_Model import TrussModel
+
+
+class ImportCancelled(Exception):
+    """
+    Raised inside an ImportWorker when cancel() was called.
+    """
+
+
+class ImportSignals(qtc.QObject):
+    """
+    Signals of an ImportWorker. They are emitted from the pool thread and
+    delivered to slots on the GUI thread through queued connections.
+     - progress(percent, stage)
+     - finished(TrussModel) : the parsed and solved model
+     - failed(message)
+     - cancelled()
+    """
+    progress = qtc.pyqtSignal(int, str)
+    finished = qtc.pyqtSignal(object)
+    failed = qtc.pyqtSignal(str)
+    cancelled = qtc.pyqtSignal()
+
+
+class ImportWorker(qtc.QRunnable):
+    """
+    Loads a truss file on a QThreadPool thread: a text file is parsed and
+    solved (or taken from the model cache), a binary file is memory-mapped.
+    The model is built entirely off the GUI thread and handed over in the
+    finished signal, so only drawing and the report run on the GUI thread.
+    Cancellation is checked while parsing and between the solve stages.
+    """
+
+    # Emit parse progress about every this many characters read
+    progressChars = 1 << 20
+
+    def __init__(self, filename, cache=None):
+        """
+        Parameters:
+        -----------
+        filename : str
+            A text input file or a binary (BINARY_EXTENSION) model.
+        cache : TrussCache, optional
+            Cache to look text files up in and store their results to.
+        """
+        super().__init__()
+        self.filename = filename
+        self.cache = cache
+        self.signals = ImportSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Asks the worker to stop at its next check. Safe to call from any thread.
+        """
+        self._cancelled = True
+
+    def checkCancelled(self):
+        if self._cancelled:
+            raise ImportCancelled()
+
+    def run(self):
+        try:
+            truss = self.load()
+            self.checkCancelled()
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as err:
+            self.signals.failed.emit(str(err))
+        else:
+            self.signals.finished.emit(truss)
+
+    def load(self):
+        """
+        Does the work of run(), emitting progress as it goes.
+
+        Returns:
+        --------
+        TrussModel
+        """
+        emit = self.signals.progress.emit
+        if self.filename.lower().endswith(BINARY_EXTENSION):
+            emit(0, "Loading")
+            return TrussModel.loadBinary(self.filename)
+
+        key = None
+        if self.cache is not None:
+            emit(0, "Checking cache")
+            key = self.cache.keyForFile(self.filename)
+            cached = self.cache.get(key)
+            if cached is not None:
+                try:
+                    return TrussModel.loadBinary(cached)
+                except (OSError, ValueError, KeyError):
+                    pass  # unreadable entry; parse the file and overwrite it
+
+        self.checkCancelled()
+        total = max(os.path.getsize(self.filename), 1)
+        with open(self.filename, 'r') as f:
+            truss = TrussModel.fromFile(self.readLines(f, total))
+
+        emit(60, "Computing link values")
+        self.checkCancelled()
+        truss.calcLinkVals()
+        emit(65, "Computing support reactions")
+        self.checkCancelled()
+        truss.calcSupportReactions()
+        emit(70, "Solving member forces")
+        self.checkCancelled()
+        truss.calcMemberForcesSafe()
+
+        if key is not None:
+            emit(95, "Caching")
+            self.checkCancelled()
+            try:
+                self.cache.put(key, truss)
+            except OSError:
+                pass  # caching is best effort; the model is already loaded
+        return truss
+
+    def readLines(self, f, total):
+        """
+        Passes the lines of f through, emitting parse progress (0-60%) and
+        checking for cancellation every progressChars characters.
+        """
+        done = 0
+        nextReport = self.progressChars
+        for line in f:
+            done += len(line)
+            if done >= nextReport:
+                self.checkCancelled()
+                self.signals.progress.emit(min(int(60 * done / total), 60), "Parsing")
+                nextReport += self.progressChars
+            yield line